@@ -26,36 +26,41 @@ from __future__ import print_function
 
 import collections
 import configparser
+import importlib
 import inspect
 import os
 import sys
 from collections import OrderedDict
-from textwrap import dedent
 
 import fire
 import six
-from jinja2 import Environment
-
-import hpecp
-from hpecp import ContainerPlatformClient
-from hpecp.cli.catalog import CatalogProxy
-from hpecp.cli.config import ConfigProxy
-from hpecp.cli.datatap import DatatapProxy
-from hpecp.cli.epicworker import EpicWorkerProxy
-from hpecp.cli.gateway import GatewayProxy
-from hpecp.cli.httpclient import HttpClientProxy
-from hpecp.cli.install import InstallProxy
-from hpecp.cli.k8scluster import K8sClusterProxy
-from hpecp.cli.k8sworker import K8sWorkerProxy
-from hpecp.cli.license import LicenseProxy
-from hpecp.cli.lock import LockProxy
-from hpecp.cli.role import RoleProxy
-from hpecp.cli.tenant import TenantProxy
-from hpecp.cli.user import UserProxy
+
+# The proxy modules (and their dependencies) are only imported when their
+# command is used, see CLI.__getattr__
+PROXIES = OrderedDict(
+    [
+        ("catalog", ("hpecp.cli.catalog", "CatalogProxy")),
+        ("config", ("hpecp.cli.config", "ConfigProxy")),
+        ("install", ("hpecp.cli.install", "InstallProxy")),
+        ("epicworker", ("hpecp.cli.epicworker", "EpicWorkerProxy")),
+        ("k8sworker", ("hpecp.cli.k8sworker", "K8sWorkerProxy")),
+        ("k8scluster", ("hpecp.cli.k8scluster", "K8sClusterProxy")),
+        ("tenant", ("hpecp.cli.tenant", "TenantProxy")),
+        ("gateway", ("hpecp.cli.gateway", "GatewayProxy")),
+        ("lock", ("hpecp.cli.lock", "LockProxy")),
+        ("license", ("hpecp.cli.license", "LicenseProxy")),
+        ("httpclient", ("hpecp.cli.httpclient", "HttpClientProxy")),
+        ("user", ("hpecp.cli.user", "UserProxy")),
+        ("role", ("hpecp.cli.role", "RoleProxy")),
+        ("datatap", ("hpecp.cli.datatap", "DatatapProxy")),
+    ]
+)
 
 
 def configure_cli():
     """Configure the CLI."""
+    from hpecp import ContainerPlatformClient
+
     controller_api_host = None
     controller_api_port = None
     controller_use_ssl = None
@@ -139,11 +144,13 @@ class AutoComplete:
     Example Usage:
 
     hpecp autocomplete bash > hpecp-bash.sh && source hpecp-bash.sh
+    hpecp autocomplete zsh > hpecp-zsh.sh && source hpecp-zsh.sh
+    hpecp autocomplete fish > hpecp.fish && source hpecp.fish
     """
 
     def __dir__(self):
         """Return the CLI method names."""
-        return ["bash"]
+        return ["bash", "zsh", "fish"]
 
     def __init__(self, cli):
         """Create AutoCompletion class instance.
@@ -160,11 +167,7 @@ class AutoComplete:
         modules = collections.OrderedDict()
         columns = collections.OrderedDict()
 
-        for module_name in self.cli.__dict__.keys():
-
-            # we manually define autocomplete for these methods
-            if module_name in ["autocomplete", "configure_cli", "version"]:
-                continue
+        for module_name in PROXIES:
 
             module = getattr(self.cli, module_name)
             function_names = dir(module)
@@ -207,190 +210,44 @@ class AutoComplete:
 
         return (modules, columns)
 
-    def bash(self):
-        """Create autocompletion script for bash."""
-        __bash_template = dedent(
-            """\
-            _hpecp_complete()
-                {
-                local cur prev BASE_LEVEL
-
-                COMPREPLY=()
-                cur=${COMP_WORDS[COMP_CWORD]}
-                prev=${COMP_WORDS[COMP_CWORD-1]}
-
-                MODULE=${COMP_WORDS[1]}
-
-                COMP_WORDS_AS_STRING=$(IFS=. ; echo "${COMP_WORDS[*]}")
-
-                # if last input was > for redirecting to a file
-                # perform file and directory autocompletion
-                if echo "${prev}" | grep -q '>'
-                then
-                    _filedir;
-                    return
-                fi
-
-
-
-                declare -A MODULE_COLUMNS=(
-                    {% for module_name in modules %}
-                        {% set column_names = " ".join(columns[module_name]) %}
-                        ['{{module_name}}']="{{column_names}}"
-                    {% endfor %}
-                )
-
-                {% raw %}
-                # list has uniform behaviour as it is implemented in base.BaseProxy
-                if [[ "${COMP_WORDS[2]}" == "list" ]];
-                then
-
-                    # if 'list' was the last word
-                    if [[ "${prev}" == "list" ]];
-                    then
-                        COMPREPLY=( $(compgen -W "--columns --query" -- $cur) )
-                        return
-                    fi
-
-
-
-                    # '--columns' was the last word and user is entering column names
-                    if [[ "${COMP_WORDS[3]}" == "--columns"* && ${#COMP_WORDS[@]} -le 5 ]];
-                    then
-                        declare -a COLUMNS=(${MODULE_COLUMNS[$MODULE]})
-
-                        local realcur prefix
-                        realcur=${cur##*,} # everything after the last comma, e.g. a,b,c,d -> d
-                        prefix=${cur%,*}   # everything before the lat comma, e.g. a,b,c,d -> a,b,c
-
-                        if [[ "$cur" == *,* ]];
-                        then
-                            IFS=',' ENTERED_COLUMNS_LIST=($prefix)
-                            unset IFS
-                        else
-                            IFS=',' ENTERED_COLUMNS_LIST=($prev)
-                            unset IFS
-                        fi
-
-                        for COLUMN in ${COLUMNS[@]}; do
-                            for ENTERED_COLUMN in ${ENTERED_COLUMNS_LIST[@]}; do
-                                if [[ "${ENTERED_COLUMN}" == "${COLUMN}" ]]
-                                then
-                                    # remove columns already entered by user
-                                    COLUMNS=(${COLUMNS[*]//$ENTERED_COLUMN/})
-                                fi
-                            done
-                        done
-
-                        if [[ "$cur" == *,* ]];
-                        then
-                            COMPREPLY=( $(compgen -W "${COLUMNS[*]}" -P "${prefix}," -S "," -- ${realcur}) )
-                            compopt -o nospace
-                            return
-                        else
-                            COMPREPLY=( $(compgen -W "${COLUMNS[*]}" -S "," -- ${realcur}) )
-                            compopt -o nospace
-                            return
-                        fi
-                    fi
-
-                    # user has finished entering column list or query
-                    if [[ ${#COMP_WORDS[@]} == 6 ]];
-                    then
-                        COMPREPLY=( $(compgen -W "--output" -- $cur) )
-                        return
-                    fi
-
-                    if [[ "${COMP_WORDS[5]}" == "--output"*  ]];
-                    then
-                        if [[ "${COMP_WORDS[3]}" == "--columns"*  ]];
-                        then
-                            COMPREPLY=( $(compgen -W "table text" -- $cur) )
-                            return
-                        else
-                            COMPREPLY=( $(compgen -W "json json-pp text" -- $cur) )
-                            return
-                        fi
-                    fi
-
-                    return
-                fi
-                {% endraw %}
-
-                # if the last parameter was --*file perform
-                # file and directory autocompletion
-                if echo "${prev}" | grep -q '\-\-.*file$'
-                then
-                    _filedir;
-                    return
-                fi
-
-                # if last input was > for redirecting to a file
-                # perform file and directory autocompletion
-                if echo "${prev}" | grep -q '>'
-                then
-                    _filedir;
-                    return
-                fi
-
-                case "$COMP_WORDS_AS_STRING" in
-
-                {% set module_names = " ".join(modules.keys()) %}
-                {% for module_name in modules %}
-                    {% set function_names = " ".join(modules[module_name].keys()).replace('_', '-') %}
-                    {% for function_name in modules[module_name] %}
-                        {% set param_names = " ".join(modules[module_name][function_name]).replace('_', '-') %}
-                        {% if function_name == "list" %}
-                            # do nothing - already handled above
-                        {% else %}
-                    *"hpecp.{{module_name}}.{{function_name.replace('_', '-')}}."*)
-                        PARAM_NAMES="{{param_names}}"
-                        for PARAM in ${PARAM_NAMES[@]}; do
-                            PARAM="${PARAM//'\'}"
-                            for WORD in ${COMP_WORDS[@]}; do
-                                if [[ "${WORD}" == "${PARAM}" ]]
-                                then
-                                    # remove parameters already entered by user
-                                    PARAM_NAMES=${PARAM_NAMES//$WORD/}
-                                fi
-                            done
-                        done
-                        COMPREPLY=( $(compgen -W "$PARAM_NAMES" -- $cur) )
-                        ;;
-                        {% endif %}
-                    {% endfor %}
-                    *"hpecp.{{module_name}}"*)
-                        COMPREPLY=( $(compgen -W "{{function_names}}" -- $cur) )
-                        ;;
-                {% endfor %}
-                    *"hpecp.autocomplete.bash"*)
-                        COMPREPLY=( )
-                        ;;
-                    *"hpecp.autocomplete"*)
-                        COMPREPLY=( $(compgen -W "bash" -- $cur) )
-                        ;;
-                    *"hpecp"*)
-                        COMPREPLY=( $(compgen -W "autocomplete configure-cli version {{module_names}}" -- $cur) )
-                        ;;
-                esac
-                return 0
-            } &&
-            complete -F _hpecp_complete hpecp
-        """  # noqa: E501,W605
+    def _script_metadata(self, refresh):
+        from hpecp import __version__
+        from hpecp.cli.completion import build_metadata, load_metadata
+
+        return load_metadata(
+            __version__,
+            lambda: build_metadata(*self._get_metadata()),
+            refresh=refresh,
         )
 
-        (modules, columns) = self._get_metadata()
+    def bash(self, refresh=False):
+        """Create autocompletion script for bash (4+).
 
-        print(
-            Environment(trim_blocks=True, lstrip_blocks=True)
-            .from_string(__bash_template)
-            .render(modules=modules, columns=columns),
-            file=sys.stdout,
-        )
+        The command metadata is cached per hpecp version, see
+        HPECP_COMPLETION_CACHE_DIR, use `--refresh` to rebuild it.
+        """
+        from hpecp.cli.completion import bash_script
+
+        print(bash_script(self._script_metadata(refresh)), file=sys.stdout)
+
+    def zsh(self, refresh=False):
+        """Create autocompletion script for zsh, see `bash`."""
+        from hpecp.cli.completion import zsh_script
+
+        print(zsh_script(self._script_metadata(refresh)), file=sys.stdout)
+
+    def fish(self, refresh=False):
+        """Create autocompletion script for fish, see `bash`."""
+        from hpecp.cli.completion import fish_script
+
+        print(fish_script(self._script_metadata(refresh)), file=sys.stdout)
 
 
 def version(debug=False):
     """Display version information."""
+    import hpecp
+    from hpecp import ContainerPlatformClient
+
     print("HPECP Version:   " + ContainerPlatformClient.version())
 
     if debug:
@@ -405,32 +262,75 @@ def version(debug=False):
         print("System Path:     " + os.environ.get("PATH", ""))
 
 
+def batch(file="-", parallel=1):
+    """Run many hpecp commands in one process with one login.
+
+    Each line of the file is a command, e.g.
+    `k8sworker get /api/v2/worker/k8shost/5 --output json`, or json: a list
+    of arguments or an object with an `args` list.  Blank lines and lines
+    starting with '#' are skipped.  One json result is printed per command
+    with the input `line` number, `args`, `exit_code`, `stdout` and
+    `stderr`.
+
+    :param file: the file with the commands, by default '-' (stdin)
+    :param parallel: how many commands to run at the same time, by
+        default 1.  Results are printed as the commands complete.
+    """
+    from hpecp.cli.batch import run_batch
+
+    if file == "-":
+        failed = run_batch(CLI, sys.stdin, parallel)
+    else:
+        with open(file) as lines:
+            failed = run_batch(CLI, lines, parallel)
+
+    if failed:
+        sys.exit(1)
+
+
+def shell():
+    """Run hpecp commands interactively with one login.
+
+    Commands are entered without the leading `hpecp`, e.g.
+    `k8sworker list --output text`.  Tab completes commands, parameters
+    and column names.
+    """
+    from hpecp.cli.shell import Shell
+
+    Shell(CLI()).cmdloop()
+
+
 class CLI(object):
     """Command Line Interface for the HPE Container Platform."""
 
     def __dir__(self):
         """Return modules names."""
-        return list(vars(self))
+        return [
+            "autocomplete",
+            "batch",
+            "configure_cli",
+            "shell",
+            "version",
+        ] + list(PROXIES)
 
     def __init__(self):
         """Create a CLI instance."""
         self.autocomplete = AutoComplete(self)
         self.configure_cli = configure_cli
-        self.catalog = CatalogProxy()
-        self.config = ConfigProxy()
-        self.install = InstallProxy()
-        self.epicworker = EpicWorkerProxy()
-        self.k8sworker = K8sWorkerProxy()
-        self.k8scluster = K8sClusterProxy()
-        self.tenant = TenantProxy()
-        self.gateway = GatewayProxy()
-        self.lock = LockProxy()
-        self.license = LicenseProxy()
-        self.httpclient = HttpClientProxy()
-        self.user = UserProxy()
-        self.role = RoleProxy()
         self.version = version
-        self.datatap = DatatapProxy()
+        self.batch = batch
+        self.shell = shell
+
+    def __getattr__(self, name):
+        """Import and create a proxy the first time it is used."""
+        if name not in PROXIES:
+            raise AttributeError(
+                "'CLI' object has no attribute '{}'".format(name)
+            )
+        module_name, class_name = PROXIES[name]
+        proxy = getattr(importlib.import_module(module_name), class_name)()
+        setattr(self, name, proxy)
+        return proxy
 
 
 if __name__ == "__main__":
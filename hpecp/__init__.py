@@ -26,6 +26,8 @@
 
 from __future__ import absolute_import
 
+import sys
+
 from .client import ContainerPlatformClient
 from .exceptions import (
     APIException,
@@ -34,5 +36,21 @@ from .exceptions import (
     ContainerPlatformClientException,
 )
 from .logger import Logger
+from .retry import RetryPolicy
+from .wait import WaitPolicy
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        # asyncio is slow to import, only import the async client when it
+        # is used.  The async client requires python 3.7+
+        if name == "AsyncContainerPlatformClient":
+            from . import async_client
+
+            return async_client.AsyncContainerPlatformClient
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+
 
 __version__ = "0.22.13"
@@ -0,0 +1,638 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""asyncio interface to the HPE Container Platform API.
+
+This module requires python 3.7 or later, the rest of the library still
+supports the python versions listed in setup.py.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import functools
+import inspect
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .async_http import AsyncHTTPConnectionPool
+from .base_resource import AbstractResourceController, ResourceList
+from .client import ContainerPlatformClient
+from .exceptions import (
+    APIException,
+    APIItemNotFoundException,
+    APIUnauthorizedException,
+    APIUnknownException,
+)
+from .k8s_cluster import K8sClusterController
+from .k8s_worker import K8sWorkerController
+from .logger import Logger
+from .wait import WaitPolicy
+
+_log = Logger.get_logger()
+
+# The controller methods that the asyncio client implements without a
+# thread.  A controller that overrides one of these methods with other
+# behaviour, e.g. the gateway controller's list() that uses the shared
+# worker inventory, falls back to running its method on a thread.
+_NATIVE = {
+    "get": (
+        AbstractResourceController.get,
+        # only add the setup_log query parameter
+        K8sClusterController.get,
+        K8sWorkerController.get,
+    ),
+    "list": (AbstractResourceController.list,),
+    "delete": (AbstractResourceController.delete,),
+}
+
+
+class AsyncController(object):
+    """Awaitable view of a controller of a ContainerPlatformClient.
+
+    Every public method of the wrapped controller is available as a
+    coroutine with the same parameters and return value, which runs the
+    synchronous method on a worker thread.  Attributes are returned
+    unchanged.  Generator methods such as `iter_list` are not available.
+
+    This is used for the controllers that are not resource controllers,
+    e.g. `config`, `install`, `license` and `lock`.  See
+    :py:class:`AsyncResourceController` for the resource controllers.
+
+    Example
+    -------
+    >>> config = await client.config.get()
+    """
+
+    def __init__(self, async_client, controller):
+        """Create an AsyncController instance.
+
+        Parameters
+        ----------
+        async_client : AsyncContainerPlatformClient
+            The client that runs the requests
+        controller : object
+            The controller of the underlying ContainerPlatformClient
+        """
+        self._async_client = async_client
+        self._controller = controller
+
+    def __getattr__(self, name):
+        """Return a coroutine function wrapping the controller method."""
+        attr = getattr(self._controller, name)
+        if name.startswith("_") or not inspect.ismethod(attr):
+            return attr
+        if inspect.isgeneratorfunction(attr):
+            raise AttributeError(
+                "'{}' is a generator and is not available on the asyncio "
+                "client".format(name)
+            )
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._async_client._run(attr, *args, **kwargs)
+
+        return method
+
+    def __dir__(self):
+        """Return the controller attribute names."""
+        return [
+            name
+            for name in dir(self._controller)
+            if not inspect.isgeneratorfunction(
+                getattr(type(self._controller), name, None)
+            )
+        ]
+
+
+class AsyncResourceController(AsyncController):
+    """Awaitable view of a resource controller of a ContainerPlatformClient.
+
+    Every public method of the wrapped controller is available as a
+    coroutine with the same parameters and return value, so the existing
+    resource classes (e.g. `K8sCluster`, `WorkerK8s`, `Gateway`) are used to
+    parse the responses.  Attributes such as `resource_class` and
+    `status_class` are returned unchanged.
+
+    `get`, `list`, `delete`, `get_many`, `wait_for_status`,
+    `wait_for_state` and `wait_for_status_many` send their requests on the
+    event loop.  The other methods, e.g. `create` and `set_storage`, are
+    infrequent and run the synchronous method on a worker thread, as do
+    `get`, `list` and `delete` if the controller overrides them.
+    Generator methods such as `iter_list` are not available.
+
+    Example
+    -------
+    >>> clusters = await client.k8s_cluster.list()
+    >>> cluster = await client.k8s_cluster.get("/api/v2/k8scluster/1")
+    """
+
+    def _is_native(self, name):
+        return getattr(type(self._controller), name, None) in _NATIVE[name]
+
+    async def get(self, *args, **kwargs):
+        """Retrieve a resource, see the controller's get()."""
+        controller = self._controller
+        # the base get() has no setup_log, let it reject the arguments
+        if not self._is_native("get") or (
+            type(controller).get is AbstractResourceController.get
+            and (kwargs or len(args) > 2)
+        ):
+            return await self._async_client._run(
+                controller.get, *args, **kwargs
+            )
+        return await self._get(*args, **kwargs)
+
+    async def _get(self, id, params=None, setup_log=False):
+        controller = self._controller
+        params = dict(params or {})
+        if setup_log is True:
+            params["setup_log"] = "true"
+
+        response = await self._async_client._request(
+            url=controller._get_url(id, params),
+            http_method="get",
+            description=controller.__class__.__name__ + "/get",
+        )
+        return controller.resource_class(response.json())
+
+    async def get_many(self, ids, max_workers=None, params={}):
+        """Retrieve several resources concurrently.
+
+        See :py:meth:`.base_resource.AbstractResourceController.get_many`,
+        `max_workers` limits the requests in flight, by default the
+        client's `max_concurrency`.
+        """
+        assert isinstance(ids, list), "'ids' must be a list"
+        assert max_workers is None or (
+            isinstance(max_workers, int) and max_workers > 0
+        ), "'max_workers' must be an int > 0"
+        semaphore = asyncio.Semaphore(
+            max_workers or self._async_client.max_concurrency
+        )
+
+        async def get(id):
+            async with semaphore:
+                try:
+                    if params:
+                        return id, await self.get(id, params), None
+                    else:
+                        return id, await self.get(id), None
+                except APIException as e:
+                    return id, None, e
+
+        results = await asyncio.gather(*[get(id) for id in ids])
+        errors = OrderedDict(
+            (id, error) for id, _, error in results if error is not None
+        )
+        return ResourceList(
+            self._controller.resource_class,
+            [resource.json for _, resource, error in results if error is None],
+            errors=errors,
+        )
+
+    async def list(self, *args, **kwargs):
+        """Retrieve the resources, see the controller's list()."""
+        if not self._is_native("list"):
+            return await self._async_client._run(
+                self._controller.list, *args, **kwargs
+            )
+        return await self._list(*args, **kwargs)
+
+    async def _list(self, filters=None, fields=None, compact=False):
+        controller = self._controller
+        filters = controller._check_list_args(filters, fields)
+        url, filters = controller._list_url(filters)
+        response = await self._async_client._request(
+            url=url,
+            http_method="get",
+            description=controller.__class__.__name__ + "/list",
+        )
+        return controller._list_result(
+            response.json()["_embedded"][controller.resource_list_path],
+            filters,
+            fields,
+            compact,
+        )
+
+    async def delete(self, *args, **kwargs):
+        """Delete a resource, see the controller's delete()."""
+        if not self._is_native("delete"):
+            return await self._async_client._run(
+                self._controller.delete, *args, **kwargs
+            )
+        await self._delete(*args, **kwargs)
+
+    async def _delete(self, id):
+        controller = self._controller
+        await self._async_client._request(
+            url=controller._get_url(id, None),
+            http_method="delete",
+            description=controller.__class__.__name__ + "/delete",
+        )
+        controller.store.invalidate()
+
+    async def wait_for_status(
+        self,
+        id,
+        status=[],
+        timeout_secs=1200,
+        wait_policy=None,
+        poll_interval_secs=None,
+    ):
+        """Wait for a resource to have one of the `status` values.
+
+        This is the asyncio equivalent of
+        :py:meth:`.base_resource.AbstractWaitableResourceController.wait_for_status`,
+        waiting between polls does not block the event loop.
+
+        Parameters
+        ----------
+        id: str
+            The resource ID - format: '/resource/path/[0-9]+'
+        status: list[:py:method:`status_class`]
+            Status(es) to wait for.  Use an empty array if you want to
+            wait for the resource existence to cease.
+        timeout_secs: int
+            How long to wait for the status(es) before giving up.
+        wait_policy: WaitPolicy, optional
+            By default the client's `wait_policy`
+        poll_interval_secs: int, optional
+            Poll at a fixed interval instead of using `wait_policy`
+
+        Returns
+        -------
+        WaitResult
+            Truthy if status was found before timeout, or if the item
+            does not exist before timeout and status is empty.
+        """  # noqa: E501
+        controller = self._controller
+        controller._check_wait_args(status, timeout_secs)
+
+        if poll_interval_secs is not None:
+            wait_policy = WaitPolicy.fixed(poll_interval_secs)
+        waiter = controller._status_waiter(status, timeout_secs, wait_policy)
+
+        while True:
+            try:
+                resource = await self.get(id)
+            except APIItemNotFoundException:
+                if len(status) > 0:
+                    raise
+                resource = None
+
+            result = waiter.observe(resource)
+            if result is not None:
+                _log.debug("Waiting for item {}: {}".format(id, result))
+                return result
+
+            await asyncio.sleep(waiter.next_interval_secs())
+
+    async def wait_for_state(
+        self,
+        id,
+        states=[],
+        timeout_secs=1200,
+        wait_policy=None,
+        poll_interval_secs=None,
+    ):
+        """See wait_for_status()."""
+        return await self.wait_for_status(
+            id, states, timeout_secs, wait_policy, poll_interval_secs
+        )
+
+    async def wait_for_status_many(
+        self,
+        ids,
+        status=[],
+        timeout_secs=1200,
+        fail_fast=False,
+        wait_policy=None,
+        on_done=None,
+    ):
+        """Wait for several resources to reach their wanted status.
+
+        This is the asyncio equivalent of
+        :py:meth:`.base_resource.AbstractWaitableResourceController.wait_for_status_many`.
+        """  # noqa: E501
+        controller = self._controller
+        targets, wait_policy = controller._check_wait_many_args(
+            ids, status, timeout_secs, wait_policy
+        )
+        waiters = OrderedDict(
+            (
+                id,
+                controller._status_waiter(
+                    id_status, timeout_secs, wait_policy
+                ),
+            )
+            for id, id_status in targets.items()
+        )
+        results = {}
+
+        tick = 0
+        while waiters:
+            resources = {r.id: r for r in await self.list()}
+            controller._observe_many(
+                waiters, resources, results, fail_fast, on_done
+            )
+            if not waiters:
+                break
+
+            remaining = (
+                timeout_secs - next(iter(waiters.values())).elapsed_secs()
+            )
+            await asyncio.sleep(
+                max(0, min(wait_policy.interval_secs(tick), remaining))
+            )
+            tick += 1
+
+        return OrderedDict((id, results[id]) for id in targets)
+
+
+class AsyncContainerPlatformClient(object):
+    """asyncio client object for HPE Container Platform.
+
+    The client has the same controllers as
+    :py:class:`.client.ContainerPlatformClient` (`k8s_cluster`,
+    `k8s_worker`, `gateway`, `tenant`, ...) but every method is a coroutine.
+
+    Requests are sent by an :py:class:`.async_http.AsyncHTTPConnectionPool`
+    on the event loop, so a request in flight does not hold a thread.  Any
+    number of requests can be awaited at the same time, at most
+    `max_concurrency` are sent to the controller at once, one per pooled
+    connection, and the rest are queued.  See
+    :py:class:`AsyncResourceController` for the few methods that still run
+    on a thread.
+
+    The session, retry policy, wait policy and response cache of `client`
+    are shared with the asyncio client.
+
+    Requires python 3.7 or later.
+
+    Parameters
+    ----------
+    client : ContainerPlatformClient
+        The client used to build requests and parse responses
+    max_concurrency : int, optional
+        Maximum in-flight requests, by default the client `pool_maxsize`
+
+    Example
+    -------
+    >>> async with AsyncContainerPlatformClient.create_from_config_file(
+    ...     max_concurrency=50
+    ... ) as client:
+    ...     await client.create_session()
+    ...     workers = await client.k8s_worker.list()
+    ...     details = await asyncio.gather(
+    ...         *[client.k8s_worker.get(w.id) for w in workers]
+    ...     )
+    """
+
+    @classmethod
+    def create_from_config_file(
+        cls, config_file="~/.hpecp.conf", profile=None, max_concurrency=None
+    ):
+        """Create a client from a configuration file.
+
+        See :py:meth:`.client.ContainerPlatformClient.create_from_config_file`
+        """
+        return cls(
+            ContainerPlatformClient.create_from_config_file(
+                config_file, profile
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    @classmethod
+    def create_from_env(cls, max_concurrency=None):
+        """Create a client from environment variables.
+
+        See :py:meth:`.client.ContainerPlatformClient.create_from_env`
+        """
+        return cls(
+            ContainerPlatformClient.create_from_env(),
+            max_concurrency=max_concurrency,
+        )
+
+    def __init__(self, client, max_concurrency=None):
+        """Create an AsyncContainerPlatformClient instance.
+
+        See the class docs for the parameters.
+        """
+        assert isinstance(
+            client, ContainerPlatformClient
+        ), "'client' parameter must be of type ContainerPlatformClient"
+
+        if max_concurrency is None:
+            max_concurrency = client.pool_maxsize
+        assert (
+            isinstance(max_concurrency, int) and max_concurrency > 0
+        ), "'max_concurrency' parameter must be an int > 0"
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.pool = AsyncHTTPConnectionPool(
+            client.base_url,
+            maxsize=max_concurrency,
+            verify_ssl=client.verify_ssl,
+            keep_alive=client.keep_alive,
+        )
+        # only created if a method without an asyncio implementation is
+        # called
+        self._executor = None
+
+        for name in [
+            "catalog",
+            "config",
+            "datatap",
+            "epic_worker",
+            "gateway",
+            "install",
+            "k8s_cluster",
+            "k8s_worker",
+            "license",
+            "lock",
+            "role",
+            "tenant",
+            "user",
+        ]:
+            controller = getattr(client, name)
+            if isinstance(controller, AbstractResourceController):
+                async_controller = AsyncResourceController(self, controller)
+            else:
+                async_controller = AsyncController(self, controller)
+            setattr(self, name, async_controller)
+
+    async def _run(self, function, *args, **kwargs):
+        """Run a synchronous client method on a worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.client.pool_maxsize
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    @property
+    def log(self):
+        """Retrieve a reference to the client logger."""
+        return self.client.log
+
+    async def create_session(self):
+        """Create a session with the HPE CP controller.
+
+        See :py:meth:`.client.ContainerPlatformClient.create_session`
+        """
+        client = self.client
+        url, auth = client._login_request()
+
+        response = None
+        try:
+            response = await self.pool.request(
+                "POST",
+                url,
+                {
+                    "accept": "application/json",
+                    "content-type": "application/json",
+                },
+                json.dumps(auth).encode("utf-8"),
+                timeout_secs=10,
+            )
+            response.raise_for_status()
+        except requests.exceptions.ConnectionError as e:
+            client._raise_login_connection_error(url, e)
+        except requests.exceptions.RequestException as e:
+            if response is not None:
+                client.log.error("Auth Response: " + response.text)
+            else:
+                client.log.error(e)
+            raise
+
+        client._session_created(response)
+        return self
+
+    async def _request(
+        self,
+        url,
+        http_method="get",
+        data={},
+        description="",
+        create_auth_headers=True,
+        additional_headers={},
+    ):
+        """Make HTTP requests to the API host.
+
+        The asyncio equivalent of
+        :py:meth:`.client.ContainerPlatformClient._request`, with the same
+        retries and re-authentication.
+        """
+        client = self.client
+        policy = client.retry_policy
+        policy.deposit()
+        client.retry_stats._record("requests")
+
+        retry_number = 0
+        reauthenticated = False
+        while True:
+            try:
+                return await self._do_request(
+                    url,
+                    http_method,
+                    data,
+                    description,
+                    create_auth_headers,
+                    additional_headers,
+                )
+            except APIUnauthorizedException:
+                if not client._can_reauthenticate(
+                    create_auth_headers, reauthenticated
+                ):
+                    raise
+                reauthenticated = True
+                await self.create_session()
+            except APIUnknownException as e:
+                wait_secs = client._retry_wait_secs(
+                    e, http_method, url, retry_number
+                )
+                if wait_secs is None:
+                    raise
+                retry_number += 1
+                await asyncio.sleep(wait_secs)
+
+    async def _do_request(
+        self,
+        url,
+        http_method,
+        data,
+        description,
+        create_auth_headers,
+        additional_headers,
+    ):
+        client = self.client
+        request = client._prepare_request(
+            url,
+            http_method,
+            data,
+            description,
+            create_auth_headers,
+            additional_headers,
+            stream=False,
+        )
+        client._log_request(request)
+
+        body = None
+        if http_method in ("put", "post"):
+            body = request.payload.encode("utf-8")
+
+        response = None
+        try:
+            response = await self.pool.request(
+                http_method.upper(), request.url, request.headers, body
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as re:
+            client._raise_api_exception(request, response, re)
+
+        return client._handle_response(request, response)
+
+    async def close(self):
+        """Close the pooled connections.
+
+        Waits for the controller methods running on a thread to finish.
+        """
+        await self.pool.close()
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+        self.client.close()
+
+    async def __aenter__(self):
+        """Return the client for use in an `async with` statement."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the client."""
+        await self.close()
@@ -0,0 +1,447 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""asyncio HTTP/1.1 connection pool used by the asyncio client.
+
+This module requires python 3.7 or later.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import base64
+import os
+import ssl
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import (
+    DEFAULT_CA_BUNDLE_PATH,
+    get_auth_from_url,
+    get_encoding_from_headers,
+    get_environ_proxies,
+    select_proxy,
+)
+
+from .logger import Logger
+
+_log = Logger.get_logger()
+
+# responses to these requests never have a body
+_NO_BODY_STATUS = (204, 304)
+
+# the requests that can be sent again if a reused connection turns out to
+# be closed, the others may already have been processed
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE")
+
+
+class AsyncHTTPConnectionPool(object):
+    """Keep-alive HTTP/1.1 connections to one host.
+
+    At most `maxsize` requests are sent at once, one per connection, the
+    other requests wait for a connection to become free.  Waiting requests
+    are coroutines, not threads, so thousands of requests can be awaited
+    at the same time.
+
+    Responses are returned as `requests.Response` objects, and errors are
+    raised as `requests.exceptions.RequestException`, so they are handled
+    in the same way as the responses of the synchronous client.
+
+    Like a `requests.Session`, the pool uses the proxy of the
+    HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY environment variables,
+    and verifies the server certificate with the REQUESTS_CA_BUNDLE or
+    CURL_CA_BUNDLE bundle if set, otherwise with the bundle of requests.
+    Only http:// proxies are supported, https urls are tunnelled through
+    them with CONNECT.
+
+    The pool must only be used from one event loop.
+
+    Parameters
+    ----------
+    base_url : str
+        The scheme, host and port, e.g. 'https://127.0.0.1:8080'
+    maxsize : int, optional
+        Maximum number of connections, by default 10
+    verify_ssl : bool or str, optional
+        Verify the server certificate, or the path of a CA bundle to
+        verify it with, by default True
+    keep_alive : bool, optional
+        Reuse connections between requests, by default True
+    timeout_secs : float, optional
+        Timeout of each request, by default None which waits forever
+    trust_env : bool, optional
+        Use the proxy and CA bundle environment variables, by default True
+    """
+
+    def __init__(
+        self,
+        base_url,
+        maxsize=10,
+        verify_ssl=True,
+        keep_alive=True,
+        timeout_secs=None,
+        trust_env=True,
+    ):
+        """Create an AsyncHTTPConnectionPool - see the class docs."""
+        assert (
+            isinstance(maxsize, int) and maxsize > 0
+        ), "'maxsize' must be an int > 0"
+
+        parts = urlsplit(base_url)
+        assert parts.scheme in (
+            "http",
+            "https",
+        ), "'base_url' must be a http or https url"
+
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.maxsize = maxsize
+        self.keep_alive = keep_alive
+        self.timeout_secs = timeout_secs
+
+        self._ssl = None
+        if parts.scheme == "https":
+            self._ssl = _ssl_context(verify_ssl, trust_env)
+
+        self._proxy = None
+        self._proxy_headers = {}
+        proxy = None
+        if trust_env:
+            proxy = select_proxy(base_url, get_environ_proxies(base_url))
+        if proxy:
+            proxy_parts = urlsplit(
+                proxy if "://" in proxy else "http://" + proxy
+            )
+            if proxy_parts.scheme != "http":
+                raise ValueError(
+                    "Unsupported proxy '{}', the asyncio client only "
+                    "supports http:// proxies".format(proxy)
+                )
+            self._proxy = (proxy_parts.hostname, proxy_parts.port or 80)
+            username, password = get_auth_from_url(proxy)
+            if username:
+                credentials = "{}:{}".format(username, password)
+                self._proxy_headers["Proxy-Authorization"] = "Basic " + (
+                    base64.b64encode(credentials.encode("latin-1")).decode()
+                )
+
+        self._idle = []
+        # created in the event loop on first use
+        self._semaphore = None
+        self.num_connections = 0
+        """The number of connections opened so far."""
+
+    async def request(
+        self, method, url, headers, body=None, timeout_secs=None
+    ):
+        """Send a request and read the response.
+
+        Parameters
+        ----------
+        method : str
+            e.g. 'GET'
+        url : str
+            The absolute url, the host must be the pool's host
+        headers : dict
+            The request headers
+        body : bytes, optional
+            The request body
+        timeout_secs : float, optional
+            By default the pool's `timeout_secs`
+
+        Returns
+        -------
+        requests.Response
+
+        Raises
+        ------
+        requests.exceptions.ConnectionError
+            If the controller could not be reached or closed the connection
+        requests.exceptions.Timeout
+            If the response was not received within the timeout
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.maxsize)
+        if timeout_secs is None:
+            timeout_secs = self.timeout_secs
+
+        async with self._semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self._request(method, url, headers, body), timeout_secs
+                )
+            except requests.exceptions.RequestException:
+                raise
+            except asyncio.TimeoutError:
+                raise requests.exceptions.Timeout(
+                    "{} {} timed out after {}s".format(
+                        method, url, timeout_secs
+                    )
+                )
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                raise requests.exceptions.ConnectionError(
+                    "{} {}: {}".format(method, url, e)
+                )
+
+    async def _request(self, method, url, headers, body):
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        if self._proxy is not None and self._ssl is None:
+            # a plain http request is sent to the proxy with the full url
+            target = "http://{}:{}{}".format(self.host, self.port, target)
+            headers = dict(headers, **self._proxy_headers)
+
+        lines = [
+            "{} {} HTTP/1.1".format(method.upper(), target),
+            "Host: {}:{}".format(self.host, self.port),
+            "Accept-Encoding: identity",
+            "Connection: {}".format(
+                "keep-alive" if self.keep_alive else "close"
+            ),
+        ]
+        for name, value in headers.items():
+            lines.append("{}: {}".format(name, value))
+        if body is not None:
+            lines.append("Content-Length: {}".format(len(body)))
+        data = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        if body is not None:
+            data += body
+
+        while True:
+            reader, writer, reused = await self._connection()
+            try:
+                writer.write(data)
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line:
+                    raise ConnectionError(
+                        "Connection closed by the controller"
+                    )
+            except ConnectionError:
+                writer.close()
+                if reused and method.upper() in _IDEMPOTENT_METHODS:
+                    # the controller closed the idle connection, e.g. after
+                    # its keep-alive timeout - retry on a new connection
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+
+            try:
+                response, reusable = await self._read_response(
+                    reader, method, url, status_line
+                )
+            except BaseException:
+                writer.close()
+                raise
+
+            if reusable and self.keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return response
+
+    async def _connection(self):
+        """Return (reader, writer, reused) for an idle or new connection."""
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+
+        if self._proxy is not None and self._ssl is not None:
+            reader, writer = await self._tunnel()
+        elif self._proxy is not None:
+            reader, writer = await asyncio.open_connection(*self._proxy)
+        elif self._ssl is not None:
+            reader, writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self._ssl, server_hostname=self.host
+            )
+        else:
+            reader, writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        self.num_connections += 1
+        _log.debug(
+            "AsyncHTTPConnectionPool: opened connection {} to {}:{}".format(
+                self.num_connections, self.host, self.port
+            )
+        )
+        return reader, writer, False
+
+    async def _tunnel(self):
+        """Open a CONNECT tunnel through the proxy and start TLS in it."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
+        # no StreamWriter for the proxy connection, closing it would also
+        # close the TLS connection
+        transport, _ = await loop.create_connection(
+            lambda: protocol, *self._proxy
+        )
+        try:
+            lines = [
+                "CONNECT {}:{} HTTP/1.1".format(self.host, self.port),
+                "Host: {}:{}".format(self.host, self.port),
+            ]
+            for name, value in self._proxy_headers.items():
+                lines.append("{}: {}".format(name, value))
+            transport.write(
+                ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+            )
+
+            _, status, reason = _parse_status_line(await reader.readline())
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n"):
+                    break
+                if not line:
+                    raise ConnectionError("Connection closed by the proxy")
+            if status != 200:
+                raise requests.exceptions.ProxyError(
+                    "Tunnel connection failed: {} {}".format(status, reason)
+                )
+
+            # the TLS transport gets a new stream pair, like
+            # StreamWriter.start_tls() of python 3.11
+            tls_reader = asyncio.StreamReader()
+            tls_protocol = asyncio.StreamReaderProtocol(tls_reader)
+            tls_transport = await loop.start_tls(
+                transport, tls_protocol, self._ssl, server_hostname=self.host
+            )
+        except BaseException:
+            transport.close()
+            raise
+        tls_protocol.connection_made(tls_transport)
+        return tls_reader, asyncio.StreamWriter(
+            tls_transport, tls_protocol, tls_reader, loop
+        )
+
+    async def _read_response(self, reader, method, url, status_line):
+        """Read the response, return (response, connection_reusable)."""
+        version, status, reason = _parse_status_line(status_line)
+
+        headers = CaseInsensitiveDict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise ConnectionError("Connection closed in the headers")
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip()
+            value = value.strip()
+            if name in headers:
+                headers[name] += ", " + value
+            else:
+                headers[name] = value
+
+        reusable = version == "HTTP/1.1" and (
+            headers.get("connection", "").lower() != "close"
+        )
+
+        if (
+            method.upper() == "HEAD"
+            or status in _NO_BODY_STATUS
+            or 100 <= status < 200
+        ):
+            content = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            content = await _read_chunked(reader)
+        elif "content-length" in headers:
+            content = await reader.readexactly(int(headers["content-length"]))
+        else:
+            # the body ends when the connection is closed
+            content = await reader.read()
+            reusable = False
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = headers
+        response.url = url
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = content
+        return response, reusable
+
+    async def close(self):
+        """Close the idle connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+
+def _ssl_context(verify_ssl, trust_env):
+    """Return the SSL context that verifies like requests."""
+    if not verify_ssl:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
+    if isinstance(verify_ssl, str):
+        bundle = verify_ssl
+    else:
+        bundle = (
+            trust_env
+            and (
+                os.environ.get("REQUESTS_CA_BUNDLE")
+                or os.environ.get("CURL_CA_BUNDLE")
+            )
+            or DEFAULT_CA_BUNDLE_PATH
+        )
+    if os.path.isdir(bundle):
+        return ssl.create_default_context(capath=bundle)
+    return ssl.create_default_context(cafile=bundle)
+
+
+def _parse_status_line(line):
+    """Return (version, status, reason) of e.g. 'HTTP/1.1 200 OK'."""
+    parts = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError("Invalid status line {!r}".format(line))
+    reason = parts[2] if len(parts) > 2 else ""
+    return parts[0], int(parts[1]), reason
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise ConnectionError("Connection closed in a chunked body")
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # skip the trailers
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
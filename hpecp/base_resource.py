@@ -20,19 +20,36 @@
 
 """Base classes for Controllers and Resources."""
 
+from __future__ import print_function
+
 import abc
+import operator
+import sys
+import threading
+import time
 import urllib
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
-import polling
 import six
 from tabulate import tabulate
 
-from hpecp.exceptions import APIItemNotFoundException
+from hpecp.exceptions import APIException, APIItemNotFoundException
 
+from .json_stream import iter_json_array
 from .logger import Logger
+from .resource_store import ResourceStore
+from .table import FAST_STYLES, render_lines
+from .wait import StatusWaiter, WaitPolicy
 
 _log = Logger.get_logger()
 
+# guards the lazy creation of the controllers' stores
+_store_lock = threading.Lock()
+
+# default for getattr() that cannot be a field value
+_MISSING = object()
+
 
 @six.add_metaclass(abc.ABCMeta)
 class AbstractResourceController:
@@ -144,6 +161,15 @@ class AbstractResourceController:
         APIItemNotFoundException
             The item with {id} was not found.
         """
+        response = self.client._request(
+            url=self._get_url(id, params),
+            http_method="get",
+            description=self.__class__.__name__ + "/get",
+        )
+        return self.resource_class(response.json())
+
+    def _get_url(self, id, params):
+        """Validate the get() arguments and return the resource url."""
         assert isinstance(id, str), "'id' must be provided and must be a str"
         assert id.startswith(
             self.base_resource_path
@@ -156,32 +182,320 @@ class AbstractResourceController:
                 p = "?" + urllib.parse.urlencode(params)
         else:
             p = ""
+        return "{}{}".format(id, p)
 
-        response = self.client._request(
-            url="{}{}".format(id, p),
-            http_method="get",
-            description=self.__class__.__name__ + "/get",
+    def get_many(self, ids, max_workers=None, params={}):
+        """Retrieve several Resources concurrently.
+
+        Parameters
+        ----------
+        ids : list[str]
+            The IDs with the format /resource/path/id
+        max_workers : int, optional
+            Maximum number of concurrent requests, by default the client
+            connection pool size (`pool_maxsize`)
+        params : dict, optional
+            API Parameters passed to each :py:meth:`get`.
+
+        Returns
+        -------
+        ResourceList
+            The resources in the same order as `ids`.  IDs that could not
+            be retrieved are left out of the list, the exception raised for
+            each of them is available in `ResourceList.errors` keyed by id.
+
+        Example
+        -------
+        >>> workers = client.k8s_worker.get_many(
+        ...     ["/api/v2/worker/k8shost/1", "/api/v2/worker/k8shost/2"]
+        ... )
+        >>> for id, error in workers.errors.items():
+        ...     print(id, error.message)
+        """
+        assert isinstance(ids, list), "'ids' must be a list"
+        if max_workers is None:
+            max_workers = self.client.pool_maxsize
+        assert (
+            isinstance(max_workers, int) and max_workers > 0
+        ), "'max_workers' must be an int > 0"
+
+        def get(id):
+            try:
+                if params:
+                    return id, self.get(id, params=params), None
+                else:
+                    return id, self.get(id), None
+            except APIException as e:
+                return id, None, e
+
+        if len(ids) == 0:
+            results = []
+        else:
+            pool = ThreadPool(min(max_workers, len(ids)))
+            try:
+                results = pool.map(get, ids)
+            finally:
+                pool.close()
+                pool.join()
+
+        errors = OrderedDict(
+            (id, error) for id, _, error in results if error is not None
         )
-        return self.resource_class(response.json())
+        return ResourceList(
+            self.resource_class,
+            [resource.json for _, resource, error in results if error is None],
+            errors=errors,
+        )
+
+    index_fields = []
+    """The fields that :py:attr:`store` indexes for :py:meth:`find_by`.
 
-    def list(self):
+    :type: list[str]
+    """
+
+    @property
+    def store(self):
+        """The indexed snapshot of this controller's list.
+
+        The store is created on first use and invalidated when the
+        controller creates or deletes a resource.  Its snapshot is
+        refreshed after
+        :py:data:`DEFAULT_REFRESH_SECS <.resource_store.DEFAULT_REFRESH_SECS>`.
+
+        :type: :py:class:`.resource_store.ResourceStore`
+        """
+        store = getattr(self, "_store", None)
+        if store is None:
+            with _store_lock:
+                # another thread may have created the store
+                store = getattr(self, "_store", None)
+                if store is None:
+                    store = self._store = ResourceStore(self)
+        return store
+
+    def find_by(self, **kwargs):
+        """Find resources by field values using the :py:attr:`store`.
+
+        Lookups on the `index_fields` do not scan the list, the list is
+        only retrieved the first time the store is used, after a resource
+        is created or deleted, and when the snapshot has expired.
+
+        Returns
+        -------
+        list
+            The resources whose fields equal all of the keyword args
+
+        Example
+        -------
+        >>> client.k8s_worker.find_by(ipaddr="10.1.0.238")
+        """
+        return self.store.find_by(**kwargs)
+
+    list_filter_params = {}
+    """Declare the list filters that the API can apply.
+
+    Maps a field name of the resource class to the query parameter that
+    filters the API collection on that field.  Filters on other fields are
+    applied by :py:meth:`list` after the collection is retrieved.
+
+    :type: dict
+
+    Example
+    -------
+    class ExampleController(AbstractResourceController):
+        ...
+        list_filter_params = {"name": "label.name"}
+    """
+
+    def list(self, filters=None, fields=None, compact=False):
         """Make an API call to retrieve a list of Resources.
 
+        Parameters
+        ----------
+        filters : dict, optional
+            Only return the resources whose fields match, keyed by field
+            name (see `resource_class.all_fields`).  A value matches if it
+            is equal to the filter value, is in the filter list/set, or if
+            the filter is a callable that returns True for the value.
+            Filters declared in `list_filter_params` are sent to the API.
+        fields : list[str], optional
+            Only extract these fields, implies `compact`.  The fields are
+            extracted client side, the API always returns whole resources.
+        compact : bool, optional
+            Return read-only :py:class:`CompactResource` instances without
+            the raw json, which is faster and uses less memory for large
+            lists, by default False
+
         Returns
         -------
         ResourceList
             The ResourceList will contain instances of the class defined by
             the property self.resource_class
+
+        Example
+        -------
+        >>> client.k8s_worker.list(
+        ...     filters={"ipaddr": "10.1.0.238"}, fields=["id", "status"]
+        ... )
         """
+        filters = self._check_list_args(filters, fields)
+        url, filters = self._list_url(filters)
+
         response = self.client._request(
-            url=self.base_resource_path,
+            url=url,
             http_method="get",
             description=self.__class__.__name__ + "/list",
         )
+        return self._list_result(
+            response.json()["_embedded"][self.resource_list_path],
+            filters,
+            fields,
+            compact,
+        )
+
+    def _list_url(self, filters):
+        """Return the list url and the filters that must be applied locally.
+
+        The filters that the API supports are sent as query parameters.
+        """
+        params = {}
+        for field in list(filters):
+            value = filters[field]
+            if field in self.list_filter_params and isinstance(
+                value, (six.string_types, int, bool)
+            ):
+                params[self.list_filter_params[field]] = filters.pop(field)
+
+        url = self.base_resource_path
+        if params:
+            if six.PY2:
+                url += "?" + urllib.urlencode(params)
+            else:
+                url += "?" + urllib.parse.urlencode(params)
+        return url, filters
+
+    def _check_list_args(self, filters, fields):
+        """Validate the list() arguments and return a copy of filters."""
+        assert filters is None or isinstance(
+            filters, dict
+        ), "'filters' must be a dict"
+        assert fields is None or isinstance(
+            fields, list
+        ), "'fields' must be a list"
+
+        all_fields = self.resource_class.all_fields
+        for field in list(filters or {}) + list(fields or []):
+            assert (
+                field in all_fields
+            ), "'{}' is not a field in {}.all_fields".format(
+                field, self.resource_class.__name__
+            )
+        return dict(filters or {})
+
+    def _list_result(self, items, filters, fields, compact):
+        """Apply client side filters and create the ResourceList."""
+        if filters:
+            matches = self._json_matcher(filters)
+            items = [json for json in items if matches(json)]
+
+        compact = compact or fields is not None
         return ResourceList(
             self.resource_class,
-            response.json()["_embedded"][self.resource_list_path],
+            items,
+            compact=compact,
+            keep_json=not compact,
+            fields=fields,
+        )
+
+    def _json_matcher(self, filters):
+        """Return a function that tests if a resource json matches filters.
+
+        The fields are read from the json with the resource class
+        properties, through one view object that is reused for every
+        item, so no resource is created for the items that are filtered
+        out.
+        """
+        view = self.resource_class.__new__(self.resource_class)
+        filters = list(filters.items())
+
+        def matches(json):
+            view.json = json
+            for field, expected in filters:
+                try:
+                    value = getattr(view, field)
+                except Exception:
+                    return False
+                if callable(expected):
+                    if not expected(value):
+                        return False
+                elif isinstance(expected, (list, tuple, set, frozenset)):
+                    if value not in expected:
+                        return False
+                elif value != expected:
+                    return False
+            return True
+
+        return matches
+
+    def iter_list(self, compact=False, chunk_size=65536, filters=None):
+        """Retrieve the Resources one at a time.
+
+        Unlike :py:meth:`list`, the response is parsed incrementally while
+        it is downloaded so the whole list is never held in memory.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            Yield read-only :py:class:`CompactResource` instances, by
+            default False
+        chunk_size : int, optional
+            Bytes read from the response at a time, by default 65536
+        filters : dict, optional
+            Only yield the resources whose fields match, see
+            :py:meth:`list`
+
+        Returns
+        -------
+        generator
+            Instances of the class defined by the property
+            self.resource_class
+
+        Raises
+        ------
+        APIException
+
+        Example
+        -------
+        >>> for user in client.user.iter_list(compact=True):
+        ...     print(user.name)
+        """
+        filters = self._check_list_args(filters, None)
+        url, filters = self._list_url(filters)
+        matches = self._json_matcher(filters) if filters else None
+
+        for json in self._iter_list_json(chunk_size, url):
+            if matches is not None and not matches(json):
+                continue
+            if compact:
+                yield self.resource_class.compact(json)
+            else:
+                yield self.resource_class(json)
+
+    def _iter_list_json(self, chunk_size, url=None):
+        response = self.client._request(
+            url=url or self.base_resource_path,
+            http_method="get",
+            description=self.__class__.__name__ + "/iter_list",
+            stream=True,
         )
+        try:
+            for json in iter_json_array(
+                response.iter_content(chunk_size),
+                ["_embedded", self.resource_list_path],
+            ):
+                yield json
+        finally:
+            response.close()
 
     def delete(self, id):
         """Make an API call to delete a Resources.
@@ -198,16 +512,12 @@ class AbstractResourceController:
         APIItemNotFoundException
             The item with {id} was not found.
         """
-        assert isinstance(id, str), "'id' must be provided and must be a str"
-        assert id.startswith(
-            self.base_resource_path
-        ), "'id' does not start with '{}'".format(self.base_resource_path)
-
         self.client._request(
-            url=id,
+            url=self._get_url(id, None),
             http_method="delete",
             description=self.__class__.__name__ + "/delete",
         )
+        self.store.invalidate()
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -260,12 +570,47 @@ class AbstractWaitableResourceController(AbstractResourceController):
         status_fieldname = status
     """
 
-    def wait_for_state(self, id, states=[], timeout_secs=1200):
+    error_status = []
+    """Declare the statuses that mean the resource has failed.
+
+    :py:meth:`wait_for_status` stops waiting as soon as one of these
+    statuses is observed, unless it is one of the statuses waited for.
+
+    :type: list[:py:attr:`status_class`]
+
+    Example
+    -------
+    class K8sClusterController(AbstractResourceController):
+        ...
+        error_status = [K8sClusterStatus.error]
+    """
+
+    def wait_for_state(
+        self,
+        id,
+        states=[],
+        timeout_secs=1200,
+        wait_policy=None,
+        poll_interval_secs=None,
+    ):
         """See wait_for_status()."""
-        return self.wait_for_status(id, states, timeout_secs)
+        return self.wait_for_status(
+            id, states, timeout_secs, wait_policy, poll_interval_secs
+        )
 
-    def wait_for_status(self, id, status=[], timeout_secs=1200):
-        """Wait for K8S worker status.
+    def wait_for_status(
+        self,
+        id,
+        status=[],
+        timeout_secs=1200,
+        wait_policy=None,
+        poll_interval_secs=None,
+    ):
+        """Wait for the resource to have one of the `status` values.
+
+        The resource is polled quickly at first and then less often, see
+        :py:class:`.wait.WaitPolicy`.  The wait ends early if the resource
+        reaches one of the :py:attr:`error_status` statuses.
 
         Parameters
         ----------
@@ -277,13 +622,59 @@ class AbstractWaitableResourceController(AbstractResourceController):
         timeout_secs: int
             How long to wait for the status(es) before raising an
             exception.
+        wait_policy: WaitPolicy, optional
+            By default the client's `wait_policy`
+        poll_interval_secs: int, optional
+            Poll at a fixed interval instead of using `wait_policy`
 
         Returns
         -------
-        bool
-            True if status was found before timeout, otherwise False
-            True if item does not exist before timeout and status is empty
+        WaitResult
+            Truthy if status was found before timeout, or if the item
+            does not exist before timeout and status is empty.  See
+            :py:class:`.wait.WaitResult` for the final resource and the
+            history of status transitions.
+
+        Raises
+        ------
+        APIItemNotFoundException
+            If status is not empty and the resource does not exist
         """
+        self._check_wait_args(status, timeout_secs)
+        if poll_interval_secs is not None:
+            wait_policy = WaitPolicy.fixed(poll_interval_secs)
+        waiter = self._status_waiter(status, timeout_secs, wait_policy)
+
+        if len(status) == 0:
+            _log.debug(
+                "waiting {}s for item {} to cease existence".format(
+                    timeout_secs, id
+                )
+            )
+        else:
+            _log.debug(
+                "waiting {}s for item {} to have status in {}".format(
+                    timeout_secs, id, waiter.status
+                )
+            )
+
+        while True:
+            try:
+                resource = self.get(id)
+            except APIItemNotFoundException:
+                if len(status) > 0:
+                    raise
+                resource = None
+
+            result = waiter.observe(resource)
+            if result is not None:
+                _log.debug("Waiting for item {}: {}".format(id, result))
+                return result
+
+            time.sleep(waiter.next_interval_secs())
+
+    def _check_wait_args(self, status, timeout_secs):
+        """Validate the wait_for_status() arguments."""
         assert isinstance(status, list), "'status' must be a list"
         for i, s in enumerate(status):
             assert isinstance(
@@ -294,67 +685,146 @@ class AbstractWaitableResourceController(AbstractResourceController):
         assert isinstance(timeout_secs, int), "'timeout_secs' must be an int"
         assert timeout_secs >= 0, "'timeout_secs' must be >= 0"
 
-        # if status is empty return success when resource id not found
-        if len(status) == 0:
-            _log.debug(
-                "waiting {}s for item {} to cease existence".format(
-                    timeout_secs, id
-                )
+    def wait_for_status_many(
+        self,
+        ids,
+        status=[],
+        timeout_secs=1200,
+        fail_fast=False,
+        wait_policy=None,
+        on_done=None,
+    ):
+        """Wait for several resources to reach their wanted status.
+
+        Instead of polling each resource with :py:meth:`get`, all of the
+        resources are retrieved with one :py:meth:`list` call per poll.
+
+        Parameters
+        ----------
+        ids: list[str] or dict
+            The resource IDs - format: '/resource/path/[0-9]+'.  Use a dict
+            mapping each ID to a list of statuses to wait for different
+            statuses per resource.
+        status: list[:py:method:`status_class`]
+            Status(es) to wait for if `ids` is a list.  Use an empty array
+            to wait for the resources existence to cease.
+        timeout_secs: int
+            The overall deadline for all of the resources
+        fail_fast: bool
+            Stop waiting for the remaining resources as soon as one
+            resource fails (error status or not found).  The remaining
+            resources have the reason "cancelled".
+        wait_policy: WaitPolicy, optional
+            By default the client's `wait_policy`
+        on_done: callable, optional
+            Called with (id, WaitResult) as soon as each resource finishes
+
+        Returns
+        -------
+        OrderedDict
+            :py:class:`.wait.WaitResult` keyed by ID, in the order of `ids`.
+            Use ``all(results.values())`` to check every wait succeeded.
+
+        Example
+        -------
+        >>> results = client.k8s_worker.wait_for_status_many(
+        ...     worker_ids,
+        ...     status=[WorkerK8sStatus.storage_pending],
+        ...     on_done=lambda id, r: print(id, r.status),
+        ... )
+        """
+        targets, wait_policy = self._check_wait_many_args(
+            ids, status, timeout_secs, wait_policy
+        )
+        waiters = OrderedDict(
+            (id, self._status_waiter(id_status, timeout_secs, wait_policy))
+            for id, id_status in targets.items()
+        )
+        results = {}
+
+        tick = 0
+        while waiters:
+            resources = {r.id: r for r in self.list()}
+            self._observe_many(waiters, resources, results, fail_fast, on_done)
+            if not waiters:
+                break
+
+            remaining = (
+                timeout_secs - next(iter(waiters.values())).elapsed_secs()
             )
+            time.sleep(max(0, min(wait_policy.interval_secs(tick), remaining)))
+            tick += 1
 
-            def item_not_exists():
-                try:
-                    self.get(id)
-                    return False
-                except APIItemNotFoundException:
-                    return True
+        return OrderedDict((id, results[id]) for id in targets)
 
-            try:
-                polling.poll(
-                    lambda: item_not_exists(),
-                    step=10,
-                    poll_forever=False,
-                    timeout=timeout_secs,
-                )
-                return True
-            except polling.TimeoutException:
-                return False
+    def _check_wait_many_args(self, ids, status, timeout_secs, wait_policy):
+        """Validate the wait_for_status_many() arguments.
 
-        # if state is not empty return success when resource current state is
-        # in desired state
+        Returns
+        -------
+        tuple
+            (OrderedDict of statuses keyed by ID, WaitPolicy)
+        """
+        if isinstance(ids, dict):
+            targets = OrderedDict(ids)
         else:
-            waiting_for_status = [s.name for s in status]
+            assert isinstance(ids, list), "'ids' must be a list or dict"
+            targets = OrderedDict((id, status) for id in ids)
 
-            _log.debug(
-                "waiting {}s for item {} to have status in {}".format(
-                    timeout_secs, id, waiting_for_status
+        for id, id_status in targets.items():
+            assert isinstance(
+                id_status, list
+            ), "'status' for '{}' must be a list".format(id)
+            for s in id_status:
+                assert isinstance(
+                    s, self.status_class
+                ), "'status' for '{}' is not of type {}".format(
+                    id, self.status_class
                 )
-            )
-            try:
+        assert isinstance(timeout_secs, int), "'timeout_secs' must be an int"
+        assert timeout_secs >= 0, "'timeout_secs' must be >= 0"
 
-                def get_status():
-                    status = getattr(self.get(id), self.status_fieldname)
-                    return status
+        if wait_policy is None:
+            wait_policy = self.client.wait_policy
+        return targets, wait_policy
 
-                polling.poll(
-                    lambda: (get_status() in waiting_for_status),
-                    step=10,
-                    poll_forever=False,
-                    timeout=timeout_secs,
-                )
-                _log.debug(
-                    "Found item {} with status in {}".format(
-                        id, waiting_for_status
-                    )
-                )
-                return True
-            except polling.TimeoutException:
-                _log.debug(
-                    "Timed out waiting for {} to have status in {}".format(
-                        id, waiting_for_status
-                    )
-                )
-                return False
+    def _observe_many(self, waiters, resources, results, fail_fast, on_done):
+        """Observe one poll of wait_for_status_many().
+
+        The finished waiters are moved from `waiters` to `results`.
+        """
+
+        def finish(id, result):
+            results[id] = result
+            del waiters[id]
+            _log.debug("Waiting for item {}: {}".format(id, result))
+            if on_done is not None:
+                on_done(id, result)
+
+        for id, waiter in list(waiters.items()):
+            resource = resources.get(id)
+            if resource is None and waiter.status:
+                result = waiter.stop("not_found")
+            else:
+                result = waiter.observe(resource)
+            if result is not None:
+                finish(id, result)
+
+                if fail_fast and not result:
+                    for other_id, other in list(waiters.items()):
+                        finish(other_id, other.stop("cancelled"))
+                    break
+
+    def _status_waiter(self, status, timeout_secs, wait_policy=None):
+        if wait_policy is None:
+            wait_policy = self.client.wait_policy
+        return StatusWaiter(
+            status_fieldname=self.status_fieldname,
+            status=[s.name for s in status],
+            error_status=[s.name for s in self.error_status],
+            timeout_secs=timeout_secs,
+            policy=wait_policy,
+        )
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -413,11 +883,164 @@ class AbstractResource:
         """Return the number of resource fields in the Resource class."""
         return len(dir(self))
 
+    @classmethod
+    def compact(cls, json, keep_json=False, fields=None):
+        """Create a compact, read-only copy of a resource.
+
+        Each of the `all_fields` is extracted from `json` once and stored
+        in a `__slots__` attribute, so field access is a plain attribute
+        lookup and the raw json can be released.
+
+        Parameters
+        ----------
+        json : obj
+            JSON returned from the API for the Resource.
+        keep_json : bool, optional
+            Retain the raw json as the `json` attribute, by default False
+        fields : list[str], optional
+            Only extract these fields (and `id`), by default `all_fields`
+
+        Returns
+        -------
+        CompactResource
+            An instance of the class returned by :py:meth:`compact_class`
+        """
+        return cls.compact_class(fields)(cls(json), keep_json)
+
+    @classmethod
+    def compact_class(cls, fields=None):
+        """Return the `CompactResource` class for this Resource class.
+
+        The class is created once per Resource class and `fields`.
+
+        Parameters
+        ----------
+        fields : list[str], optional
+            The fields to extract, by default `all_fields`
+        """
+        key = (cls, tuple(fields) if fields is not None else None)
+        try:
+            return _compact_classes[key]
+        except KeyError:
+            pass
+
+        fields = list(cls.all_fields if fields is None else fields)
+        if "id" not in fields:
+            fields.append("id")
+        compact_cls = type(
+            cls.__name__ + "Compact",
+            (CompactResource,),
+            {
+                "__slots__": tuple(fields),
+                "__doc__": "Compact representation of {}.".format(
+                    cls.__name__
+                ),
+                "resource_class": cls,
+                "all_fields": cls.all_fields,
+                "_fields": tuple(fields),
+                "_getter": staticmethod(operator.attrgetter(*fields)),
+            },
+        )
+        _compact_classes[key] = compact_cls
+        return compact_cls
+
+
+# CompactResource classes keyed by (Resource class, fields)
+_compact_classes = {}
+
+
+class CompactResource(object):
+    """A read-only, memory efficient copy of an `AbstractResource`.
+
+    Instances are created with :py:meth:`AbstractResource.compact`.  The
+    fields are stored in `__slots__`; a field that could not be read from
+    the API json is left unset, so `hasattr()` returns False for it.
+    """
+
+    __slots__ = ("_json",)
+
+    # set by AbstractResource.compact_class()
+    resource_class = None
+    all_fields = []
+    _fields = ()
+    _getter = None
+
+    def __init__(self, resource, keep_json=False):
+        """Copy the fields of `resource` - see `AbstractResource.compact`."""
+        object.__setattr__(self, "_json", resource.json if keep_json else None)
+        try:
+            values = self._getter(resource)
+        except Exception:
+            # some fields are missing - extract them one at a time
+            for field in self._fields:
+                try:
+                    object.__setattr__(self, field, getattr(resource, field))
+                except Exception:
+                    pass
+            return
+
+        if len(self._fields) == 1:
+            values = (values,)
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        """Prevent modification, the resource is read-only."""
+        raise AttributeError(
+            "'{}' object is read-only".format(self.__class__.__name__)
+        )
+
+    @property
+    def json(self):
+        """The raw json, only available if created with `keep_json=True`."""
+        if self._json is None:
+            raise AttributeError(
+                "json was not retained, use compact(json, keep_json=True)"
+            )
+        return self._json
+
+    def to_dict(self):
+        """Return the fields that are set as a dict."""
+        return {
+            field: getattr(self, field)
+            for field in self._fields
+            if hasattr(self, field)
+        }
+
+    def __repr__(self):
+        """Return a represenation of Resource class."""
+        return "<{} id:{}>".format(
+            self.resource_class.__name__, getattr(self, "id", None)
+        )
+
+    def __str__(self):
+        """Return a str representation of a Resource class."""
+        return "{}(id={})".format(
+            self.resource_class.__name__, getattr(self, "id", None)
+        )
+
+    def __len__(self):
+        """Return the number of resource fields in the Resource class."""
+        return len(self._fields)
+
 
 class ResourceList:
-    """List of Resource objects."""
+    """List of Resource objects.
+
+    Resources are created from the API json on first access, so that
+    callers that only need the raw `json` (e.g. to evaluate a jmespath
+    query) or a few of the resources do not pay for creating all of them.
+    """
 
-    def __init__(self, resource_class, json):
+    def __init__(
+        self,
+        resource_class,
+        json,
+        errors=None,
+        compact=False,
+        keep_json=True,
+        fields=None,
+    ):
         """Create a list of resources using the resource_class.
 
         Parameters
@@ -426,14 +1049,75 @@ class ResourceList:
             Resource implementation class
         json : obj
             JSON return from the API
+        errors : dict, optional
+            Exceptions keyed by id, for resources that could not be
+            retrieved - see :py:meth:`AbstractResourceController.get_many`
+        compact : bool, optional
+            Create :py:class:`CompactResource` instances instead of
+            `resource_class` instances, by default False
+        keep_json : bool, optional
+            With `compact`, retain the raw json in the list (`json`) and
+            in each resource.  By default True.  If False, `json` is None
+            and the raw json is released once every resource is created.
+        fields : list[str], optional
+            With `compact`, only extract these fields, by default all
         """
-        self.json = json
+        self.errors = errors if errors is not None else OrderedDict()
         self.resource_class = resource_class
-        self.resources = [self.resource_class(j) for j in json]
+        self.compact = compact
+        self.fields = fields if compact else None
+        self.keep_json = keep_json or not compact
+        self.json = json if self.keep_json else None
+
+        self._json_items = json
+        self._resources = [None] * len(json)
+        self._pending = len(json)
+
+    def _resource(self, index):
+        resource = self._resources[index]
+        if resource is None:
+            item = self._json_items[index]
+            if self.compact:
+                resource = self.resource_class.compact(
+                    item, self.keep_json, self.fields
+                )
+            else:
+                resource = self.resource_class(item)
+            self._resources[index] = resource
+            self._pending -= 1
+            if self._pending == 0 and not self.keep_json:
+                self._json_items = None
+        return resource
+
+    @property
+    def resources(self):
+        """Return all of the resources as a list."""
+        if self._pending:
+            for index in range(len(self._resources)):
+                self._resource(index)
+        return list(self._resources)
+
+    def __len__(self):
+        """Return the number of resources."""
+        return len(self._resources)
+
+    def __iter__(self):
+        """Iterate over the resources, creating each one when reached."""
+        for index in range(len(self._resources)):
+            yield self._resource(index)
 
     def __getitem__(self, item):
-        """Retrieve a field value."""
-        return self.resources[item]
+        """Retrieve a resource, or a list of resources for a slice."""
+        if isinstance(item, slice):
+            return [
+                self._resource(index)
+                for index in range(*item.indices(len(self._resources)))
+            ]
+        if item < 0:
+            item += len(self._resources)
+        if not 0 <= item < len(self._resources):
+            raise IndexError("list index out of range")
+        return self._resource(item)
 
     def tabulate(self, columns=[], style="pretty", display_headers=True):
         """Return a tabule output of the ResourceList.
@@ -486,10 +1170,61 @@ class ResourceList:
         >>> print(hpeclient.cluster.list().tabulate(
         ...     columns=['id', 'name','description']))
         """
+        columns, table = self._table(columns)
+        output = "\n".join(self._lines(table, columns, style, display_headers))
+
+        if six.PY2:
+            return output.encode(encoding="UTF-8", errors="strict")
+        else:
+            return output
+
+    def print_table(
+        self, columns=[], style="pretty", display_headers=True, file=None
+    ):
+        """Print the table output of the ResourceList.
+
+        The "plain" and "pretty" styles are written one line at a time, the
+        other styles are printed with :py:meth:`tabulate`.
+
+        Parameters
+        ----------
+        columns : list, optional
+            See :py:meth:`tabulate`
+        style : str, optional
+            See :py:meth:`tabulate`, by default "pretty"
+        display_headers : bool, optional
+            Output the column headers, by default True
+        file : file, optional
+            Where to print the table, by default sys.stdout
+        """
+        file = file if file is not None else sys.stdout
+
+        columns, table = self._table(columns)
+        for line in self._lines(table, columns, style, display_headers):
+            print(line, file=file)
+
+    def _lines(self, table, columns, style, display_headers):
+        """Return the lines of the table output."""
+        lines = None
+        if style in FAST_STYLES:
+            lines = render_lines(
+                table, columns if display_headers else None, style
+            )
+
+        if lines is None:
+            if display_headers:
+                output = tabulate(table, headers=columns, tablefmt=style)
+            else:
+                output = tabulate(table, tablefmt=style)
+            lines = [output]
+        return lines
+
+    def _table(self, columns):
+        """Return the columns and the rows of cell values to output."""
         assert isinstance(columns, list), "'columns' parameter must be list"
 
         if len(columns) == 0:
-            columns = self.resource_class.all_fields
+            columns = self.fields or self.resource_class.all_fields
 
         for field in columns:
             assert (
@@ -501,24 +1236,24 @@ class ResourceList:
         self.display_fields = columns
 
         table = []
-        for resource in self.resources:
+        missing = [0] * len(columns)
+        for resource in self:
             row = []
-            for col in columns:
-                if not hasattr(resource, col):
-                    _log.warn(
-                        "Field {} not found in {} - json {}".format(
-                            col, resource, self.json
-                        )
-                    )
-                row.append(getattr(resource, col, ""))
+            for index, col in enumerate(columns):
+                value = getattr(resource, col, _MISSING)
+                if value is _MISSING:
+                    missing[index] += 1
+                    value = ""
+                row.append(value)
             table.append(row)
 
-        if display_headers:
-            output = tabulate(table, headers=columns, tablefmt=style)
-        else:
-            output = tabulate(table, tablefmt=style)
+        # warn once per column rather than once per cell
+        for col, count in zip(columns, missing):
+            if count:
+                _log.warn(
+                    "Field {} not found in {} of {} {} resources".format(
+                        col, count, len(table), self.resource_class.__name__
+                    )
+                )
 
-        if six.PY2:
-            return output.encode(encoding="UTF-8", errors="strict")
-        else:
-            return output
+        return columns, table
@@ -204,6 +204,7 @@ class CatalogController(AbstractResourceController):
     base_resource_path = "/api/v1/catalog"
 
     resource_list_path = "independent_catalog_entries"
+    index_fields = ["label_name", "distro_id", "state"]
 
     resource_class = Catalog
 
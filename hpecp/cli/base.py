@@ -23,14 +23,19 @@
 from __future__ import print_function
 
 import abc
+import atexit
+import csv
+import datetime
 import json
 import os
 import sys
+import threading
 import jmespath
 import six
 import yaml
 import wrapt
 import traceback
+from collections import OrderedDict
 
 from hpecp.logger import Logger
 
@@ -47,9 +52,16 @@ from hpecp.exceptions import (
     APIUnknownException,
 )
 from hpecp.cli_utils import TextOutput
+from hpecp.cli.session_cache import SessionCache, session_cache_key
+from hpecp.response_cache import ResponseCache
 
 _log = Logger.get_logger()
 
+# clients created by get_client(), keyed by (config file, profile), so that
+# commands calling get_client() several times only login once
+_clients = {}
+_clients_lock = threading.Lock()
+
 
 def get_profile():
     """Retrieve the profile - if supplied."""
@@ -79,6 +91,50 @@ def get_config_file():
     return HPECP_CONFIG_FILE
 
 
+def get_session_cache():
+    """Retrieve the on-disk session cache - if enabled.
+
+    The cache is enabled by setting the environment variable
+    HPECP_SESSION_CACHE_FILE to the cache file path.  Sessions that have
+    not been used for HPECP_SESSION_CACHE_TTL seconds (default 1800) are
+    discarded.
+    """
+    if "HPECP_SESSION_CACHE_FILE" not in os.environ:
+        return None
+
+    path = os.path.expandvars(os.getenv("HPECP_SESSION_CACHE_FILE"))
+    ttl_secs = int(os.getenv("HPECP_SESSION_CACHE_TTL", default="1800"))
+    _log.debug(
+        "HPECP_SESSION_CACHE_FILE env variable exists with value '{}'".format(
+            path
+        )
+    )
+    return SessionCache(path, ttl_secs)
+
+
+def get_response_cache():
+    """Retrieve the on-disk HTTP response cache - if enabled.
+
+    The cache is enabled by setting the environment variable
+    HPECP_RESPONSE_CACHE_FILE to the cache file path.  At most
+    HPECP_RESPONSE_CACHE_SIZE responses (default 128) are kept.  The file
+    is written when the CLI exits.
+    """
+    if "HPECP_RESPONSE_CACHE_FILE" not in os.environ:
+        return None
+
+    path = os.path.expandvars(os.getenv("HPECP_RESPONSE_CACHE_FILE"))
+    max_entries = int(os.getenv("HPECP_RESPONSE_CACHE_SIZE", default="128"))
+    _log.debug(
+        "HPECP_RESPONSE_CACHE_FILE env variable exists with value '{}'".format(
+            path
+        )
+    )
+    response_cache = ResponseCache(max_entries=max_entries, path=path)
+    atexit.register(response_cache.save)
+    return response_cache
+
+
 @wrapt.decorator
 def intercept_exception(wrapped, instance, args, kwargs):
     """Handle Exceptions."""  # noqa: D202
@@ -124,16 +180,105 @@ def intercept_exception(wrapped, instance, args, kwargs):
 
 @intercept_exception
 def get_client(start_session=True):
-    """Retrieve a reference to an authenticated client object."""
-    client = ContainerPlatformClient.create_from_config_file(
-        config_file=get_config_file(),
-        profile=get_profile(),
-    )
-    if start_session:
-        client.create_session()
+    """Retrieve a reference to an authenticated client object.
+
+    The client is created once per config file and profile.  If the
+    session cache is enabled (see :py:func:`get_session_cache`) the
+    session is reused across CLI invocations.
+    """
+    config_file = get_config_file()
+    profile = get_profile()
+
+    # commands run in parallel by 'hpecp batch' share the client
+    with _clients_lock:
+        return _get_client(config_file, profile, start_session)
+
+
+def reset_clients():
+    """Close and forget the clients created by :py:func:`get_client`.
+
+    The next call of get_client() creates a new client, as if the CLI was
+    started again.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def _get_client(config_file, profile, start_session):
+    client = _clients.get((config_file, profile))
+    if client is None:
+        client = ContainerPlatformClient.create_from_config_file(
+            config_file=config_file,
+            profile=profile,
+        )
+        client.response_cache = get_response_cache()
+        _clients[(config_file, profile)] = client
+
+    if start_session and getattr(client, "session_id", None) is None:
+        session_cache = get_session_cache()
+        if session_cache is None:
+            client.create_session()
+        else:
+            key = session_cache_key(profile, client)
+
+            # also called when the client logs in again after a HTTP 401
+            def save_session(c):
+                session_cache.put(key, c.session_id)
+
+            client.on_session_created = save_session
+
+            session_id = session_cache.get(key)
+            if session_id is None:
+                client.create_session()
+            else:
+                _log.debug("Reusing cached session '{}'".format(session_id))
+                client.resume_session(session_id)
     return client
 
 
+class _JsonYamlDumper(yaml.SafeDumper):
+    """YAML dumper that only accepts the types json data is parsed into."""
+
+
+for _type in [set, datetime.date, datetime.datetime] + (
+    [bytes] if six.PY3 else []
+):
+    _JsonYamlDumper.add_representer(
+        _type, yaml.representer.SafeRepresenter.represent_undefined
+    )
+
+
+def print_yaml(data):
+    """Print data that was parsed from json as YAML.
+
+    The data is emitted straight to stdout.  The pure python emitter is
+    used because libyaml folds long strings differently, which would
+    change the output.
+
+    Parameters
+    ----------
+    data : dict or list
+        The json data
+    """
+    yaml.dump(
+        data, sys.stdout, Dumper=_JsonYamlDumper, default_flow_style=False
+    )
+    # the output has always been followed by a blank line
+    print()
+
+
+def _csv_value(value):
+    """Return a csv cell, nested values are written as json."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
 @six.add_metaclass(abc.ABCMeta)
 class BaseProxy:
     """Base 'proxy' class for generic calls to API."""
@@ -182,14 +327,7 @@ class BaseProxy:
             )
         else:
 
-            print(
-                yaml.dump(
-                    yaml.load(
-                        json.dumps(json_data),
-                        Loader=yaml.FullLoader,
-                    )
-                )
-            )
+            print_yaml(json_data)
 
     @intercept_exception
     def delete(self, id, wait_for_delete_sec=0):
@@ -216,6 +354,8 @@ class BaseProxy:
         ----------
         output : str, optional
             Define how the output should be printed, by default "table"
+            "ndjson" (one json object per line) or "csv" stream the columns
+            of each resource as it is received
             "json" or "json-pp" (json pretty print) if providing a query
         columns : list/tuple, optional
             List of specific columns to be displayed, by default []
@@ -247,7 +387,20 @@ class BaseProxy:
         self.client_module_property = getattr(
             self.client, self.client_module_name
         )
-        list_instance = self.client_module_property.list()
+
+        if len(query) == 0 and output in ["ndjson", "csv"]:
+            # print each resource as it is parsed from the response
+            self.print_stream(
+                self.client_module_property.iter_list(compact=True),
+                output=output,
+                columns=columns,
+            )
+            return
+
+        # the raw json is only needed to evaluate a jmespath query
+        list_instance = self.client_module_property.list(
+            compact=len(query) == 0
+        )
 
         self.print_list(
             list_instance=list_instance,
@@ -280,19 +433,19 @@ class BaseProxy:
                 sys.exit(1)
 
         if len(query) == 0:
-            if output not in ["table", "text"]:
+            if output not in ["table", "text", "ndjson", "csv"]:
                 print(
                     "When providing the --columns param, the --output param "
-                    "must be 'table' or 'text'",
+                    "must be 'table', 'text', 'ndjson' or 'csv'",
                     file=sys.stderr,
                 )
                 sys.exit(1)
         else:
-            if output not in ["json", "json-pp", "text"]:
+            if output not in ["json", "json-pp", "text", "ndjson"]:
                 print(
                     (
                         "If you provide a jmes --query, the output must "
-                        "be 'json', 'json-pp', or 'text'"
+                        "be 'json', 'json-pp', 'ndjson' or 'text'"
                     ),
                     file=sys.stderr,
                 )
@@ -327,13 +480,13 @@ class BaseProxy:
 
         # use tabulate for simplified user output
         if len(query) == 0:
-            if output == "table":
-                print(list_instance.tabulate(columns=columns))
+            if output in ["ndjson", "csv"]:
+                self.print_stream(list_instance, output, columns)
+            elif output == "table":
+                list_instance.print_table(columns=columns)
             else:
-                print(
-                    list_instance.tabulate(
-                        columns=columns, style="plain", display_headers=False
-                    )
+                list_instance.print_table(
+                    columns=columns, style="plain", display_headers=False
                 )
 
         # user has provided a jmes query
@@ -350,6 +503,10 @@ class BaseProxy:
             elif output == "text":
                 obj = jmespath.search(str(query), data)
                 print(TextOutput.dump(obj))
+            elif output == "ndjson":
+                obj = jmespath.search(str(query), data)
+                for item in obj if isinstance(obj, list) else [obj]:
+                    print(json.dumps(item))
             else:
                 print(
                     json.dumps(
@@ -357,6 +514,40 @@ class BaseProxy:
                     )
                 )
 
+    def print_stream(self, resources, output, columns):
+        """Print each resource on its own line as soon as it is available.
+
+        Parameters
+        ----------
+        resources : iterable
+            The resources, e.g. a ResourceList or the generator returned by
+            `iter_list()`
+        output : str
+            "ndjson" (one json object per resource) or "csv"
+        columns : list
+            The fields to print
+        """
+        if output == "csv":
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(columns)
+            for resource in resources:
+                writer.writerow(
+                    [
+                        _csv_value(getattr(resource, col, None))
+                        for col in columns
+                    ]
+                )
+        else:
+            for resource in resources:
+                print(
+                    json.dumps(
+                        OrderedDict(
+                            (col, getattr(resource, col, None))
+                            for col in columns
+                        )
+                    )
+                )
+
     def wait_for_state(
         self,
         id,
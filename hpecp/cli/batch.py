@@ -0,0 +1,245 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Run many CLI commands in one process."""
+
+from __future__ import print_function
+
+import json
+import shlex
+import sys
+import threading
+from multiprocessing.pool import ThreadPool
+
+import fire
+import six
+
+from hpecp.logger import Logger
+
+_log = Logger.get_logger()
+
+
+class _ThreadLocalStream(object):
+    """Send the writes of each thread to that thread's buffer, if any."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buffer = six.StringIO()
+
+    def release(self):
+        buffer = self._local.buffer
+        self._local.buffer = None
+        return buffer.getvalue()
+
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+
+    def write(self, data):
+        return self._target().write(data)
+
+    def flush(self):
+        self._target().flush()
+
+    def isatty(self):
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def parse_line(line):
+    """Return the CLI arguments of a batch line.
+
+    Parameters
+    ----------
+    line : str
+        Either a command line, e.g. `k8sworker get /api/v2/worker/k8shost/5`
+        optionally starting with `hpecp`, or json: a list of arguments or an
+        object with an `args` list.
+
+    Returns
+    -------
+    list[str] or None
+        The arguments, or None for blank lines and '#' comments.
+
+    Raises
+    ------
+    ValueError
+        The line could not be parsed.
+    """
+    line = line.strip()
+    if line == "" or line.startswith("#"):
+        return None
+
+    if line[0] in "[{":
+        args = json.loads(line)
+        if isinstance(args, dict):
+            args = args.get("args")
+        if not isinstance(args, list):
+            raise ValueError(
+                "json lines must be a list or have an 'args' list"
+            )
+        args = [str(arg) for arg in args]
+    else:
+        args = shlex.split(line)
+
+    if args and args[0] == "hpecp":
+        args = args[1:]
+    if not args:
+        raise ValueError("no command")
+    if args[0] in ["batch", "shell"]:
+        raise ValueError(
+            "'{}' can not be run from batch or shell".format(args[0])
+        )
+    return args
+
+
+def system_exit_code(system_exit):
+    """Return the process exit code of a SystemExit, like the interpreter.
+
+    `sys.exit()` and `sys.exit(None)` succeed, an int is the exit code and
+    any other value is printed to sys.stderr and fails with exit code 1.
+    """
+    code = system_exit.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _run_command(cli_class, args):
+    """Run one CLI command, returning its exit code and output.
+
+    sys.stdout and sys.stderr must be :py:class:`_ThreadLocalStream`.
+
+    Returns
+    -------
+    tuple
+        (exit_code, stdout, stderr)
+    """
+    sys.stdout.capture()
+    sys.stderr.capture()
+    exit_code = 0
+    try:
+        fire.Fire(cli_class(), command=args, name="hpecp")
+    except SystemExit as se:
+        exit_code = system_exit_code(se)
+    except Exception as ex:
+        print(ex, file=sys.stderr)
+        exit_code = 1
+    finally:
+        stdout = sys.stdout.release()
+        stderr = sys.stderr.release()
+    return exit_code, stdout, stderr
+
+
+def run_batch(cli_class, lines, parallel=1, out=None):
+    """Run the commands in `lines` and write one json result per command.
+
+    Each result has the input `line` number, the `args`, the `exit_code`
+    and the captured `stdout` and `stderr` of the command.  With `parallel`
+    > 1 the results are written as the commands complete.
+
+    The output of the commands is captured by replacing sys.stdout and
+    sys.stderr until the batch completes.  Writes from threads that are
+    not running a batch command go through to the original streams, but
+    the process must not run two batches at the same time, or replace the
+    streams itself while a batch is running.
+
+    Parameters
+    ----------
+    cli_class : class
+        The CLI class, an instance is created for each command
+    lines : iterable
+        The batch lines, see :py:func:`parse_line`
+    parallel : int, optional
+        How many commands to run at the same time, by default 1
+    out : file, optional
+        Where to write the results, by default sys.stdout
+
+    Returns
+    -------
+    int
+        The number of commands that failed
+    """
+    assert (
+        isinstance(parallel, int) and parallel >= 1
+    ), "'parallel' must be an int >= 1"
+
+    out = out if out is not None else sys.stdout
+    saved_stdout, saved_stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadLocalStream(saved_stdout)
+    sys.stderr = _ThreadLocalStream(saved_stderr)
+
+    def tasks():
+        for line_number, line in enumerate(lines, 1):
+            try:
+                args = parse_line(line)
+            except ValueError as ve:
+                yield line_number, None, str(ve)
+                continue
+            if args is not None:
+                yield line_number, args, None
+
+    def run(task):
+        line_number, args, error = task
+        if error is not None:
+            return {
+                "line": line_number,
+                "args": None,
+                "exit_code": 2,
+                "stdout": "",
+                "stderr": error,
+            }
+        exit_code, stdout, stderr = _run_command(cli_class, args)
+        return {
+            "line": line_number,
+            "args": args,
+            "exit_code": exit_code,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
+
+    failed = 0
+    pool = ThreadPool(parallel) if parallel > 1 else None
+    try:
+        if pool is None:
+            results = six.moves.map(run, tasks())
+        else:
+            results = pool.imap_unordered(run, tasks())
+        for result in results:
+            if result["exit_code"] != 0:
+                failed += 1
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        sys.stdout, sys.stderr = saved_stdout, saved_stderr
+
+    _log.debug("batch: {} commands failed".format(failed))
+    return failed
@@ -0,0 +1,429 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Shell completion scripts built from cached CLI metadata."""
+
+from __future__ import absolute_import
+
+import json
+import os
+from collections import OrderedDict
+
+from hpecp.json_file import write_json_file
+from hpecp.logger import Logger
+
+_log = Logger.get_logger()
+
+COMMANDS = ["autocomplete", "batch", "configure-cli", "shell", "version"]
+"""The top level commands that are not command groups."""
+
+SHELLS = ["bash", "zsh", "fish"]
+
+LIST_OUTPUTS = ["table", "text", "ndjson", "csv", "json", "json-pp"]
+"""The --output choices of the list commands."""
+
+GET_OUTPUTS = ["yaml", "json", "json-pp"]
+"""The --output choices of the other commands, see `BaseProxy.get`."""
+
+
+def metadata_path(version):
+    """Return the path of the cached completion metadata for a version.
+
+    The metadata is cached in HPECP_COMPLETION_CACHE_DIR, by default
+    `~/.cache/hpecp`.
+    """
+    directory = os.path.expandvars(
+        os.getenv(
+            "HPECP_COMPLETION_CACHE_DIR",
+            default=os.path.join("~", ".cache", "hpecp"),
+        )
+    )
+    return os.path.join(
+        os.path.expanduser(directory), "completion-{}.json".format(version)
+    )
+
+
+def build_metadata(modules, columns):
+    """Convert `AutoComplete._get_metadata()` to the cached format.
+
+    Command and parameter names use '-' rather than '_', as typed on the
+    command line.
+    """
+    return OrderedDict(
+        [
+            ("commands", COMMANDS + list(modules)),
+            (
+                "functions",
+                OrderedDict(
+                    (
+                        module,
+                        OrderedDict(
+                            (
+                                function.replace("_", "-"),
+                                [p.replace("_", "-") for p in parameters],
+                            )
+                            for function, parameters in functions.items()
+                        ),
+                    )
+                    for module, functions in modules.items()
+                ),
+            ),
+            ("columns", columns),
+        ]
+    )
+
+
+def load_metadata(version, compute, refresh=False):
+    """Load the completion metadata, computing and caching it if required.
+
+    Parameters
+    ----------
+    version : str
+        The hpecp version, the metadata is cached once per version
+    compute : callable
+        Returns the metadata (see :py:func:`build_metadata`) if it is not
+        cached
+    refresh : bool, optional
+        Ignore the cached metadata, by default False
+
+    Returns
+    -------
+    dict
+    """
+    path = metadata_path(version)
+    if not refresh:
+        try:
+            with open(path, "r") as f:
+                return json.load(f, object_pairs_hook=OrderedDict)
+        except (IOError, OSError, ValueError):
+            pass
+
+    metadata = compute()
+    try:
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        write_json_file(path, metadata)
+    except (IOError, OSError, TypeError, ValueError) as e:
+        _log.debug("Unable to write completion metadata: {}".format(e))
+    return metadata
+
+
+def _words(words):
+    return " ".join(words)
+
+
+def _output_choices(function):
+    return LIST_OUTPUTS if function == "list" else GET_OUTPUTS
+
+
+BASH_FUNCTIONS = r"""
+_hpecp_match()
+{
+    local word
+    COMPREPLY=()
+    for word in $1; do
+        [[ "$word" == "$2"* ]] && COMPREPLY+=("$word")
+    done
+}
+
+_hpecp_complete()
+{
+    local cur=${COMP_WORDS[COMP_CWORD]}
+    local prev=${COMP_WORDS[COMP_CWORD-1]}
+    local module=${COMP_WORDS[1]}
+    local function=${COMP_WORDS[2]//_/-}
+    COMPREPLY=()
+
+    # complete file names after a redirect or a --*file parameter
+    if [[ "$prev" == *">"* || "$prev" == --*file ]]; then
+        compopt -o default
+        return
+    fi
+
+    if (( COMP_CWORD == 1 )); then
+        _hpecp_match "$_HPECP_COMMANDS" "$cur"
+        return
+    fi
+
+    if [[ "$module" == autocomplete ]]; then
+        (( COMP_CWORD == 2 )) && _hpecp_match "$_HPECP_SHELLS" "$cur"
+        return
+    fi
+
+    if (( COMP_CWORD == 2 )); then
+        _hpecp_match "${_HPECP_FUNCTIONS[$module]}" "$cur"
+        return
+    fi
+
+    case "$prev" in
+        --output)
+            _hpecp_match "${_HPECP_OUTPUTS[$module.$function]}" "$cur"
+            return
+            ;;
+        --columns)
+            # complete the last of a comma separated list of columns
+            local prefix="" realcur="$cur" column
+            if [[ "$cur" == *,* ]]; then
+                prefix="${cur%,*},"
+                realcur="${cur##*,}"
+            fi
+            for column in ${_HPECP_COLUMNS[$module]}; do
+                [[ ",$prefix" == *",$column,"* ]] && continue
+                [[ "$column" == "$realcur"* ]] && COMPREPLY+=("$prefix$column")
+            done
+            compopt -o nospace
+            return
+            ;;
+    esac
+
+    # the parameters that have not been entered
+    local param word used
+    for param in ${_HPECP_PARAMS[$module.$function]}; do
+        used=
+        for word in "${COMP_WORDS[@]:3}"; do
+            [[ "$word" == "$param" || "$word" == "$param="* ]] && used=1
+        done
+        [[ -z "$used" && "$param" == "$cur"* ]] && COMPREPLY+=("$param")
+    done
+}
+
+complete -F _hpecp_complete hpecp
+"""
+
+
+BASH3_FALLBACK = """\
+if (( BASH_VERSINFO[0] < 4 )); then
+    # 'declare -A' needs bash 4, only complete the commands
+    complete -W "$_HPECP_COMMANDS" hpecp
+else"""
+
+
+def bash_script(metadata):
+    """Return a bash completion script.
+
+    The metadata is stored in associative arrays and matched with bash
+    builtins only, so completing does not start any process.  Bash 3,
+    which has no associative arrays, only completes the commands; the
+    rest of the script is in the else branch of the version check, so
+    sourcing it never needs to return or exit.
+    """
+    functions = metadata["functions"]
+    lines = [
+        "# hpecp bash completion",
+        '_HPECP_COMMANDS="{}"'.format(_words(metadata["commands"])),
+        '_HPECP_SHELLS="{}"'.format(_words(SHELLS)),
+        BASH3_FALLBACK,
+        "declare -A _HPECP_FUNCTIONS=(",
+    ]
+    for module, module_functions in functions.items():
+        lines.append('    [{}]="{}"'.format(module, _words(module_functions)))
+    lines.append(")")
+
+    lines.append("declare -A _HPECP_PARAMS=(")
+    for module, module_functions in functions.items():
+        for function, parameters in module_functions.items():
+            lines.append(
+                '    [{}.{}]="{}"'.format(module, function, _words(parameters))
+            )
+    lines.append(")")
+
+    lines.append("declare -A _HPECP_OUTPUTS=(")
+    for module, module_functions in functions.items():
+        for function, parameters in module_functions.items():
+            if "--output" in parameters:
+                lines.append(
+                    '    [{}.{}]="{}"'.format(
+                        module, function, _words(_output_choices(function))
+                    )
+                )
+    lines.append(")")
+
+    lines.append("declare -A _HPECP_COLUMNS=(")
+    for module, columns in metadata["columns"].items():
+        lines.append('    [{}]="{}"'.format(module, _words(columns)))
+    lines.append(")")
+
+    return "\n".join(lines) + "\n" + BASH_FUNCTIONS + "fi\n"
+
+
+ZSH_FUNCTIONS = r"""
+_hpecp()
+{
+    local module=${words[2]}
+    local function=${words[3]//_/-}
+    local prev=${words[CURRENT-1]}
+
+    if [[ $prev == *'>'* || $prev == --*file ]]; then
+        _files
+        return
+    fi
+
+    if (( CURRENT == 2 )); then
+        compadd -- ${=_hpecp_commands}
+        return
+    fi
+
+    if [[ $module == autocomplete ]]; then
+        (( CURRENT == 3 )) && compadd -- ${=_hpecp_shells}
+        return
+    fi
+
+    if (( CURRENT == 3 )); then
+        compadd -- ${=_hpecp_functions[$module]}
+        return
+    fi
+
+    case $prev in
+        --output)
+            compadd -- ${=_hpecp_outputs[$module.$function]}
+            return
+            ;;
+        --columns)
+            # complete the last of a comma separated list of columns
+            compset -P '*,'
+            local -a columns entered
+            columns=(${=_hpecp_columns[$module]})
+            entered=(${(s:,:)IPREFIX})
+            compadd -S , -q -- ${columns:|entered}
+            return
+            ;;
+    esac
+
+    # the parameters that have not been entered
+    local -a params
+    params=(${=_hpecp_params[$module.$function]})
+    compadd -- ${params:|words}
+}
+
+compdef _hpecp hpecp
+"""
+
+
+def zsh_script(metadata):
+    """Return a zsh completion script, see :py:func:`bash_script`."""
+    functions = metadata["functions"]
+
+    def assoc(name, items):
+        lines = ["typeset -gA {}".format(name), "{}=(".format(name)]
+        for key, words in items:
+            lines.append("    '{}' '{}'".format(key, _words(words)))
+        lines.append(")")
+        return lines
+
+    lines = [
+        "# hpecp zsh completion",
+        "typeset -g _hpecp_commands='{}'".format(_words(metadata["commands"])),
+        "typeset -g _hpecp_shells='{}'".format(_words(SHELLS)),
+    ]
+    lines += assoc("_hpecp_functions", functions.items())
+    lines += assoc(
+        "_hpecp_params",
+        [
+            ("{}.{}".format(module, function), parameters)
+            for module, module_functions in functions.items()
+            for function, parameters in module_functions.items()
+        ],
+    )
+    lines += assoc(
+        "_hpecp_outputs",
+        [
+            ("{}.{}".format(module, function), _output_choices(function))
+            for module, module_functions in functions.items()
+            for function, parameters in module_functions.items()
+            if "--output" in parameters
+        ],
+    )
+    lines += assoc("_hpecp_columns", metadata["columns"].items())
+
+    return "\n".join(lines) + "\n" + ZSH_FUNCTIONS
+
+
+FISH_FUNCTIONS = r"""
+function __hpecp_at
+    # true if the command line is 'hpecp <argv>' followed by the current word
+    set -l tokens (commandline -opc)
+    test (count $tokens) -eq (math (count $argv) + 1)
+    and test "$tokens[2..-1]" = "$argv"
+end
+
+function __hpecp_in
+    # true if the command is 'hpecp <module> <function>'
+    set -l tokens (commandline -opc)
+    test (count $tokens) -ge 3
+    and test "$tokens[2]" = $argv[1]
+    and test (string replace -a _ - -- $tokens[3]) = $argv[2]
+end
+
+function __hpecp_columns
+    # complete the last of a comma separated list of columns
+    set -l prefix (string replace -r '[^,]*$' '' -- (commandline -ct))
+    for column in $argv
+        echo $prefix$column
+    end
+end
+
+complete -c hpecp -f
+"""
+
+
+def fish_script(metadata):
+    """Return a fish completion script, see :py:func:`bash_script`."""
+    lines = [
+        "# hpecp fish completion",
+        FISH_FUNCTIONS,
+        "complete -c hpecp -n '__hpecp_at' -a '{}'".format(
+            _words(metadata["commands"])
+        ),
+        "complete -c hpecp -n '__hpecp_at autocomplete' -a '{}'".format(
+            _words(SHELLS)
+        ),
+    ]
+
+    columns = metadata["columns"]
+    for module, functions in metadata["functions"].items():
+        lines.append(
+            "complete -c hpecp -n '__hpecp_at {}' -a '{}'".format(
+                module, _words(functions)
+            )
+        )
+        for function, parameters in functions.items():
+            condition = "__hpecp_in {} {}".format(module, function)
+            for parameter in parameters:
+                name = parameter[2:]
+                if name == "output":
+                    arguments = " -x -a '{}'".format(
+                        _words(_output_choices(function))
+                    )
+                elif name == "columns":
+                    arguments = " -x -a '(__hpecp_columns {})'".format(
+                        _words(columns.get(module, []))
+                    )
+                elif name.endswith("file"):
+                    arguments = " -r -F"
+                else:
+                    arguments = " -r"
+                lines.append(
+                    "complete -c hpecp -n '{}' -l {}{}".format(
+                        condition, name, arguments
+                    )
+                )
+
+    return "\n".join(lines) + "\n"
@@ -25,7 +25,6 @@ from __future__ import print_function
 import json
 import jmespath
 import sys
-import yaml
 from textwrap import dedent
 
 from hpecp.cli import base
@@ -65,14 +64,7 @@ class ConfigProxy(object):
         response = base.get_client().config.get()
 
         if output == "yaml":
-            print(
-                yaml.dump(
-                    yaml.load(
-                        json.dumps(response),
-                        Loader=yaml.FullLoader,
-                    )
-                )
-            )
+            base.print_yaml(response)
         else:
             if query is None:
                 data = response
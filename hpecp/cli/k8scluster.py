@@ -27,7 +27,6 @@ import base64
 import json
 import six
 import sys
-import yaml
 
 from textwrap import dedent
 
@@ -276,14 +275,7 @@ class K8sClusterProxy(base.BaseProxy):
     def k8smanifest(self):
         """Retrieve the k8smanifest."""
         response = base.get_client().k8s_cluster.k8smanifest()
-        print(
-            yaml.dump(
-                yaml.load(
-                    json.dumps(response),
-                    Loader=yaml.FullLoader,
-                )
-            )
-        )
+        base.print_yaml(response)
 
     @base.intercept_exception
     def get_installed_addons(self, id):
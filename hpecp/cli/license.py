@@ -24,7 +24,6 @@ from __future__ import print_function
 
 import json
 import sys
-import yaml
 
 from hpecp.cli import base
 
@@ -63,14 +62,7 @@ class LicenseProxy(object):
             print("\n".join(response))
         else:
             if output == "yaml":
-                print(
-                    yaml.dump(
-                        yaml.load(
-                            json.dumps(response),
-                            Loader=yaml.FullLoader,
-                        )
-                    )
-                )
+                base.print_yaml(response)
             else:
                 print(json.dumps(response))
 
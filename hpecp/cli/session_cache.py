@@ -0,0 +1,170 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""On-disk cache of controller session ids for the CLI."""
+
+from __future__ import absolute_import
+
+import json
+import os
+import stat
+import time
+
+from hpecp.json_file import write_json_file
+from hpecp.logger import Logger
+
+_log = Logger.get_logger()
+
+
+def session_cache_key(profile, client):
+    """Return the cache key for a client created from a profile.
+
+    Parameters
+    ----------
+    profile : str
+        The CLI configuration profile name
+    client : ContainerPlatformClient
+        The (unauthenticated) client created from the profile
+    """
+    return "|".join(
+        [
+            str(profile),
+            client.base_url,
+            client.username,
+            str(client.tenant_config or ""),
+        ]
+    )
+
+
+class SessionCache(object):
+    """A json file mapping cache keys to controller session ids.
+
+    The file is only ever written with owner read/write permissions and is
+    ignored if anyone else is able to read or modify it.  Entries that have
+    not been used for `ttl_secs` are treated as expired.
+    """
+
+    def __init__(self, path, ttl_secs=1800):
+        """Create a SessionCache instance.
+
+        Parameters
+        ----------
+        path : str
+            The cache file path
+        ttl_secs : int, optional
+            Discard sessions not used for this many seconds, by default 1800
+        """
+        assert isinstance(ttl_secs, int), "'ttl_secs' must be an int"
+        assert ttl_secs > 0, "'ttl_secs' must be > 0"
+
+        self.path = os.path.expanduser(path)
+        self.ttl_secs = ttl_secs
+
+    def _load(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return {}
+
+        if st.st_mode & (stat.S_IRWXG | stat.S_IRWXO) or (
+            hasattr(os, "getuid") and st.st_uid != os.getuid()
+        ):
+            _log.warning(
+                "Ignoring session cache '{}' - it must only be accessible "
+                "by its owner (chmod 600)".format(self.path)
+            )
+            return {}
+
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError) as e:
+            _log.debug("Unable to read session cache: {}".format(e))
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+        return entries
+
+    def _save(self, entries):
+        try:
+            write_json_file(self.path, entries)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            _log.debug("Unable to write session cache: {}".format(e))
+
+    def _expired(self, entry, now):
+        try:
+            return now - float(entry["last_used"]) > self.ttl_secs
+        except (KeyError, TypeError, ValueError):
+            return True
+
+    def get(self, key):
+        """Retrieve a session id.
+
+        Parameters
+        ----------
+        key : str
+            See :py:func:`session_cache_key`
+
+        Returns
+        -------
+        str
+            The session id, or None if not cached or expired
+        """
+        now = time.time()
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is None or self._expired(entry, now):
+            return None
+
+        entry["last_used"] = now
+        self._save(
+            {k: v for k, v in entries.items() if not self._expired(v, now)}
+        )
+        return entry.get("session_id")
+
+    def put(self, key, session_id):
+        """Store a session id.
+
+        Parameters
+        ----------
+        key : str
+            See :py:func:`session_cache_key`
+        session_id : str
+            The controller session id, format: '/api/v1/session/<uuid>'
+        """
+        now = time.time()
+        entries = {
+            k: v for k, v in self._load().items() if not self._expired(v, now)
+        }
+        entries[key] = {"session_id": session_id, "last_used": now}
+        self._save(entries)
+
+    def remove(self, key):
+        """Remove a session id.
+
+        Parameters
+        ----------
+        key : str
+            See :py:func:`session_cache_key`
+        """
+        entries = self._load()
+        if entries.pop(key, None) is not None:
+            self._save(entries)
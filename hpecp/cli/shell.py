@@ -0,0 +1,176 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Interactive shell for the CLI."""
+
+from __future__ import print_function
+
+import cmd
+import shlex
+import sys
+
+import fire
+
+from hpecp.cli.batch import parse_line, system_exit_code
+from hpecp.cli.completion import GET_OUTPUTS, LIST_OUTPUTS
+from hpecp.logger import Logger
+
+_log = Logger.get_logger()
+
+
+class Shell(cmd.Cmd):
+    """Run CLI commands interactively in one process.
+
+    The commands are the same as on the command line without the leading
+    `hpecp`, e.g. `k8sworker list --output text`.  The authenticated client
+    and its caches (config, k8smanifest, worker inventory, ...) are reused
+    by every command.  Tab completes the commands, their parameters and the
+    `--columns` and `--output` values.
+
+    Parameters
+    ----------
+    cli : CLI
+        The CLI instance that runs the commands
+    metadata : tuple, optional
+        (modules, columns) as returned by `AutoComplete._get_metadata()`,
+        by default retrieved from `cli.autocomplete`
+    """
+
+    intro = "hpecp shell - type 'help' for help, 'exit' or Ctrl-D to exit"
+    prompt = "hpecp> "
+
+    def __init__(self, cli, metadata=None, stdin=None, stdout=None):
+        """Create a Shell - see the class docs."""
+        cmd.Cmd.__init__(self, stdin=stdin, stdout=stdout)
+        self.cli = cli
+        self._metadata = metadata
+
+    @property
+    def metadata(self):
+        """The completion metadata, (modules, columns)."""
+        if self._metadata is None:
+            self._metadata = self.cli.autocomplete._get_metadata()
+        return self._metadata
+
+    def cmdloop(self, intro=None):
+        """Run the shell until 'exit' or EOF, Ctrl-C cancels the input."""
+        while True:
+            try:
+                return cmd.Cmd.cmdloop(self, intro)
+            except KeyboardInterrupt:
+                print("^C", file=self.stdout)
+                intro = ""
+
+    def preloop(self):
+        """Only split the input on whitespace when completing."""
+        try:
+            import readline
+
+            readline.set_completer_delims(" \t\n")
+        except ImportError:
+            pass
+
+    def emptyline(self):
+        """Do nothing, rather than repeating the last command."""
+        return False
+
+    def do_exit(self, line):
+        """Exit the shell."""
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, line):
+        """Exit the shell."""
+        print(file=self.stdout)
+        return True
+
+    def do_help(self, line):
+        """Show the help of a command, e.g. 'help k8sworker list'."""
+        self.run(shlex.split(line) + ["--help"] if line else ["--help"])
+
+    def default(self, line):
+        """Run a CLI command."""
+        try:
+            args = parse_line(line)
+        except ValueError as ve:
+            print(ve, file=sys.stderr)
+            return False
+        if args is not None:
+            self.run(args)
+        return False
+
+    def run(self, args):
+        """Run a CLI command from its arguments.
+
+        Returns
+        -------
+        int
+            The exit code of the command
+        """
+        try:
+            fire.Fire(self.cli, command=args, name="hpecp")
+        except SystemExit as se:
+            return system_exit_code(se)
+        except Exception as ex:
+            _log.debug(ex)
+            print(ex, file=sys.stderr)
+            return 1
+        return 0
+
+    def completenames(self, text, *ignored):
+        """Complete the command group names."""
+        names = ["exit", "help", "version"] + list(self.metadata[0])
+        return [name for name in names if name.startswith(text)]
+
+    def completedefault(self, text, line, begidx, endidx):
+        """Complete the commands, parameters and parameter values."""
+        modules, columns = self.metadata
+        words = line[:begidx].split()
+        module = modules.get(words[0]) if words else None
+        if module is None:
+            return []
+
+        # the command, e.g. 'list'
+        if len(words) == 1:
+            return [name for name in module if name.startswith(text)]
+
+        function = words[1]
+        parameters = module.get(function, [])
+        previous = words[-1]
+
+        if previous == "--columns":
+            # complete the last of a comma separated list of columns
+            prefix, _, last = text.rpartition(",")
+            prefix = prefix + "," if prefix else ""
+            return [
+                prefix + column
+                for column in columns.get(words[0], [])
+                if column.startswith(last)
+            ]
+        if previous == "--output":
+            outputs = LIST_OUTPUTS if function == "list" else GET_OUTPUTS
+            return [output for output in outputs if output.startswith(text)]
+
+        return [
+            parameter
+            for parameter in parameters
+            if parameter.startswith(text) and parameter not in words
+        ]
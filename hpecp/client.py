@@ -25,12 +25,14 @@ from __future__ import absolute_import
 import ast
 import codecs
 import json
+import logging
 import os
 import re
+import threading
 from configparser import SafeConfigParser
 
-import pkg_resources
 import requests
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 from six import raise_from
 from urllib3.exceptions import (
@@ -49,6 +51,7 @@ from .exceptions import (
     APIException,
     APIItemConflictException,
     APIItemNotFoundException,
+    APIUnauthorizedException,
     APIUnknownException,
     ContainerPlatformClientException,
 )
@@ -59,9 +62,14 @@ from .k8s_worker import K8sWorkerController
 from .license import LicenseController
 from .lock import LockController
 from .logger import Logger
+from .metadata_cache import MetadataCache
+from .response_cache import ResponseCache
+from .retry import RetryPolicy, RetryStats
 from .role import RoleController
 from .tenant import TenantController
 from .user import UserController
+from .wait import WaitPolicy
+from .worker_inventory import WorkerInventory
 
 try:
     basestring
@@ -69,6 +77,62 @@ except NameError:
     basestring = str
 
 
+def _cache_json(response):
+    """Memoize `response.json()` so the body is only parsed once.
+
+    The parsed body is shared between the debug log and the controllers
+    that consume the response.
+    """
+    parse = response.json
+    cache = []
+
+    def json(**kwargs):
+        if not cache:
+            cache.append(parse(**kwargs))
+        return cache[0]
+
+    response.json = json
+    return response
+
+
+class _PreparedRequest(object):
+    """A request built by `ContainerPlatformClient._prepare_request`."""
+
+    __slots__ = (
+        "url",
+        "http_method",
+        "description",
+        "headers",
+        "payload",
+        "stream",
+        "log_debug",
+        "cache",
+        "cache_key",
+        "cache_entry",
+    )
+
+    def __init__(
+        self,
+        url,
+        http_method,
+        description,
+        headers,
+        payload,
+        stream,
+        log_debug,
+    ):
+        self.url = url
+        self.http_method = http_method
+        self.description = description
+        self.headers = headers
+        self.payload = payload
+        self.stream = stream
+        self.log_debug = log_debug
+        self.cache = None
+        self.cache_key = None
+        self.cache_entry = None
+
+
 class ContainerPlatformClient(object):
     """Client object for HPE Container Platform.
 
@@ -93,6 +157,16 @@ class ContainerPlatformClient(object):
         Disable ssl warnings
     tenant : str (optional)
         The tenant ID, e.g. /api/v1/tenant/2
+    pool_connections : int (optional)
+        Number of per-host connection pools to cache
+    pool_maxsize : int (optional)
+        Maximum number of connections to keep open per host
+    keep_alive : bool (optional)
+        Reuse connections between requests: True|False
+    log_max_body_bytes : int (optional)
+        Maximum length of request/response bodies in the debug log
+    retry_policy : RetryPolicy (optional)
+        When and how to retry failed requests
 
     Returns
     -------
@@ -116,7 +190,15 @@ class ContainerPlatformClient(object):
     @classmethod
     def version(cls):
         """Retrieve the hpecp version information."""
-        return pkg_resources.require("hpecp")[0].version
+        # imported here because pkg_resources is slow to import
+        try:
+            from importlib.metadata import version
+        except ImportError:
+            # python < 3.8
+            import pkg_resources
+
+            return pkg_resources.require("hpecp")[0].version
+        return version("hpecp")
 
     @classmethod
     def create_from_config_file(
@@ -354,6 +436,13 @@ class ContainerPlatformClient(object):
         verify_ssl=True,
         warn_ssl=False,
         tenant=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        keep_alive=True,
+        log_max_body_bytes=None,
+        retry_policy=None,
+        response_cache=None,
+        wait_policy=None,
     ):
         """Create a Client object for interacting with HPE Container Platform.
 
@@ -376,6 +465,29 @@ class ContainerPlatformClient(object):
             Disable ssl warnings, by default False
         tenant : str, optional
             The tenant ID, e.g. /api/v1/tenant/2
+        pool_connections : int, optional
+            Number of per-host connection pools to cache, by default 10
+        pool_maxsize : int, optional
+            Maximum number of connections kept open to each host, by
+            default 10.  Set this to the number of threads making
+            concurrent calls with this client.
+        keep_alive : bool, optional
+            Reuse TCP/TLS connections between requests, by default True
+        log_max_body_bytes : int, optional
+            Truncate request and response bodies written to the debug log
+            to this many characters, by default None (no limit)
+        retry_policy : RetryPolicy, optional
+            See :py:class:`.retry.RetryPolicy`.  By default failed requests
+            are not retried, but a new session is created if the API
+            responds with HTTP 401.
+        response_cache : ResponseCache, optional
+            See :py:class:`.response_cache.ResponseCache`.  If provided, GET
+            requests are revalidated with ETag/Last-Modified instead of
+            always downloading the response body, by default None
+        wait_policy : WaitPolicy, optional
+            See :py:class:`.wait.WaitPolicy`.  Controls how often
+            `wait_for_status()` polls a resource, by default polls start
+            at 1s intervals and slow down to 30s intervals.
         """
         self._log = Logger.get_logger()
 
@@ -396,6 +508,10 @@ class ContainerPlatformClient(object):
                     "verify_ssl": verify_ssl,
                     "warn_ssl": warn_ssl,
                     "tenant": tenant,
+                    "pool_connections": pool_connections,
+                    "pool_maxsize": pool_maxsize,
+                    "keep_alive": keep_alive,
+                    "log_max_body_bytes": log_max_body_bytes,
                 }
             )
         )
@@ -425,6 +541,27 @@ class ContainerPlatformClient(object):
         assert isinstance(
             warn_ssl, bool
         ), "'warn_ssl' parameter must be of type bool"
+        assert (
+            isinstance(pool_connections, int) and pool_connections > 0
+        ), "'pool_connections' parameter must be an int > 0"
+        assert (
+            isinstance(pool_maxsize, int) and pool_maxsize > 0
+        ), "'pool_maxsize' parameter must be an int > 0"
+        assert isinstance(
+            keep_alive, bool
+        ), "'keep_alive' parameter must be of type bool"
+        assert log_max_body_bytes is None or (
+            isinstance(log_max_body_bytes, int) and log_max_body_bytes >= 0
+        ), "'log_max_body_bytes' parameter must be None or an int >= 0"
+        assert retry_policy is None or isinstance(
+            retry_policy, RetryPolicy
+        ), "'retry_policy' parameter must be of type RetryPolicy"
+        assert response_cache is None or isinstance(
+            response_cache, ResponseCache
+        ), "'response_cache' parameter must be of type ResponseCache"
+        assert wait_policy is None or isinstance(
+            wait_policy, WaitPolicy
+        ), "'wait_policy' parameter must be of type WaitPolicy"
 
         self.username = username
         self.password = password
@@ -434,6 +571,24 @@ class ContainerPlatformClient(object):
         self.verify_ssl = verify_ssl
         self.warn_ssl = warn_ssl
         self.tenant_config = tenant
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.log_max_body_bytes = log_max_body_bytes
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_retries=0)
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.response_cache = response_cache
+        if wait_policy is None:
+            wait_policy = WaitPolicy()
+        self.wait_policy = wait_policy
+        self._http_session = None
+        self._http_session_lock = threading.Lock()
+
+        # Optional callable, invoked with this client each time a new
+        # session is created, e.g. to persist the session id
+        self.on_session_created = None
 
         if self.use_ssl:
             scheme = "https"
@@ -460,6 +615,59 @@ class ContainerPlatformClient(object):
         self._role = RoleController(self)
         self._datatap = DatatapController(self)
 
+        # shared by the gateway and epic_worker controllers
+        self._worker_inventory = WorkerInventory(self)
+        self._metadata_cache = MetadataCache(self)
+
+    def __enter__(self):
+        """Return the client for use in a `with` statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the client's pooled connections."""
+        self.close()
+
+    @property
+    def http_session(self):
+        """Retrieve the pooled HTTP session used for all API calls.
+
+        The session is created on first use and is shared by all of the
+        controllers registered with this client so that TCP and TLS
+        connections to the controller are reused between requests.
+
+        Returns
+        -------
+        requests.Session
+        """
+        session = self._http_session
+        if session is None:
+            with self._http_session_lock:
+                # another thread may have created it while we waited
+                session = self._http_session
+                if session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    if not self.keep_alive:
+                        session.headers["Connection"] = "close"
+                    self._http_session = session
+        return session
+
+    def close(self):
+        """Close all pooled connections held by this client.
+
+        The client may still be used after calling close() - a new pool
+        will be created on the next request.
+        """
+        with self._http_session_lock:
+            session, self._http_session = self._http_session, None
+        if session is not None:
+            session.close()
+
     def create_session(self):
         """Create a session with the HPE CP controller.
 
@@ -475,16 +683,7 @@ class ContainerPlatformClient(object):
             requests.exceptions.RequestException
             for exceptions that are not a connection error
         """
-        url = self.base_url + "/api/v1/login"
-        auth = {"name": self.username, "password": self.password}
-
-        if self.tenant_config:
-            auth["tenant"] = self.tenant_config
-
-        if self.warn_ssl is False:
-            import urllib3
-
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        url, auth = self._login_request()
 
         # if self.log.level == 10:  # "DEBUG"
         #     if six.PY3:
@@ -498,8 +697,7 @@ class ContainerPlatformClient(object):
 
         response = None
         try:
-            self.log.debug("REQ: {} : {} {}".format("Login", "post", url))
-            response = requests.post(
+            response = self.http_session.post(
                 url, json=auth, verify=self.verify_ssl, timeout=10
             )  # 10 seconds
             response.raise_for_status()
@@ -510,23 +708,7 @@ class ContainerPlatformClient(object):
             MaxRetryError,
             ConnectTimeoutError,
         ) as e:
-            self.log.debug(
-                "RES: {} : {} {} {}".format("Login", "post", url, str(e))
-            )
-            if self.log.level == 10:  # "DEBUG"
-                # The error is already output to the log, so this message
-                # can be brief.
-                msg = "Could not connect to the controller."
-            else:
-                msg = "Could not connect to the controller.\n" + str(e)
-            raise_from(
-                APIException(
-                    message=msg,
-                    request_method="post",
-                    request_url=url,
-                ),
-                None,
-            )
+            self._raise_login_connection_error(url, e)
 
         except requests.exceptions.RequestException as e:
             if response is not None:
@@ -547,9 +729,76 @@ class ContainerPlatformClient(object):
         #         None,
         #     )
 
+        return self._session_created(response)
+
+    def _login_request(self):
+        """Return the login url and credentials for create_session()."""
+        url = self.base_url + "/api/v1/login"
+        auth = {"name": self.username, "password": self.password}
+
+        if self.tenant_config:
+            auth["tenant"] = self.tenant_config
+
+        if self.warn_ssl is False:
+            import urllib3
+
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        self.log.debug("REQ: {} : {} {}".format("Login", "post", url))
+        return url, auth
+
+    def _raise_login_connection_error(self, url, e):
+        self.log.debug(
+            "RES: {} : {} {} {}".format("Login", "post", url, str(e))
+        )
+        if self.log.level == 10:  # "DEBUG"
+            # The error is already output to the log, so this message
+            # can be brief.
+            msg = "Could not connect to the controller."
+        else:
+            msg = "Could not connect to the controller.\n" + str(e)
+        raise_from(
+            APIException(
+                message=msg,
+                request_method="post",
+                request_url=url,
+            ),
+            None,
+        )
+
+    def _session_created(self, response):
+        """Record the session of a successful login response."""
         self.session_headers = CaseInsensitiveDict(response.headers)
         self.session_id = CaseInsensitiveDict(response.headers)["location"]
 
+        if self.on_session_created is not None:
+            self.on_session_created(self)
+
+        return self
+
+    def resume_session(self, session_id):
+        """Use an existing session instead of logging in again.
+
+        If the session has expired, the client will transparently create
+        a new session the first time the API responds with HTTP 401.
+
+        Parameters
+        ----------
+        session_id : str
+            A session id previously returned by :py:meth:`create_session`,
+            format: '/api/v1/session/<uuid>'
+
+        Returns
+        -------
+        ContainerPlatformClient
+            An instance of ContainerPlatformClient is returned.
+        """
+        assert isinstance(
+            session_id, basestring
+        ), "'session_id' must be provided and must be a string"
+
+        self.session_headers = CaseInsensitiveDict({"location": session_id})
+        self.session_id = session_id
         return self
 
     def _request_headers(self):
@@ -557,9 +806,10 @@ class ContainerPlatformClient(object):
         headers = {
             "accept": "application/json",
             "X-BDS-SESSION": self.session_id,
-            "cache-control": "no-cache",
             "content-type": "application/json",
         }
+        if self.response_cache is None:
+            headers["cache-control"] = "no-cache"
         return headers
 
     def _request(
@@ -570,6 +820,7 @@ class ContainerPlatformClient(object):
         description="",
         create_auth_headers=True,
         additional_headers={},
+        stream=False,
     ):
         """Make HTTP requests to the API host.
 
@@ -589,6 +840,10 @@ class ContainerPlatformClient(object):
         additional_headers : dict, optional
             Any additional headers to be passed while making the request,
             by default {}
+        stream : bool, optional
+            Do not download the body of a successful "get" response until
+            it is read, e.g. with `response.iter_content()`.  The caller
+            must close the response, by default False
 
         Returns
         -------
@@ -599,8 +854,142 @@ class ContainerPlatformClient(object):
         ------
         APIItemNotFoundException
         APIItemConflictException
+        APIUnauthorizedException
+            The request was rejected with HTTP 401 after logging in again
         APIException
         """
+        policy = self.retry_policy
+        policy.deposit()
+        self.retry_stats._record("requests")
+
+        retry_number = 0
+        reauthenticated = False
+        while True:
+            try:
+                return self._do_request(
+                    url,
+                    http_method,
+                    data,
+                    description,
+                    create_auth_headers,
+                    additional_headers,
+                    stream,
+                )
+            except APIUnauthorizedException:
+                if not self._can_reauthenticate(
+                    create_auth_headers, reauthenticated
+                ):
+                    raise
+                reauthenticated = True
+                self.create_session()
+            except APIUnknownException as e:
+                wait_secs = self._retry_wait_secs(
+                    e, http_method, url, retry_number
+                )
+                if wait_secs is None:
+                    raise
+                retry_number += 1
+                policy.sleep(wait_secs)
+
+    def _can_reauthenticate(self, create_auth_headers, reauthenticated):
+        """Return True if a request rejected with HTTP 401 can be repeated.
+
+        The session has expired or was revoked, the caller logs in again
+        and repeats the request once with the new session.
+        """
+        if (
+            not create_auth_headers
+            or not self.retry_policy.reauthenticate
+            or reauthenticated
+        ):
+            return False
+        self.log.debug(
+            "Session {} rejected, creating a new session".format(
+                self.session_id
+            )
+        )
+        self.retry_stats._record("reauthentications")
+        return True
+
+    def _retry_wait_secs(self, e, http_method, url, retry_number):
+        """Return the seconds to wait before retrying a failed request.
+
+        Returns None if the request must not be retried.
+        """
+        policy = self.retry_policy
+        if retry_number >= policy.max_retries or (
+            not policy.is_retryable(http_method, e.status_code)
+        ):
+            return None
+        if not policy.withdraw():
+            self.log.debug(
+                "Retry budget exhausted, not retrying {} {}".format(
+                    http_method, url
+                )
+            )
+            self.retry_stats._record("budget_exhausted")
+            return None
+
+        wait_secs = policy.backoff_secs(retry_number)
+        self.log.debug(
+            "Retry {}/{} of {} {} in {:.2f}s after: {}".format(
+                retry_number + 1,
+                policy.max_retries,
+                http_method,
+                url,
+                wait_secs,
+                e.status_code or "connection error",
+            )
+        )
+        self.retry_stats._record_retry(
+            e.status_code or "connection", wait_secs
+        )
+        return wait_secs
+
+    def _do_request(
+        self,
+        url,
+        http_method,
+        data,
+        description,
+        create_auth_headers,
+        additional_headers,
+        stream=False,
+    ):
+        request = self._prepare_request(
+            url,
+            http_method,
+            data,
+            description,
+            create_auth_headers,
+            additional_headers,
+            stream,
+        )
+
+        response = None
+        try:
+            response = self._send(request)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as re:
+            self._raise_api_exception(request, response, re)
+
+        return self._handle_response(request, response)
+
+    def _prepare_request(
+        self,
+        url,
+        http_method,
+        data,
+        description,
+        create_auth_headers,
+        additional_headers,
+        stream,
+    ):
+        """Build the headers and payload of a request.
+
+        The request is sent with :py:meth:`_send`, or by the
+        :py:class:`.async_client.AsyncContainerPlatformClient`.
+        """
         if create_auth_headers:
             headers = self._request_headers()
         else:
@@ -610,135 +999,237 @@ class ContainerPlatformClient(object):
         all_headers.update(headers)
         all_headers.update(additional_headers)
 
-        url = url = self.base_url + url
+        request = _PreparedRequest(
+            url=self.base_url + url,
+            http_method=http_method,
+            description=description,
+            headers=all_headers,
+            # only serialize the payload once - it is reused for the
+            # request body, the debug log and any exception raised
+            payload=json.dumps(data),
+            stream=stream,
+            log_debug=self.log.isEnabledFor(logging.DEBUG),
+        )
+
+        # conditional GET - see ResponseCache
+        cache = self.response_cache
+        if stream:
+            # the body is not available to store in the cache
+            cache = None
+        if cache is not None and http_method == "get" and create_auth_headers:
+            request.cache = cache
+            request.cache_key = "{}|{}|{}".format(
+                self.username, self.tenant_config or "", request.url
+            )
+            request.cache_entry = cache.lookup(request.cache_key)
+            if request.cache_entry is not None:
+                all_headers.update(
+                    cache.conditional_headers(request.cache_entry)
+                )
 
         if self.warn_ssl is False:
             import urllib3
 
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        try:
-            if http_method == "get":
-                self.log.debug(
-                    "REQ: {} : {} {}".format(description, http_method, url)
-                )
-                response = requests.get(
-                    url, headers=all_headers, verify=self.verify_ssl
-                )
-            elif http_method == "put":
-                self.log.debug(
-                    "REQ: {} : {} {} {}".format(
-                        description, http_method, url, json.dumps(data)
-                    )
-                )
-                response = requests.put(
-                    url,
-                    headers=all_headers,
-                    data=json.dumps(data),
-                    verify=self.verify_ssl,
-                )
-            elif http_method == "post":
-                self.log.debug(
-                    "REQ: {} : {} {} {}".format(
-                        description, http_method, url, json.dumps(data)
-                    )
-                )
-                response = requests.post(
-                    url,
-                    headers=all_headers,
-                    data=json.dumps(data),
-                    verify=self.verify_ssl,
-                )
-            elif http_method == "delete":
-                self.log.debug(
-                    "REQ: {} : {} {}".format(description, http_method, url)
+        return request
+
+    def _log_request(self, request):
+        if not request.log_debug:
+            return
+        if request.http_method in ("put", "post"):
+            self.log.debug(
+                "REQ: {} : {} {} {}".format(
+                    request.description,
+                    request.http_method,
+                    request.url,
+                    self._truncate_log_body(request.payload),
                 )
-                response = requests.delete(
-                    url, headers=all_headers, verify=self.verify_ssl
+            )
+        else:
+            self.log.debug(
+                "REQ: {} : {} {}".format(
+                    request.description, request.http_method, request.url
                 )
+            )
 
-            response.raise_for_status()
-        except requests.exceptions.RequestException as re:
-            try:
-                response_info = response.json()
-            except Exception:
-                response_info = response.text
-            else:
-                response_info = ""
+    def _send(self, request):
+        """Send a prepared request with the pooled :py:attr:`http_session`."""
+        self._log_request(request)
+
+        url = request.url
+        headers = request.headers
+        http_method = request.http_method
+        if http_method == "get":
+            return self.http_session.get(
+                url,
+                headers=headers,
+                verify=self.verify_ssl,
+                stream=request.stream,
+            )
+        elif http_method == "put":
+            return self.http_session.put(
+                url,
+                headers=headers,
+                data=request.payload,
+                verify=self.verify_ssl,
+            )
+        elif http_method == "post":
+            return self.http_session.post(
+                url,
+                headers=headers,
+                data=request.payload,
+                verify=self.verify_ssl,
+            )
+        elif http_method == "delete":
+            return self.http_session.delete(
+                url, headers=headers, verify=self.verify_ssl
+            )
 
-            def log_response():
-                self.log.debug(
-                    "RES: {} : {} {} : {} {}".format(
-                        description,
-                        http_method,
-                        url,
-                        response.status_code,
-                        response_info,
-                    )
-                )
+    def _raise_api_exception(self, request, response, re):
+        """Raise the APIException for a failed request.
 
-            if response.status_code == 403:
-                # This is expected for some method calls so do not log as an
-                # error
-                log_response()
-                raise APIForbiddenException(
-                    message=response_info,
-                    request_method=http_method,
-                    request_url=url,
-                    request_data=json.dumps(data),
-                )
-            if response.status_code == 404:
-                # This is expected for some method calls so do not log as an
-                # error
-                log_response()
-                raise APIItemNotFoundException(
-                    message=response_info,
-                    request_method=http_method,
-                    request_url=url,
-                    request_data=json.dumps(data),
+        Parameters
+        ----------
+        request : _PreparedRequest
+        response : requests.Response
+            None if no response was received
+        re : requests.exceptions.RequestException
+        """
+        description = request.description
+        http_method = request.http_method
+        url = request.url
+        payload = request.payload
+
+        if response is None:
+            # no response was received, e.g. the controller is
+            # unreachable or restarting
+            self.log.debug(
+                "RES: {} : {} {} : {}".format(
+                    description, http_method, url, str(re)
                 )
-            if response.status_code == 409:
-                # This is expected for some method calls so do not log as an
-                # error
-                log_response()
-                raise APIItemConflictException(
-                    message=response_info,
+            )
+            raise_from(
+                APIUnknownException(
+                    message="Could not connect to the controller.\n" + str(re),
                     request_method=http_method,
                     request_url=url,
-                    request_data=json.dumps(data),
-                )
+                    request_data=payload,
+                ),
+                None,
+            )
+
+        try:
+            response_info = response.json()
+        except Exception:
+            response_info = response.text
+        else:
+            response_info = ""
+
+        self.log.debug(
+            "RES: {} : {} {} : {} {}".format(
+                description,
+                http_method,
+                url,
+                response.status_code,
+                response_info,
+            )
+        )
+
+        exception_classes = {
+            401: APIUnauthorizedException,
+            # 403, 404 and 409 are expected for some method calls so they
+            # are not logged as errors
+            403: APIForbiddenException,
+            404: APIItemNotFoundException,
+            409: APIItemConflictException,
+        }
+        if response.status_code in exception_classes:
+            raise self._api_exception(
+                exception_classes[response.status_code],
+                response,
+                message=response_info,
+                request_method=http_method,
+                request_url=url,
+                request_data=payload,
+            )
+        raise self._api_exception(
+            APIUnknownException,
+            response,
+            message=str(re),  # get the exception message
+            request_method=http_method,
+            request_url=url,
+            request_data=payload,
+        )
+
+    def _handle_response(self, request, response):
+        """Apply the response cache and log a successful response."""
+        description = request.description
+        http_method = request.http_method
+        url = request.url
+        log_debug = request.log_debug
+
+        cache = request.cache
+        if cache is not None:
+            if response.status_code == 304 and request.cache_entry is not None:
+                if log_debug:
+                    self.log.debug(
+                        "RES: {} : {} {} : 304 (served from cache)".format(
+                            description, http_method, url
+                        )
+                    )
+                response = cache.hit(request.cache_entry, url)
             else:
-                log_response()
-                raise APIUnknownException(
-                    message=str(re),  # get the exception message
-                    request_method=http_method,
-                    request_url=url,
-                    request_data=json.dumps(data),
+                cache.store(
+                    request.cache_key,
+                    response,
+                    conditional=request.cache_entry is not None,
                 )
 
-        try:
-            self.log.debug(
-                "RES: {} : {} {} : {} {}".format(
-                    description,
-                    http_method,
-                    url,
-                    response.status_code,
-                    json.dumps(response.json()),
+        if request.stream:
+            if log_debug:
+                self.log.debug(
+                    "RES: {} : {} {} : {} (streamed)".format(
+                        description, http_method, url, response.status_code
+                    )
                 )
-            )
-        except ValueError:
+            return response
+
+        _cache_json(response)
+
+        if log_debug:
+            try:
+                body = json.dumps(response.json())
+            except ValueError:
+                body = response.text
             self.log.debug(
                 "RES: {} : {} {} : {} {}".format(
                     description,
                     http_method,
                     url,
                     response.status_code,
-                    response.text,
+                    self._truncate_log_body(body),
                 )
             )
 
         return response
 
+    @staticmethod
+    def _api_exception(exception_class, response, **kwargs):
+        """Create an APIException recording the response status code."""
+        exception = exception_class(**kwargs)
+        exception.status_code = response.status_code
+        return exception
+
+    def _truncate_log_body(self, body):
+        """Shorten a request/response body to `log_max_body_bytes`."""
+        limit = self.log_max_body_bytes
+        if limit is None or body is None or len(body) <= limit:
+            return body
+        return "{}... [truncated {} of {} bytes]".format(
+            body[:limit], len(body) - limit, len(body)
+        )
+
     @property
     def tenant(self):
         """Retrieve a reference to `.tenant.TenantController` object.
@@ -1025,3 +1516,41 @@ class ContainerPlatformClient(object):
         >>> client.datatap.get()
         """
         return self._datatap
+
+    @property
+    def worker_inventory(self):
+        """Retrieve a reference to a `.worker_inventory.WorkerInventory`.
+
+        The inventory is shared by the gateway and epic_worker controllers
+        so that `/api/v1/workers` is only retrieved once per refresh window.
+
+        Example
+        -------
+        Retrieve the gateways and EPIC workers with a single request:
+
+        >>> client = ContainerPlatformClient(...)
+        >>> client.create_session()
+        >>> client.gateway.list()
+        >>> client.epic_worker.list()
+
+        Always retrieve the latest workers:
+
+        >>> client.worker_inventory.refresh_secs = 0
+        """
+        return self._worker_inventory
+
+    @property
+    def metadata_cache(self):
+        """Retrieve a reference to a `.metadata_cache.MetadataCache`.
+
+        The cache holds the json of `/api/v1/config`,
+        `/api/v2/k8smanifest` and `/api/v1/install` for a limited time.
+
+        Example
+        -------
+        >>> client = ContainerPlatformClient(...)
+        >>> client.create_session()
+        >>> client.config.get()
+        >>> client.metadata_cache.stats()
+        """
+        return self._metadata_cache
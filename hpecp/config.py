@@ -26,12 +26,14 @@ class ConfigController:
         self.client = client
 
     def get(self):
-        response = self.client._request(
-            url="/api/v1/config",
-            http_method="get",
-            description="config/get",
+        """Retrieve the platform configuration.
+
+        The response is cached by the client's
+        :py:class:`.metadata_cache.MetadataCache`.
+        """
+        return self.client.metadata_cache.get(
+            "/api/v1/config", description="config/get"
         )
-        return response.json()
 
     def auth(self, data):
         """
@@ -57,3 +59,4 @@ class ConfigController:
             data=data,
             description="config/auth",
         )
+        self.client.metadata_cache.invalidate("/api/v1/config")
@@ -109,6 +109,7 @@ class DatatapController(AbstractResourceController):
     base_resource_path = "/api/v1/dataconn"
 
     resource_list_path = "data_connectors"
+    index_fields = ["name", "type", "status"]
 
     resource_class = Datatap
 
@@ -196,3 +197,4 @@ class DatatapController(AbstractResourceController):
             description="datatap/create",
             data=_data,
         )
+        self.store.invalidate()
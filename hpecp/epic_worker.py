@@ -26,11 +26,7 @@ from requests.structures import CaseInsensitiveDict
 
 from hpecp.exceptions import APIItemNotFoundException
 
-from .base_resource import (
-    AbstractResource,
-    AbstractWaitableResourceController,
-    ResourceList,
-)
+from .base_resource import AbstractResource, AbstractWaitableResourceController
 
 try:
     basestring
@@ -101,12 +97,14 @@ class EpicWorkerController(AbstractWaitableResourceController):
     base_resource_path = "/api/v1/workers"
 
     resource_list_path = "workers"
+    index_fields = ["ip", "state", "purpose"]
 
     resource_class = WorkerEpic
 
     status_class = WorkerEpicStatus
 
     status_fieldname = "state"
+    error_status = [WorkerEpicStatus.error, WorkerEpicStatus.storage_error]
 
     # TODO implement me!
     # def create_with_ssh_password(self, username, password):
@@ -155,6 +153,8 @@ class EpicWorkerController(AbstractWaitableResourceController):
             data=data,
             description="EpicWorkerController/create_with_ssh_key",
         )
+        self.client.worker_inventory.invalidate()
+        self.store.invalidate()
         return CaseInsensitiveDict(response.headers)["location"]
 
     def get(self, id, params={}):
@@ -174,7 +174,18 @@ class EpicWorkerController(AbstractWaitableResourceController):
         ------
         APIException
         """
-        worker = super(EpicWorkerController, self).get(id, params)
+        # use the shared worker inventory if it was recently retrieved
+        json = None
+        if not params and isinstance(id, basestring):
+            json = self.client.worker_inventory.get(id)
+
+        if json is not None:
+            worker = self.resource_class(json)
+        else:
+            worker = super(EpicWorkerController, self).get(id, params)
+            if not params:
+                self.client.worker_inventory.update(worker.json)
+
         if worker.purpose != "worker":
             raise APIItemNotFoundException(
                 message="worker not found with id: " + id,
@@ -183,20 +194,57 @@ class EpicWorkerController(AbstractWaitableResourceController):
             )
         return worker
 
-    def list(self):
+    def delete(self, id):
+        """Make an API call to delete a Worker.
+
+        Parameters
+        ----------
+        id: str
+            The worker ID - format: '/api/v1/workers/[0-9]+'
+
+        Raises
+        ------
+        APIException
+        """
+        super(EpicWorkerController, self).delete(id)
+        self.client.worker_inventory.invalidate()
+
+    def list(self, filters=None, fields=None, compact=False):
         """Make an API call to retrieve a list of Resources.
 
+        The workers are retrieved with the shared
+        :py:class:`.worker_inventory.WorkerInventory`.
+
+        Parameters
+        ----------
+        filters : dict, optional
+            See :py:meth:`.base_resource.AbstractResourceController.list`
+        fields : list[str], optional
+            Only extract these fields, implies `compact`
+        compact : bool, optional
+            Return read-only CompactResource instances without the raw
+            json, by default False
+
         Returns
         -------
         ResourceList
             The ResourceList will contain instances of the class defined by
             the property self.resource_class
         """
-        resourceList = super(EpicWorkerController, self).list()
-        workers = [
-            wkr for wkr in resourceList.json if wkr["purpose"] == "worker"
-        ]
-        return ResourceList(self.resource_class, workers)
+        filters = self._check_list_args(filters, fields)
+        return self._list_result(
+            self.client.worker_inventory.workers(purpose="worker"),
+            filters,
+            fields,
+            compact,
+        )
+
+    def _iter_list_json(self, chunk_size, url=None):
+        for json in super(EpicWorkerController, self)._iter_list_json(
+            chunk_size, url
+        ):
+            if json.get("purpose") == "worker":
+                yield json
 
     def set_storage(self, worker_id, ephemeral_disks=[], persistent_disks=[]):
         """Set storage for a Epic worker.
@@ -249,3 +297,5 @@ class EpicWorkerController(AbstractWaitableResourceController):
             data=data,
             description="worker/set_storage",
         )
+        self.client.worker_inventory.invalidate()
+        self.client.metadata_cache.invalidate("/api/v1/install")
@@ -26,6 +26,10 @@ class ContainerPlatformClientException(Exception):
 
 
 class APIException(Exception):
+
+    # the HTTP status code of the response, None if no response was received
+    status_code = None
+
     def __init__(
         self, message, request_method, request_url, request_data=None, *args
     ):
@@ -42,6 +46,12 @@ class APIUnknownException(APIException):
     pass
 
 
+class APIUnauthorizedException(APIUnknownException):
+    """The session is missing, invalid or has expired (HTTP 401)."""
+
+    pass
+
+
 class APIItemNotFoundException(APIException):
     def __init__(
         self, message, request_method, request_url, request_data=None, *args
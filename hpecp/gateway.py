@@ -24,8 +24,6 @@ from enum import Enum
 
 from requests.structures import CaseInsensitiveDict
 
-from hpecp.base_resource import ResourceList
-
 from .base_resource import AbstractResource, AbstractWaitableResourceController
 from .exceptions import APIItemNotFoundException
 
@@ -193,12 +191,14 @@ class GatewayController(AbstractWaitableResourceController):
     base_resource_path = "/api/v1/workers"
 
     resource_list_path = "workers"
+    index_fields = ["ip", "hostname", "state", "purpose"]
 
     resource_class = Gateway
 
     status_class = GatewayStatus
 
     status_fieldname = "state"
+    error_status = [GatewayStatus.error, GatewayStatus.storage_error]
 
     # def create_with_ssh_password(self, username, password):
     #     """Not Implemented yet"""
@@ -266,15 +266,19 @@ class GatewayController(AbstractWaitableResourceController):
             data=data,
             description="gateway/create_with_ssh_key",
         )
+        self.client.worker_inventory.invalidate()
+        self.store.invalidate()
         return CaseInsensitiveDict(response.headers)["location"]
 
-    def get(self, id):
+    def get(self, id, params={}):
         """Retrieve a Gateway by ID.
 
         Parameters
         ----------
         id: str
             The gateway ID - format: '/api/v1/workers/[0-9]+'
+        params: dict, optional
+            API Parameters.
 
         Returns
         -------
@@ -285,7 +289,18 @@ class GatewayController(AbstractWaitableResourceController):
         ------
         APIException
         """
-        worker = super(GatewayController, self).get(id)
+        # use the shared worker inventory if it was recently retrieved
+        json = None
+        if not params and isinstance(id, basestring):
+            json = self.client.worker_inventory.get(id)
+
+        if json is not None:
+            worker = self.resource_class(json)
+        else:
+            worker = super(GatewayController, self).get(id, params)
+            if not params:
+                self.client.worker_inventory.update(worker.json)
+
         if worker.purpose != "proxy":
             raise APIItemNotFoundException(
                 message="gateway not found with id: " + id,
@@ -294,21 +309,67 @@ class GatewayController(AbstractWaitableResourceController):
             )
         return worker
 
-    def list(self):
+    def delete(self, id):
+        """Make an API call to delete a Gateway.
+
+        Parameters
+        ----------
+        id: str
+            The gateway ID - format: '/api/v1/workers/[0-9]+'
+
+        Raises
+        ------
+        APIException
+        """
+        super(GatewayController, self).delete(id)
+        self.client.worker_inventory.invalidate()
+
+    def list(self, filters=None, fields=None, compact=False):
         """Make an API call to retrieve a list of Resources.
 
+        The workers are retrieved with the shared
+        :py:class:`.worker_inventory.WorkerInventory`.
+
+        Parameters
+        ----------
+        filters : dict, optional
+            See :py:meth:`.base_resource.AbstractResourceController.list`
+        fields : list[str], optional
+            Only extract these fields, implies `compact`
+        compact : bool, optional
+            Return read-only CompactResource instances without the raw
+            json, by default False
+
         Returns
         -------
         ResourceList
             The ResourceList will contain instances of the class defined by
             the property self.resource_class
         """
-        resourceList = super(GatewayController, self).list()
-        gateways = [gw for gw in resourceList.json if gw["purpose"] == "proxy"]
-        return ResourceList(self.resource_class, gateways)
+        filters = self._check_list_args(filters, fields)
+        return self._list_result(
+            self.client.worker_inventory.workers(purpose="proxy"),
+            filters,
+            fields,
+            compact,
+        )
+
+    def _iter_list_json(self, chunk_size, url=None):
+        for json in super(GatewayController, self)._iter_list_json(
+            chunk_size, url
+        ):
+            if json.get("purpose") == "proxy":
+                yield json
 
     # TODO refactor clients so implementation not required
-    def wait_for_state(self, gateway_id, state=[], timeout_secs=1200):
+    def wait_for_state(
+        self,
+        gateway_id,
+        state=[],
+        timeout_secs=1200,
+        wait_policy=None,
+        poll_interval_secs=None,
+    ):
         return super(GatewayController, self).wait_for_state(
-            gateway_id, state, timeout_secs
+            gateway_id, state, timeout_secs, wait_policy, poll_interval_secs
         )
@@ -32,17 +32,17 @@ class InstallController:
     def get(self):
         """Get Install information.
 
+        The response is cached by the client's
+        :py:class:`.metadata_cache.MetadataCache`.
+
         Returns
         -------
         [type]
             [description]
         """
-        response = self.client._request(
-            url="/api/v1/install",
-            http_method="get",
-            description="install/get",
+        return self.client.metadata_cache.get(
+            "/api/v1/install", description="install/get"
         )
-        return response.json()
 
     def set_gateway_ssl(
         self, cert_content, cert_file_name, key_content, key_file_name
@@ -67,3 +67,4 @@ class InstallController:
             data=_data,
             description="install/set_gateway_ssl",
         )
+        self.client.metadata_cache.invalidate("/api/v1/install")
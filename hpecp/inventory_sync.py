@@ -0,0 +1,236 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Incremental synchronisation of a controller's list."""
+
+from __future__ import absolute_import
+
+import hashlib
+import json as _json
+import threading
+
+from .logger import Logger
+
+_log = Logger.get_logger()
+
+
+def content_hash(json):
+    """Return the SHA-1 hex digest of a resource's canonical json.
+
+    Equal json always gives the same digest, also across processes and
+    regardless of the key order.
+
+    Parameters
+    ----------
+    json : dict
+        The resource json returned by the API
+
+    Returns
+    -------
+    str
+    """
+    canonical = _json.dumps(json, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+class ResourceChange(object):
+    """A resource that was added, removed or changed between two syncs.
+
+    The resource object is only created when :py:attr:`resource` or
+    :py:attr:`previous` is accessed.
+    """
+
+    __slots__ = ("kind", "id", "json", "previous_json", "_resource_class")
+
+    added = "added"
+    removed = "removed"
+    changed = "changed"
+
+    def __init__(self, kind, id, json, previous_json, resource_class):
+        self.kind = kind
+        self.id = id
+        self.json = json
+        self.previous_json = previous_json
+        self._resource_class = resource_class
+
+    @property
+    def resource(self):
+        """The resource after the change, None if it was removed."""
+        if self.json is None:
+            return None
+        return self._resource_class(self.json)
+
+    @property
+    def previous(self):
+        """The resource before the change, None if it was added."""
+        if self.previous_json is None:
+            return None
+        return self._resource_class(self.previous_json)
+
+    def __repr__(self):
+        return "<ResourceChange {} {}>".format(self.kind, self.id)
+
+
+class InventorySync(object):
+    """Keep the last snapshot of a controller's list and report changes.
+
+    Each call to :py:meth:`sync` retrieves the list, compares a content
+    hash of every resource with the previous snapshot (keyed by
+    `_links.self.href`) and returns the resources that were added, removed
+    or changed.  The comparison is linear in the number of resources, and
+    resource objects are only created for the changes.
+
+    Parameters
+    ----------
+    controller : AbstractResourceController
+        The controller whose list is synchronised.
+
+    Example
+    -------
+    >>> sync = InventorySync(client.k8s_worker)
+    >>> sync.add_listener(lambda change: print(change.kind, change.id))
+    >>> sync.sync()  # every resource is reported as added
+    >>> sync.sync()  # only the resources that changed are reported
+    """
+
+    def __init__(self, controller):
+        """Create an InventorySync - see the class docs."""
+        self.controller = controller
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._hashes = {}
+        self._snapshot = {}
+
+    def add_listener(self, callback):
+        """Call `callback(change)` for each change found by :py:meth:`sync`.
+
+        Parameters
+        ----------
+        callback : callable
+            Called with a :py:class:`ResourceChange`
+        """
+        assert callable(callback), "'callback' must be callable"
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stop calling a callback registered with :py:meth:`add_listener`."""
+        self._listeners.remove(callback)
+
+    @property
+    def snapshot(self):
+        """The json of the last sync keyed by resource id.
+
+        :type: dict
+        """
+        with self._lock:
+            return dict(self._snapshot)
+
+    def reset(self):
+        """Discard the snapshot so the next sync reports every resource."""
+        with self._lock:
+            self._hashes = {}
+            self._snapshot = {}
+
+    def sync(self):
+        """Retrieve the list and report the changes since the last sync.
+
+        Returns
+        -------
+        list[ResourceChange]
+            The added and changed resources in list order, followed by the
+            removed resources.
+        """
+        items = self.controller.list().json
+        changes = self.diff(items)
+        for change in changes:
+            for listener in list(self._listeners):
+                listener(change)
+        return changes
+
+    def diff(self, items):
+        """Replace the snapshot with `items` and return the changes.
+
+        Parameters
+        ----------
+        items : list[dict]
+            The resource json returned by the API
+
+        Returns
+        -------
+        list[ResourceChange]
+        """
+        resource_class = self.controller.resource_class
+        hashes = {}
+        snapshot = {}
+        changes = []
+
+        with self._lock:
+            previous_hashes = self._hashes
+            previous_snapshot = self._snapshot
+
+            for item in items:
+                id = item["_links"]["self"]["href"]
+                digest = content_hash(item)
+                hashes[id] = digest
+                snapshot[id] = item
+
+                previous = previous_hashes.get(id)
+                if previous is None:
+                    changes.append(
+                        ResourceChange(
+                            ResourceChange.added,
+                            id,
+                            item,
+                            None,
+                            resource_class,
+                        )
+                    )
+                elif previous != digest:
+                    changes.append(
+                        ResourceChange(
+                            ResourceChange.changed,
+                            id,
+                            item,
+                            previous_snapshot[id],
+                            resource_class,
+                        )
+                    )
+
+            for id, item in previous_snapshot.items():
+                if id not in hashes:
+                    changes.append(
+                        ResourceChange(
+                            ResourceChange.removed,
+                            id,
+                            None,
+                            item,
+                            resource_class,
+                        )
+                    )
+
+            self._hashes = hashes
+            self._snapshot = snapshot
+
+        _log.debug(
+            "InventorySync: {} {} resources, {} changes".format(
+                len(snapshot), resource_class.__name__, len(changes)
+            )
+        )
+        return changes
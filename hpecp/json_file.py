@@ -0,0 +1,64 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Atomic writes of the json files cached on disk."""
+
+from __future__ import absolute_import
+
+import json
+import os
+import tempfile
+
+
+def write_json_file(path, data):
+    """Replace the file `path` with the json of `data`.
+
+    The json is written to a temporary file in the same directory that is
+    then renamed to `path`.  The rename is atomic, so concurrent readers,
+    e.g. other CLI invocations, never see a partial file.  The temporary
+    file is created with mode 0600, so the file is only accessible by its
+    owner, and it is removed if writing or renaming it fails.
+
+    Parameters
+    ----------
+    path : str
+        The file to write, its directory must exist
+    data : object
+        Data that json can serialize
+
+    Raises
+    ------
+    IOError, OSError
+        If the file could not be written
+    TypeError, ValueError
+        If `data` can not be serialized, `path` is not changed
+    """
+    # serialize first, so that bad data never creates a temporary file
+    content = json.dumps(data)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".hpecp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.rename(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,174 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Incremental parsing of json arrays from a response stream."""
+
+from __future__ import absolute_import
+
+import codecs
+import json
+from json.decoder import scanstring
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _Reader(object):
+    """A text buffer that is refilled from an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+
+    def more(self):
+        """Append the next chunk to the buffer, return False at the end."""
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = self.decoder.decode(chunk)
+            if chunk:
+                # drop the consumed text so the buffer stays small
+                start = self.pos
+                self.buf = self.buf[start:] + chunk
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self):
+        """Return the next non-whitespace character, None at the end."""
+        while True:
+            while self.pos < len(self.buf):
+                if self.buf[self.pos] not in _WHITESPACE:
+                    return self.buf[self.pos]
+                self.pos += 1
+            if not self.more():
+                return None
+
+    def read_string(self):
+        """Read the json string starting at pos, return its value."""
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos + 1)
+            except ValueError:
+                if not self.more():
+                    raise
+                continue
+            self.pos = end
+            return value
+
+    def read_value(self, decoder):
+        """Decode the json value starting at pos."""
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if not self.more():
+                    raise
+                continue
+            # a number may continue in the next chunk, e.g. '95881.' is
+            # decoded as 95881 if the chunk ends after the '.'
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and all(c in _NUMBER_CHARS for c in self.buf[end:])
+                and self.more()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks, path):
+    """Yield the items of a json array nested in a json object.
+
+    Only the text up to the end of the array is read, and only one array
+    item is decoded at a time, so large responses can be processed without
+    loading the whole document.
+
+    Parameters
+    ----------
+    chunks : iterable
+        The document as str or utf-8 bytes chunks, e.g.
+        `response.iter_content(chunk_size)`
+    path : list[str]
+        The object keys leading to the array, e.g. ['_embedded', 'users']
+
+    Returns
+    -------
+    generator
+        The decoded array items.  Nothing is yielded if the document has
+        no array at `path`.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid json
+    """
+    reader = _Reader(chunks)
+    decoder = json.JSONDecoder()
+    path = list(path)
+
+    # each open container is [is_object, key, expecting_key]
+    stack = []
+
+    while True:
+        char = reader.peek()
+        if char is None:
+            return
+
+        if char == '"':
+            value = reader.read_string()
+            if stack and stack[-1][0] and stack[-1][2]:
+                stack[-1][1] = value
+            continue
+
+        reader.pos += 1
+
+        if char == "{":
+            stack.append([True, None, True])
+        elif char == "[":
+            keys = [frame[1] for frame in stack if frame[0]]
+            if len(keys) == len(stack) == len(path) and keys == path:
+                break
+            stack.append([False, None, False])
+        elif char in "}]":
+            if not stack:
+                raise ValueError("Unexpected '{}'".format(char))
+            stack.pop()
+            if not stack:
+                return
+        elif char == ":":
+            stack[-1][2] = False
+        elif char == ",":
+            if stack[-1][0]:
+                stack[-1][2] = True
+
+    # the array at path was found - decode one item at a time
+    while True:
+        char = reader.peek()
+        if char is None:
+            raise ValueError("Unterminated array")
+        if char == "]":
+            return
+        if char == ",":
+            reader.pos += 1
+            continue
+        yield reader.read_value(decoder)
@@ -21,7 +21,6 @@
 from __future__ import absolute_import
 
 import re
-from distutils.version import LooseVersion
 from enum import Enum
 
 from requests.structures import CaseInsensitiveDict
@@ -274,12 +273,14 @@ class K8sClusterController(AbstractWaitableResourceController):
     base_resource_path = "/api/v2/k8scluster"
 
     resource_list_path = "k8sclusters"
+    index_fields = ["name", "status"]
 
     resource_class = K8sCluster
 
     status_class = K8sClusterStatus
 
     status_fieldname = "status"
+    error_status = [K8sClusterStatus.error]
 
     def create(
         self,
@@ -420,6 +421,9 @@ class K8sClusterController(AbstractWaitableResourceController):
         if datafabric:
             data["datafabric"] = True
             data["datafabric_name"] = datafabric_name
+        # distutils is slow to import, only import it when it is needed
+        from distutils.version import LooseVersion
+
         if LooseVersion(
             self.client.config.get()["objects"]["bds_global_version"]
         ) <= LooseVersion("5.1"):
@@ -437,6 +441,7 @@ class K8sClusterController(AbstractWaitableResourceController):
             data=data,
             description="k8s_cluster/create",
         )
+        self.store.invalidate()
         return CaseInsensitiveDict(response.headers)["Location"]
 
     def get(self, id, params={}, setup_log=False):
@@ -455,6 +460,9 @@ class K8sClusterController(AbstractWaitableResourceController):
     def k8smanifest(self):
         """Retrieve the k8smanifest.
 
+        The response is cached by the client's
+        :py:class:`.metadata_cache.MetadataCache`.
+
         Returns
         -------
         json
@@ -464,12 +472,9 @@ class K8sClusterController(AbstractWaitableResourceController):
         ------
         APIException
         """
-        response = self.client._request(
-            url="/api/v2/k8smanifest",
-            http_method="get",
-            description="k8s_cluster/k8smanifest",
+        return self.client.metadata_cache.get(
+            "/api/v2/k8smanifest", description="k8s_cluster/k8smanifest"
         )
-        return response.json()
 
     def k8s_supported_versions(self):
         """Retrieve list of K8S Supported Versions.
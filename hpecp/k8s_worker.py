@@ -95,12 +95,14 @@ class K8sWorkerController(AbstractWaitableResourceController):
     base_resource_path = "/api/v2/worker/k8shost"
 
     resource_list_path = "k8shosts"
+    index_fields = ["ipaddr", "hostname", "status"]
 
     resource_class = WorkerK8s
 
     status_class = WorkerK8sStatus
 
     status_fieldname = "status"
+    error_status = [WorkerK8sStatus.error, WorkerK8sStatus.storage_error]
 
     # TODO implement me!
     # def create_with_ssh_password(self, username, password):
@@ -155,6 +157,7 @@ class K8sWorkerController(AbstractWaitableResourceController):
             data=data,
             description="K8sWorkerController/create_with_ssh_key",
         )
+        self.store.invalidate()
         return CaseInsensitiveDict(response.headers)["location"]
 
     def get(self, id, params=None, setup_log=False):
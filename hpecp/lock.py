@@ -21,10 +21,14 @@
 from __future__ import absolute_import
 
 import re
+import sys
+import time
+from contextlib import contextmanager
 
-import polling
+import six
 from requests.structures import CaseInsensitiveDict
 
+from .exceptions import APIException, ContainerPlatformClientException
 from .logger import Logger
 
 _log = Logger.get_logger()
@@ -35,6 +39,54 @@ except NameError:
     basestring = str
 
 
+class LockState:
+    """A snapshot of the platform lock state, see `LockController.state()`.
+
+    Parameters
+    ----------
+    json : dict
+        The response json of '/api/v1/lock'
+    """
+
+    def __init__(self, json):
+        self.json = json
+
+    @property
+    def locked(self):
+        """@Field: from json['locked']"""
+        return self.json.get("locked", False)
+
+    @property
+    def quiesced(self):
+        """@Field: from json['quiesced']"""
+        return self.json.get("quiesced", False)
+
+    @property
+    def internal_locks(self):
+        """@Field: from json['_embedded']['internal_locks']"""
+        return self.json["_embedded"]["internal_locks"]
+
+    @property
+    def external_locks(self):
+        """@Field: from json['_embedded']['external_locks']"""
+        return self.json["_embedded"]["external_locks"]
+
+    @property
+    def external_lock_ids(self):
+        """The ids of the external locks, format: '/api/v1/lock/[0-9]+'"""
+        return [lock["_links"]["self"]["href"] for lock in self.external_locks]
+
+    def __repr__(self):
+        return (
+            "<LockState locked={} quiesced={} internal={} external={}>".format(
+                self.locked,
+                self.quiesced,
+                len(self.internal_locks),
+                len(self.external_locks),
+            )
+        )
+
+
 class LockController:
     def __init__(self, client):
         self.client = client
@@ -49,9 +101,66 @@ class LockController:
         """Retrieve the locks"""
         return self.get()
 
+    def state(self):
+        """Retrieve the locks as a `LockState` snapshot.
+
+        Returns
+        -------
+        LockState
+        """
+        return LockState(self.get())
+
+    def watch(self, condition, timeout_secs=300, wait_policy=None):
+        """Wait for the lock state to satisfy a condition.
+
+        The lock state is retrieved once per poll.  Polls start quickly
+        and slow down as described by the client's `wait_policy`.
+
+        Parameters
+        ----------
+        condition : callable
+            Called with a `LockState`, returns True to stop waiting
+        timeout_secs : int
+            How long to wait for the condition
+        wait_policy : WaitPolicy, optional
+            By default the client's `wait_policy`
+
+        Returns
+        -------
+        LockState
+            The state that satisfied `condition`, or None on timeout
+
+        Raises
+        ------
+        APIException
+
+        Example
+        -------
+        >>> client.lock.watch(lambda s: not s.internal_locks, 60)
+        """
+        if wait_policy is None:
+            wait_policy = self.client.wait_policy
+
+        start = time.time()
+        poll_number = 0
+        while True:
+            state = self.state()
+            _log.debug("In poll loop - {}".format(state))
+            if condition(state):
+                return state
+
+            remaining = timeout_secs - (time.time() - start)
+            if remaining <= 0:
+                return None
+            time.sleep(min(wait_policy.interval_secs(poll_number), remaining))
+            poll_number += 1
+
     def create(self, reason=None, timeout_secs=300):
         """Create a new lock.
 
+        If the platform is not locked and quiesced within `timeout_secs`
+        the lock is deleted again so that it is not left behind.
+
         Arguments
         ---------
         reason: str
@@ -59,6 +168,12 @@ class LockController:
         timeout_secs: int
             Time to wait for lock to be successful
 
+        Returns
+        -------
+        str
+            The lock id, or False if the lock was not successful within
+            `timeout_secs`
+
         Raises
         ------
         APIException
@@ -74,28 +189,60 @@ class LockController:
 
         if timeout_secs == 0:
             return lock_id
-        else:
-            try:
 
-                def poll():
-                    locked = self.get()["locked"]
-                    quiesced = self.get()["quiesced"]
-                    _log.debug(
-                        "In poll loop - locked={} quiesced={}".format(
-                            locked, quiesced
-                        )
-                    )
-                    return locked and quiesced
-
-                polling.poll(
-                    lambda: poll(),
-                    step=10,
-                    poll_forever=False,
-                    timeout=timeout_secs,
-                )
-                return lock_id
-            except polling.TimeoutException:
-                return False
+        if self.watch(lambda s: s.locked and s.quiesced, timeout_secs):
+            return lock_id
+
+        try:
+            self.delete(lock_id)
+        except APIException as e:
+            _log.warning("Unable to delete lock {}: {}".format(lock_id, e))
+        return False
+
+    @contextmanager
+    def hold(self, reason=None, timeout_secs=300):
+        """Lock the platform for the duration of a `with` block.
+
+        The lock is created and the platform quiesced before the block is
+        entered.  The lock is always deleted when the block exits, even if
+        it raises an exception - then a failure to delete the lock is
+        logged and the exception of the block is raised.
+
+        Parameters
+        ----------
+        reason: str
+            Provide a reason for the lock.
+        timeout_secs: int
+            Time to wait for lock to be successful
+
+        Raises
+        ------
+        ContainerPlatformClientException
+            If the lock was not successful within `timeout_secs`
+        APIException
+
+        Example
+        -------
+        >>> with client.lock.hold("upgrade k8s"):
+        ...     client.k8s_cluster.upgrade_cluster(...)
+        """
+        lock_id = self.create(reason, timeout_secs)
+        if lock_id is False:
+            raise ContainerPlatformClientException(
+                "Unable to lock within '{}'".format(timeout_secs)
+            )
+        try:
+            yield lock_id
+        except BaseException:
+            # don't hide the exception of the block if the delete fails
+            exc_info = sys.exc_info()
+            try:
+                self.delete(lock_id)
+            except Exception as e:
+                _log.error("Unable to delete lock '{}': {}".format(lock_id, e))
+            six.reraise(*exc_info)
+        else:
+            self.delete(lock_id)
 
     def delete(self, lock_id):
         """Delete a lock.
@@ -137,21 +284,15 @@ class LockController:
         """
 
         try:
-            polling.poll(
-                lambda: len(self.get()["_embedded"]["internal_locks"]) == 0,
-                step=10,
-                poll_forever=False,
-                timeout=timeout_secs,
-            )
-        except polling.TimeoutException:
-            return False
+            state = self.watch(lambda s: not s.internal_locks, timeout_secs)
         except Exception as e:
             self.client.log.error(e)
             return False
 
-        if len(self.get()["_embedded"]["external_locks"]) > 0:
-            for lock in self.get()["_embedded"]["external_locks"]:
-                lock_id = lock["_links"]["self"]["href"]
-                self.delete(lock_id)
+        if state is None:
+            return False
+
+        for lock_id in state.external_lock_ids:
+            self.delete(lock_id)
 
         return True
@@ -0,0 +1,143 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Time based cache for API responses that rarely change."""
+
+from __future__ import absolute_import
+
+import copy
+import threading
+import time
+
+
+class MetadataCache(object):
+    """Cache the json of near-static API endpoints for a limited time.
+
+    The platform configuration, k8s manifest and install information are
+    needed by several controller methods (e.g. the platform version on each
+    :py:meth:`.k8s_cluster.K8sClusterController.create`) but change very
+    rarely.  Each endpoint has its own time-to-live, after which the next
+    call retrieves it again.
+
+    An instance of this class is available in the
+    client.ContainerPlatformClient with the attribute name
+    :py:attr:`metadata_cache <.client.ContainerPlatformClient.metadata_cache>`.
+
+    Each call returns its own copy of the json, which callers may modify.
+
+    Parameters
+    ----------
+    client : ContainerPlatformClient
+        client instance for working with the HPE CP API.
+    ttls : dict, optional
+        Time-to-live in seconds keyed by url, merged with `default_ttls`.
+        A ttl of 0 disables caching for the url.
+
+    Example
+    -------
+    >>> client.metadata_cache.ttls["/api/v2/k8smanifest"] = 0
+    >>> client.metadata_cache.invalidate("/api/v1/config")
+    >>> client.metadata_cache.stats()
+    {'/api/v1/config': {'hits': 49, 'misses': 1}}
+    """
+
+    default_ttls = {
+        "/api/v1/config": 300,
+        "/api/v1/install": 60,
+        "/api/v2/k8smanifest": 600,
+    }
+
+    def __init__(self, client, ttls=None):
+        """Create a MetadataCache - see the class docs."""
+        self.client = client
+        self.ttls = dict(self.default_ttls)
+        if ttls:
+            self.ttls.update(ttls)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._stats = {}
+
+    def _record(self, url, outcome):
+        counters = self._stats.setdefault(url, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+    def get(self, url, description=""):
+        """Retrieve the json of `url`, using the cached copy if not expired.
+
+        Parameters
+        ----------
+        url : str
+            The API url, e.g. '/api/v1/config'
+        description : str, optional
+            Request description used in the log
+
+        Returns
+        -------
+        json
+            A copy of the response json
+
+        Raises
+        ------
+        APIException
+        """
+        ttl = self.ttls.get(url, 0)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and now - entry[0] < ttl:
+                self._record(url, "hits")
+                return copy.deepcopy(entry[1])
+            self._record(url, "misses")
+
+        json = self.client._request(
+            url=url, http_method="get", description=description
+        ).json()
+
+        if ttl > 0:
+            with self._lock:
+                self._entries[url] = (now, json)
+            json = copy.deepcopy(json)
+        return json
+
+    def invalidate(self, url=None):
+        """Discard cached json.
+
+        Parameters
+        ----------
+        url : str, optional
+            The API url to discard, by default all urls are discarded
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(url, None)
+
+    def stats(self):
+        """Return hit and miss counters keyed by url.
+
+        Returns
+        -------
+        dict
+            e.g. {'/api/v1/config': {'hits': 49, 'misses': 1}}
+        """
+        with self._lock:
+            return {url: dict(c) for url, c in self._stats.items()}
@@ -0,0 +1,234 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Indexed client side store of a controller's resources."""
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+from .logger import Logger
+
+_log = Logger.get_logger()
+
+DEFAULT_REFRESH_SECS = 30
+"""How long a store snapshot is reused for by default.
+
+Indexed fields such as status change without the controller knowing,
+e.g. when a worker is installed or another client changes a resource, so
+a snapshot is only reused for a short time.
+"""
+
+
+class ResourceStore(object):
+    """Snapshot of a controller's list with hash indexes on key fields.
+
+    The store loads :py:meth:`.base_resource.AbstractResourceController.list`
+    once and indexes the resources by id and by each of the `index_fields`,
+    so that lookups such as "find the k8s worker with this ipaddr" do not
+    scan the list.  The snapshot is discarded when the controller creates or
+    deletes a resource, and is refreshed after `refresh_secs`.
+
+    An instance of this class is available on each controller with the
+    attribute name :py:attr:`store
+    <.base_resource.AbstractResourceController.store>`.
+
+    Parameters
+    ----------
+    controller : AbstractResourceController
+        The controller whose resources are stored.
+    index_fields : list[str], optional
+        The fields to index, by default the controller's `index_fields`
+    refresh_secs : int, optional
+        How long a snapshot is reused for, by default
+        :py:data:`DEFAULT_REFRESH_SECS`.  None reuses it until it is
+        invalidated, which is only suitable for stores that index fields
+        that do not change.
+
+    Example
+    -------
+    >>> client.k8s_worker.find_by(ipaddr="10.1.0.238")
+    [WorkerK8s(...)]
+    """
+
+    def __init__(
+        self,
+        controller,
+        index_fields=None,
+        refresh_secs=DEFAULT_REFRESH_SECS,
+    ):
+        """Create a ResourceStore - see the class docs."""
+        if index_fields is None:
+            index_fields = controller.index_fields
+
+        all_fields = controller.resource_class.all_fields
+        for field in index_fields:
+            assert (
+                field in all_fields
+            ), "'{}' is not a field in {}.all_fields".format(
+                field, controller.resource_class.__name__
+            )
+        assert (
+            refresh_secs is None or refresh_secs >= 0
+        ), "'refresh_secs' must be >= 0"
+
+        self.controller = controller
+        self.index_fields = list(index_fields)
+        self.refresh_secs = refresh_secs
+        self._lock = threading.Lock()
+        self._resources = []
+        self._by_id = {}
+        self._indexes = {}
+        self._loaded_at = None
+
+    def _index(self, resources):
+        by_id = {}
+        indexes = dict((field, {}) for field in self.index_fields)
+        for resource in resources:
+            by_id[resource.id] = resource
+            for field, index in indexes.items():
+                value = _value(resource, field)
+                try:
+                    index.setdefault(value, []).append(resource)
+                except TypeError:
+                    # unhashable values (lists, dicts) are not indexed
+                    pass
+        self._resources = resources
+        self._by_id = by_id
+        self._indexes = indexes
+
+    def is_loaded(self):
+        """Return True if the snapshot can be used without a refresh."""
+        if self._loaded_at is None:
+            return False
+        return (
+            self.refresh_secs is None
+            or time.time() - self._loaded_at < self.refresh_secs
+        )
+
+    def refresh(self):
+        """Retrieve and index the controller's list."""
+        resources = list(self.controller.list())
+        with self._lock:
+            self._index(resources)
+            self._loaded_at = time.time()
+        _log.debug(
+            "ResourceStore: indexed {} {} resources".format(
+                len(resources), self.controller.resource_class.__name__
+            )
+        )
+
+    def invalidate(self):
+        """Discard the snapshot after a resource is created or deleted."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_loaded(self):
+        if not self.is_loaded():
+            self.refresh()
+
+    @property
+    def resources(self):
+        """The resources in the snapshot, refreshing it if required.
+
+        :type: list
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._resources)
+
+    def get(self, id):
+        """Return the resource with the id, or None if it is not stored.
+
+        Parameters
+        ----------
+        id : str
+            The resource ID with the format /resource/path/id
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return self._by_id.get(id)
+
+    def find_by(self, **kwargs):
+        """Return the resources whose fields equal all of the keyword args.
+
+        The smallest matching index is used to select the candidates, which
+        are then checked against the remaining fields.  If no argument is an
+        indexed field, every resource is checked.
+
+        Returns
+        -------
+        list
+            The matching resources, in list order.
+
+        Example
+        -------
+        >>> client.k8s_cluster.find_by(name="def-k8s-cluster")
+        """
+        all_fields = self.controller.resource_class.all_fields
+        for field in kwargs:
+            assert (
+                field in all_fields
+            ), "'{}' is not a field in {}.all_fields".format(
+                field, self.controller.resource_class.__name__
+            )
+
+        self._ensure_loaded()
+        with self._lock:
+            candidates = self._resources
+            remaining = dict(kwargs)
+            indexed = None
+            for field, value in kwargs.items():
+                if field not in self._indexes:
+                    continue
+                try:
+                    matches = self._indexes[field].get(value, [])
+                except TypeError:
+                    continue
+                if indexed is None or len(matches) < len(candidates):
+                    candidates = matches
+                    indexed = field
+            if indexed is not None:
+                del remaining[indexed]
+
+        return [
+            resource
+            for resource in candidates
+            if all(
+                _value(resource, field) == value
+                for field, value in remaining.items()
+            )
+        ]
+
+    def find_one_by(self, **kwargs):
+        """Return the first resource found by :py:meth:`find_by`, or None."""
+        found = self.find_by(**kwargs)
+        return found[0] if found else None
+
+
+_MISSING = object()
+
+
+def _value(resource, field):
+    try:
+        return getattr(resource, field)
+    except Exception:
+        return _MISSING
@@ -0,0 +1,265 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Conditional GET support for the ContainerPlatformClient."""
+
+from __future__ import absolute_import
+
+import json
+import os
+import stat
+import threading
+from collections import OrderedDict
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .json_file import write_json_file
+from .logger import Logger
+
+_log = Logger.get_logger()
+
+
+class ResponseCache(object):
+    """A bounded LRU cache of GET responses and their validators.
+
+    When a cache is configured on the client, GET requests for a cached url
+    are sent with `If-None-Match` and/or `If-Modified-Since` headers.  If
+    the API responds with HTTP 304 (Not Modified) the body is served from
+    the cache instead of being downloaded again, which is cheap for polling
+    loops that poll an unchanged resource.
+
+    Only responses with an `ETag` or `Last-Modified` header are cached.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of responses to keep, the least recently used
+        response is discarded first, by default 128
+    path : str, optional
+        Persist the cache to this file with :py:meth:`save` and read it
+        when the cache is created, by default None (memory only)
+
+    Example
+    -------
+    >>> from hpecp.response_cache import ResponseCache
+    >>> client = ContainerPlatformClient(
+    ...     ..., response_cache=ResponseCache(max_entries=64)
+    ... )
+    >>> client.response_cache.stats()
+    {'requests': 10, 'hits': 9, 'misses': 1, 'evictions': 0,
+     'bytes_saved': 104787}
+    """
+
+    def __init__(self, max_entries=128, path=None):
+        """Create a ResponseCache - see the class docs."""
+        assert (
+            isinstance(max_entries, int) and max_entries > 0
+        ), "'max_entries' must be an int > 0"
+
+        self.max_entries = max_entries
+        self.path = os.path.expanduser(path) if path else None
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.reset_stats()
+
+        if self.path:
+            self._load()
+
+    def reset_stats(self):
+        """Set all counters to zero."""
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    def stats(self):
+        """Return the counters as a dict.
+
+        Returns
+        -------
+        dict
+            `requests` is the number of conditional requests sent, `hits`
+            the number answered with HTTP 304 and `bytes_saved` the number
+            of body bytes that were not downloaded.
+        """
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    def __len__(self):
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def lookup(self, key):
+        """Retrieve a cached entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+
+        Returns
+        -------
+        dict
+            The cache entry or None if `key` is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # mark as most recently used
+                del self._entries[key]
+                self._entries[key] = entry
+            return entry
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Return the request headers to revalidate `entry`."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def hit(self, entry, url):
+        """Build a response from a cache entry after a HTTP 304.
+
+        Parameters
+        ----------
+        entry : dict
+            The entry returned by :py:meth:`lookup`
+        url : str
+            The request url
+
+        Returns
+        -------
+        requests.Response
+            A HTTP 200 response with the cached body
+        """
+        content = entry["content"].encode("utf-8")
+        with self._lock:
+            self.requests += 1
+            self.hits += 1
+            self.bytes_saved += len(content)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = content
+        return response
+
+    def store(self, key, response, conditional=False):
+        """Cache a response if it has validators.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        response : requests.Response
+            A successful GET response
+        conditional : bool, optional
+            The request was sent with conditional headers, by default False
+        """
+        headers = response.headers
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        with self._lock:
+            if conditional:
+                self.requests += 1
+                self.misses += 1
+
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+
+            self._entries.pop(key, None)
+            self._entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "headers": {
+                    k: v
+                    for k, v in headers.items()
+                    if k.lower() in ("content-type", "etag", "last-modified")
+                },
+                "content": response.text,
+            }
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Discard all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+
+        if st.st_mode & (stat.S_IRWXG | stat.S_IRWXO) or (
+            hasattr(os, "getuid") and st.st_uid != os.getuid()
+        ):
+            _log.warning(
+                "Ignoring response cache '{}' - it must only be accessible "
+                "by its owner (chmod 600)".format(self.path)
+            )
+            return
+
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError) as e:
+            _log.debug("Unable to read response cache: {}".format(e))
+            return
+
+        if not isinstance(entries, list):
+            return
+        skip = max(0, len(entries) - self.max_entries)
+        with self._lock:
+            for key, entry in entries[skip:]:
+                self._entries[key] = entry
+
+    def save(self):
+        """Write the cache to `path`.
+
+        The file is written with owner read/write permissions only.  This
+        is a no-op if the cache was created without a `path`.
+        """
+        if not self.path:
+            return
+
+        with self._lock:
+            entries = list(self._entries.items())
+
+        try:
+            write_json_file(self.path, entries)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            _log.debug("Unable to write response cache: {}".format(e))
@@ -0,0 +1,220 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Retry policy for requests made by the ContainerPlatformClient."""
+
+from __future__ import absolute_import
+
+import random
+import threading
+import time
+
+
+class RetryStats(object):
+    """Counters describing the retries made by a client.
+
+    Attributes
+    ----------
+    requests : int
+        Number of API requests made, excluding retries
+    retries : int
+        Number of requests that were repeated
+    retries_by_reason : dict
+        Number of retries keyed by HTTP status code, or "connection" for
+        connection errors
+    reauthentications : int
+        Number of times a new session was created after HTTP 401
+    retry_wait_secs : float
+        Total time spent sleeping between retries
+    budget_exhausted : int
+        Number of retries skipped because the retry budget was empty
+    """
+
+    def __init__(self):
+        """Create a RetryStats instance with all counters set to zero."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Set all counters to zero."""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.retries_by_reason = {}
+            self.reauthentications = 0
+            self.retry_wait_secs = 0.0
+            self.budget_exhausted = 0
+
+    def _record(self, name, value=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def _record_retry(self, reason, wait_secs):
+        with self._lock:
+            self.retries += 1
+            self.retries_by_reason[reason] = (
+                self.retries_by_reason.get(reason, 0) + 1
+            )
+            self.retry_wait_secs += wait_secs
+
+    def to_dict(self):
+        """Return the counters as a dict."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "retries_by_reason": dict(self.retries_by_reason),
+                "reauthentications": self.reauthentications,
+                "retry_wait_secs": self.retry_wait_secs,
+                "budget_exhausted": self.budget_exhausted,
+            }
+
+    def __repr__(self):
+        """Return a representation of the counters."""
+        return "<RetryStats {}>".format(self.to_dict())
+
+
+class RetryPolicy(object):
+    """Decide if, and after how long, a failed request is repeated.
+
+    Retries use exponential backoff with full jitter: the n-th retry waits
+    a random time between 0 and min(max_backoff_secs,
+    backoff_factor * 2 ** n) seconds.
+
+    Retries are limited by a retry budget shared by all requests using the
+    policy: every request adds `budget_ratio` tokens (up to `budget`) and
+    every retry spends one token.  Over time no more than
+    `budget_ratio` retries are made per request, which prevents a struggling
+    controller being flooded with retries.
+
+    Parameters
+    ----------
+    max_retries : int, optional
+        Maximum retries for a single request, by default 3
+    backoff_factor : float, optional
+        Base delay in seconds, by default 0.5
+    max_backoff_secs : float, optional
+        Maximum delay between retries, by default 30
+    jitter : bool, optional
+        Randomize the delay between retries, by default True
+    retry_statuses : list, optional
+        HTTP status codes that are retried, by default
+        [429, 502, 503, 504]
+    retry_methods : list, optional
+        HTTP methods that are retried, by default ["get", "put", "delete"].
+        Add "post" to retry non-idempotent requests.
+    retry_connection_errors : bool, optional
+        Retry requests that could not connect to the controller, by
+        default True
+    reauthenticate : bool, optional
+        Create a new session and repeat the request once when the API
+        responds with HTTP 401, by default True
+    budget : float, optional
+        Maximum (and initial) number of retry tokens, by default 10
+    budget_ratio : float, optional
+        Tokens added by each request, by default 0.1
+
+    Example
+    -------
+    >>> client = ContainerPlatformClient(
+    ...     ...,
+    ...     retry_policy=RetryPolicy(max_retries=5, retry_methods=["get"]),
+    ... )
+    >>> client.retry_stats.to_dict()
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        max_backoff_secs=30,
+        jitter=True,
+        retry_statuses=[429, 502, 503, 504],
+        retry_methods=["get", "put", "delete"],
+        retry_connection_errors=True,
+        reauthenticate=True,
+        budget=10,
+        budget_ratio=0.1,
+    ):
+        """Create a RetryPolicy - see the class docs for the parameters."""
+        assert (
+            isinstance(max_retries, int) and max_retries >= 0
+        ), "'max_retries' must be an int >= 0"
+        assert backoff_factor >= 0, "'backoff_factor' must be >= 0"
+        assert max_backoff_secs >= 0, "'max_backoff_secs' must be >= 0"
+        assert budget >= 0, "'budget' must be >= 0"
+        assert budget_ratio >= 0, "'budget_ratio' must be >= 0"
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff_secs = max_backoff_secs
+        self.jitter = jitter
+        self.retry_statuses = list(retry_statuses)
+        self.retry_methods = [m.lower() for m in retry_methods]
+        self.retry_connection_errors = retry_connection_errors
+        self.reauthenticate = reauthenticate
+        self.budget = budget
+        self.budget_ratio = budget_ratio
+
+        self._tokens = float(budget)
+        self._lock = threading.Lock()
+
+    def is_retryable(self, http_method, status_code):
+        """Return True if a failed request may be repeated.
+
+        Parameters
+        ----------
+        http_method : str
+            The request method, e.g. "get"
+        status_code : int
+            The response status code or None if the request could not
+            connect to the controller
+        """
+        if http_method.lower() not in self.retry_methods:
+            return False
+        if status_code is None:
+            return self.retry_connection_errors
+        return status_code in self.retry_statuses
+
+    def backoff_secs(self, retry_number):
+        """Return how long to wait before retry number `retry_number`."""
+        delay = min(
+            self.max_backoff_secs, self.backoff_factor * (2**retry_number)
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def deposit(self):
+        """Add budget_ratio tokens to the retry budget for a new request."""
+        with self._lock:
+            self._tokens = min(self.budget, self._tokens + self.budget_ratio)
+
+    def withdraw(self):
+        """Spend one token, returning False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def sleep(self, secs):
+        """Wait between retries."""
+        time.sleep(secs)
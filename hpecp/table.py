@@ -0,0 +1,171 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Fast rendering of the `plain` and `pretty` table styles."""
+
+from __future__ import absolute_import
+
+import re
+
+import six
+
+FAST_STYLES = ("plain", "pretty")
+"""The styles that :py:func:`render_lines` can render."""
+
+# text that tabulate prints as-is: printable ascii without surrounding
+# whitespace, so the width of the text is its length
+_SIMPLE_TEXT = re.compile(r"^(?:[\x21-\x7e](?:[\x20-\x7e]*[\x21-\x7e])?)?$")
+
+_NONE = 0
+_TEXT = 1
+_INT = 2
+
+
+def _is_number(text):
+    # tabulate parses numbers (with thousands separators) from strings
+    try:
+        float(text)
+        return True
+    except ValueError:
+        pass
+    if "," in text:
+        try:
+            float(text.replace(",", ""))
+            return True
+        except ValueError:
+            pass
+    return False
+
+
+def _cell(value):
+    """Return (text, kind) for a cell, or None if it is not supported."""
+    if value is None:
+        return "", _NONE
+    if isinstance(value, bool):
+        return str(value), _TEXT
+    if isinstance(value, six.integer_types):
+        return str(value), _INT
+    if isinstance(value, six.string_types):
+        if _SIMPLE_TEXT.match(value) is None or _is_number(value):
+            return None
+        return value, _TEXT
+    return None
+
+
+def render_lines(rows, headers=None, style="pretty"):
+    """Render a table one line at a time.
+
+    The cells are converted to text and the column widths are computed in a
+    single pass over `rows`, the lines are then generated without building
+    the whole table.  The output is the same as the `tabulate` library for
+    the `plain` and `pretty` styles.
+
+    Parameters
+    ----------
+    rows : list[list]
+        The table cells
+    headers : list[str], optional
+        The column headers, by default no headers
+    style : str, optional
+        "plain" or "pretty", by default "pretty"
+
+    Returns
+    -------
+    generator or None
+        The lines of the table, without line endings.  None if the table
+        has cells that this renderer does not support (for example floats,
+        lists, multi-line or non-ascii text), use `tabulate` instead.
+    """
+    assert style in FAST_STYLES, "'style' must be one of {}".format(
+        FAST_STYLES
+    )
+
+    headers = list(headers or [])
+    ncols = len(headers) if headers else (len(rows[0]) if rows else 0)
+    widths = [0] * ncols
+    kinds = [_NONE] * ncols
+
+    text_rows = []
+    for row in rows:
+        text_row = []
+        for index, value in enumerate(row):
+            cell = _cell(value)
+            if cell is None:
+                return None
+            text, kind = cell
+            if kind != _NONE:
+                if kinds[index] == _NONE:
+                    kinds[index] = kind
+                elif kinds[index] != kind:
+                    return None
+            if len(text) > widths[index]:
+                widths[index] = len(text)
+            text_row.append(text)
+        text_rows.append(text_row)
+
+    for header in headers:
+        if _SIMPLE_TEXT.match(header) is None:
+            return None
+
+    if style == "plain":
+        return _plain_lines(text_rows, headers, widths, kinds)
+    return _pretty_lines(text_rows, headers, widths)
+
+
+def _plain_lines(rows, headers, widths, kinds):
+    if headers:
+        # tabulate pads the header of each column with two spaces
+        widths = [max(w, len(h) + 2) for w, h in zip(widths, headers)]
+    formats = [
+        "{:>%d}" % w if kind == _INT else "{:<%d}" % w
+        for w, kind in zip(widths, kinds)
+    ]
+
+    def line(cells):
+        return "  ".join(f.format(c) for f, c in zip(formats, cells)).rstrip()
+
+    if headers:
+        yield line(headers)
+    for row in rows:
+        yield line(row)
+
+
+def _pretty_lines(rows, headers, widths):
+    if headers:
+        widths = [max(w, len(h)) for w, h in zip(widths, headers)]
+    formats = ["{:^%d}" % w for w in widths]
+    rule = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+
+    def line(cells):
+        return (
+            "| "
+            + " | ".join(f.format(c) for f, c in zip(formats, cells))
+            + " |"
+        )
+
+    if not headers and not rows:
+        return
+    yield rule
+    if headers:
+        yield line(headers)
+        yield rule
+    for row in rows:
+        yield line(row)
+    yield rule
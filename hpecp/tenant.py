@@ -126,8 +126,10 @@ class TenantController(AbstractWaitableResourceController):
     base_resource_path = "/api/v1/tenant/"
     resource_class = Tenant
     resource_list_path = "tenants"
+    index_fields = ["name", "status"]
     status_class = TenantStatus
     status_fieldname = "status"
+    error_status = [TenantStatus.error]
 
     def __init__(self, client):
         self.client = client
@@ -224,6 +226,7 @@ class TenantController(AbstractWaitableResourceController):
             data=data,
             description="tenant/create",
         )
+        self.store.invalidate()
         return CaseInsensitiveDict(response.headers)["Location"]
 
     def k8skubeconfig(self):
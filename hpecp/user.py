@@ -181,6 +181,7 @@ class UserController(AbstractResourceController):
     base_resource_path = "/api/v1/user/"
     resource_class = User
     resource_list_path = "users"
+    index_fields = ["name"]
 
     def create(self, name, password=None, description="", is_external=True):
         """Create a user by specifying name and description.
@@ -226,4 +227,5 @@ class UserController(AbstractResourceController):
             data=data,
             description="user/create",
         )
+        self.store.invalidate()
         return CaseInsensitiveDict(response.headers)["location"]
@@ -0,0 +1,264 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Polling engine used to wait for a resource to reach a status."""
+
+from __future__ import absolute_import
+
+import random
+import time
+
+
+class WaitPolicy(object):
+    """Decide how long to sleep between polls of a resource's status.
+
+    The first polls are made quickly so that fast transitions are noticed
+    with little latency, then the interval grows by `backoff_factor` per
+    poll up to `max_interval_secs` so that long operations (e.g. creating a
+    k8s cluster) do not retrieve the resource more often than necessary.
+
+    Parameters
+    ----------
+    initial_interval_secs : float, optional
+        Sleep before the second poll, by default 1
+    max_interval_secs : float, optional
+        Maximum sleep between polls, by default 30
+    backoff_factor : float, optional
+        Growth of the sleep after each poll, by default 1.5
+    jitter : bool, optional
+        Randomize each sleep by up to +/-10%, so that many waiters do not
+        poll the controller in lockstep, by default True
+
+    Example
+    -------
+    >>> client = ContainerPlatformClient(
+    ...     ..., wait_policy=WaitPolicy(max_interval_secs=10)
+    ... )
+    """
+
+    def __init__(
+        self,
+        initial_interval_secs=1,
+        max_interval_secs=30,
+        backoff_factor=1.5,
+        jitter=True,
+    ):
+        """Create a WaitPolicy - see the class docs."""
+        assert (
+            isinstance(initial_interval_secs, (int, float))
+            and initial_interval_secs > 0
+        ), "'initial_interval_secs' must be a number > 0"
+        assert isinstance(max_interval_secs, (int, float)) and (
+            max_interval_secs >= initial_interval_secs
+        ), "'max_interval_secs' must be >= 'initial_interval_secs'"
+        assert (
+            isinstance(backoff_factor, (int, float)) and backoff_factor >= 1
+        ), "'backoff_factor' must be a number >= 1"
+        assert isinstance(jitter, bool), "'jitter' must be a bool"
+
+        self.initial_interval_secs = initial_interval_secs
+        self.max_interval_secs = max_interval_secs
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+
+    @classmethod
+    def fixed(cls, interval_secs):
+        """Return a policy that polls every `interval_secs`."""
+        return cls(
+            initial_interval_secs=interval_secs,
+            max_interval_secs=interval_secs,
+            backoff_factor=1,
+            jitter=False,
+        )
+
+    def interval_secs(self, poll_number):
+        """Return the sleep after the `poll_number`-th poll (from 0)."""
+        interval = min(
+            self.max_interval_secs,
+            self.initial_interval_secs * self.backoff_factor**poll_number,
+        )
+        if self.jitter:
+            interval *= random.uniform(0.9, 1.1)
+        return interval
+
+
+class WaitResult(object):
+    """The outcome of waiting for a resource's status.
+
+    The result is truthy if the wait succeeded, so existing code such as
+    ``if client.k8s_cluster.wait_for_status(...):`` keeps working.
+
+    Attributes
+    ----------
+    success : bool
+        True if a wanted status was reached (or the resource ceased to
+        exist when waiting for deletion)
+    reason : str
+        One of "status_reached", "deleted", "error_status", "timeout",
+        "not_found" or "cancelled"
+    resource : AbstractResource
+        The last resource retrieved, None if it no longer exists
+    status : str
+        The last status observed, None if the resource no longer exists
+    history : list
+        The (elapsed_secs, status) status transitions observed, in order
+    polls : int
+        The number of times the resource was retrieved
+    elapsed_secs : float
+        The time spent waiting
+    """
+
+    def __init__(
+        self, success, reason, resource, status, history, polls, elapsed_secs
+    ):
+        """Create a WaitResult - see the class docs."""
+        self.success = success
+        self.reason = reason
+        self.resource = resource
+        self.status = status
+        self.history = history
+        self.polls = polls
+        self.elapsed_secs = elapsed_secs
+
+    def __bool__(self):
+        """Return True if the wait succeeded."""
+        return self.success
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        """Return a summary of the result."""
+        return "<WaitResult success={} reason={} status={} polls={}>".format(
+            self.success, self.reason, self.status, self.polls
+        )
+
+
+class StatusWaiter(object):
+    """Track a wait for a resource's status.
+
+    The caller retrieves the resource, passes it to :py:meth:`observe` and
+    sleeps for :py:meth:`next_interval_secs` until :py:meth:`observe`
+    returns a :py:class:`WaitResult`.  This keeps the decision logic shared
+    by the blocking and asyncio clients.
+
+    Parameters
+    ----------
+    status_fieldname : str
+        The resource attribute holding the status
+    status : list[str]
+        The status names to wait for, an empty list waits for the resource
+        to cease to exist
+    error_status : list[str]
+        Status names that end the wait unsuccessfully unless they are
+        also in `status`
+    timeout_secs : float
+        Give up after this many seconds
+    policy : WaitPolicy
+        See :py:class:`WaitPolicy`
+    """
+
+    def __init__(
+        self, status_fieldname, status, error_status, timeout_secs, policy
+    ):
+        """Create a StatusWaiter - see the class docs."""
+        self.status_fieldname = status_fieldname
+        self.status = status
+        self.error_status = [s for s in error_status if s not in status]
+        self.timeout_secs = timeout_secs
+        self.policy = policy
+        self.history = []
+        self.polls = 0
+        self._start = time.time()
+
+    def elapsed_secs(self):
+        """Return the time since the wait started."""
+        return time.time() - self._start
+
+    def _result(self, success, reason, resource, status):
+        return WaitResult(
+            success,
+            reason,
+            resource,
+            status,
+            self.history,
+            self.polls,
+            self.elapsed_secs(),
+        )
+
+    def observe(self, resource):
+        """Record a poll of the resource.
+
+        Parameters
+        ----------
+        resource : AbstractResource
+            The resource retrieved, None if it does not exist
+
+        Returns
+        -------
+        WaitResult
+            The outcome, or None if the wait should continue
+        """
+        self.polls += 1
+        elapsed = self.elapsed_secs()
+
+        if resource is None:
+            status = None
+        else:
+            status = getattr(resource, self.status_fieldname)
+
+        if not self.history or self.history[-1][1] != status:
+            self.history.append((elapsed, status))
+
+        if resource is None:
+            if len(self.status) == 0:
+                return self._result(True, "deleted", None, None)
+        elif status in self.status:
+            return self._result(True, "status_reached", resource, status)
+        elif status in self.error_status:
+            return self._result(False, "error_status", resource, status)
+
+        if elapsed >= self.timeout_secs:
+            return self._result(False, "timeout", resource, status)
+        return None
+
+    def stop(self, reason, resource=None):
+        """End the wait unsuccessfully.
+
+        Parameters
+        ----------
+        reason : str
+            See :py:attr:`WaitResult.reason`
+        resource : AbstractResource, optional
+            The last resource retrieved
+
+        Returns
+        -------
+        WaitResult
+        """
+        status = None
+        if resource is not None:
+            status = getattr(resource, self.status_fieldname)
+        return self._result(False, reason, resource, status)
+
+    def next_interval_secs(self):
+        """Return the time to sleep before the next poll."""
+        remaining = self.timeout_secs - self.elapsed_secs()
+        interval = self.policy.interval_secs(self.polls - 1)
+        return max(0, min(interval, remaining))
@@ -0,0 +1,172 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Shared inventory of the hosts returned by /api/v1/workers."""
+
+from __future__ import absolute_import
+
+import copy
+import threading
+import time
+
+from .logger import Logger
+
+_log = Logger.get_logger()
+
+
+class WorkerInventory(object):
+    """Snapshot of `/api/v1/workers` shared by the worker controllers.
+
+    Gateways and EPIC workers are both returned by the `/api/v1/workers`
+    API and only differ by their `purpose`.  The inventory fetches the
+    collection once per refresh window and indexes it by id and purpose, so
+    that :py:class:`.gateway.GatewayController` and
+    :py:class:`.epic_worker.EpicWorkerController` can share one download.
+
+    An instance of this class is available in the
+    client.ContainerPlatformClient with the attribute name
+    :py:attr:`worker_inventory
+    <.client.ContainerPlatformClient.worker_inventory>`.
+
+    The json returned by the inventory is a copy of the snapshot, which
+    callers may modify.
+
+    Parameters
+    ----------
+    client : ContainerPlatformClient
+        client instance for working with the HPE CP API.
+    refresh_secs : int, optional
+        How long a snapshot is reused for, by default 5.  Set to 0 to
+        retrieve the workers on every call.
+    """
+
+    url = "/api/v1/workers"
+
+    def __init__(self, client, refresh_secs=5):
+        """Create a WorkerInventory - see the class docs."""
+        assert refresh_secs >= 0, "'refresh_secs' must be >= 0"
+
+        self.client = client
+        self.refresh_secs = refresh_secs
+        self._lock = threading.Lock()
+        self._workers = []
+        self._by_id = {}
+        self._by_purpose = {}
+        self._fetched_at = None
+
+    def _index(self, workers):
+        self._workers = workers
+        self._by_id = {}
+        self._by_purpose = {}
+        for worker in workers:
+            self._by_id[worker["_links"]["self"]["href"]] = worker
+            self._by_purpose.setdefault(worker.get("purpose"), []).append(
+                worker
+            )
+
+    def is_fresh(self):
+        """Return True if the snapshot is within the refresh window."""
+        return (
+            self._fetched_at is not None
+            and time.time() - self._fetched_at < self.refresh_secs
+        )
+
+    def refresh(self):
+        """Retrieve and index `/api/v1/workers`."""
+        response = self.client._request(
+            url=self.url,
+            http_method="get",
+            description="WorkerInventory/refresh",
+        )
+        workers = response.json()["_embedded"]["workers"]
+        with self._lock:
+            self._index(workers)
+            self._fetched_at = time.time()
+
+    def invalidate(self):
+        """Discard the snapshot, e.g. after a worker is created or deleted."""
+        with self._lock:
+            self._fetched_at = None
+
+    def workers(self, purpose=None):
+        """Retrieve the workers json, refreshing the snapshot if required.
+
+        Parameters
+        ----------
+        purpose : str, optional
+            Only return the workers with this purpose, e.g. 'proxy' or
+            'worker'
+
+        Returns
+        -------
+        list[dict]
+            A copy of the worker json returned by the API
+        """
+        if not self.is_fresh():
+            self.refresh()
+        with self._lock:
+            if purpose is None:
+                workers = self._workers
+            else:
+                workers = self._by_purpose.get(purpose, [])
+        return copy.deepcopy(workers)
+
+    def get(self, id):
+        """Retrieve a worker's json from the snapshot without a request.
+
+        Parameters
+        ----------
+        id : str
+            The worker ID - format: '/api/v1/workers/[0-9]+'
+
+        Returns
+        -------
+        dict
+            A copy of the worker json, or None if the snapshot is not fresh
+            or does not contain the worker.
+        """
+        if not self.is_fresh():
+            return None
+        with self._lock:
+            worker = self._by_id.get(id)
+        return copy.deepcopy(worker)
+
+    def update(self, worker):
+        """Record a worker retrieved individually in a fresh snapshot.
+
+        Parameters
+        ----------
+        worker : dict
+            The worker json returned by the API
+        """
+        if not self.is_fresh():
+            return
+        # the caller keeps using its json
+        worker = copy.deepcopy(worker)
+        id = worker["_links"]["self"]["href"]
+        with self._lock:
+            if id in self._by_id:
+                workers = [
+                    worker if w["_links"]["self"]["href"] == id else w
+                    for w in self._workers
+                ]
+            else:
+                workers = self._workers + [worker]
+            self._index(workers)
@@ -238,6 +238,9 @@ class BaseTestCase(unittest.TestCase):
         # override method to return config file path
         base.get_config_file = get_config_file
 
+        # don't reuse the clients created by the previous tests
+        base.reset_clients()
+
     def tearDown(self):
         from hpecp.cli import base
 
@@ -247,3 +250,4 @@ class BaseTestCase(unittest.TestCase):
 
         base.get_config_file = self.saved_base_get_config_file
         base.get_client = self.saved_base_get_client
+        base.reset_clients()
@@ -18,13 +18,30 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
+import json
 import unittest
 
+from mock import MagicMock
+
 from hpecp.base_resource import (
     AbstractResourceController,
     AbstractWaitableResourceController,
+    ResourceList,
 )
 from hpecp.client import ContainerPlatformClient
+from hpecp.user import User
+
+
+def user_json(id, name="admin"):
+    return {
+        "_links": {"self": {"href": "/api/v1/user/{}".format(id)}},
+        "label": {"name": name, "description": "a user"},
+        "is_group_added_user": False,
+        "is_external": False,
+        "is_service_account": False,
+        "default_tenant": "/api/v1/tenant/1",
+        "is_siteadmin": True,
+    }
 
 
 class TestBaseResource(unittest.TestCase):
@@ -72,3 +89,200 @@ class TestBaseResource(unittest.TestCase):
 
         self.assertEqual(c._get_status_class(), "test_status_class")
         self.assertEqual(c._get_status_fieldname(), "test_status_fieldname")
+
+
+class TestCompactResource(unittest.TestCase):
+    def test_fields_are_extracted(self):
+
+        json = user_json(5)
+        compact = User.compact(json)
+
+        for field in User.all_fields:
+            self.assertEqual(
+                getattr(compact, field), getattr(User(json), field)
+            )
+        self.assertEqual(repr(compact), "<User id:/api/v1/user/5>")
+        self.assertFalse(hasattr(compact, "__dict__"))
+        self.assertIs(User.compact_class(), type(compact))
+
+    def test_json_only_kept_on_request(self):
+
+        json = user_json(5)
+
+        with self.assertRaises(AttributeError):
+            User.compact(json).json
+        self.assertIs(User.compact(json, keep_json=True).json, json)
+
+    def test_read_only(self):
+
+        with self.assertRaises(AttributeError):
+            User.compact(user_json(5)).name = "other"
+
+    def test_missing_field_is_unset(self):
+
+        json = user_json(5)
+        del json["_links"]
+        compact = User.compact(json)
+
+        self.assertFalse(hasattr(compact, "id"))
+        self.assertEqual(compact.name, "admin")
+
+    def test_compact_resource_list(self):
+
+        json = [user_json(i, "user{}".format(i)) for i in range(3)]
+        compact = ResourceList(User, json, compact=True, keep_json=False)
+        full = ResourceList(User, json)
+
+        self.assertIsNone(compact.json)
+        self.assertEqual(
+            compact.tabulate(columns=["id", "name"]),
+            full.tabulate(columns=["id", "name"]),
+        )
+
+
+class CountingUser(User):
+    created = 0
+
+    def __init__(self, json):
+        CountingUser.created += 1
+        super(CountingUser, self).__init__(json)
+
+
+class TestLazyResourceList(unittest.TestCase):
+    def setUp(self):
+        CountingUser.created = 0
+        self.json = [user_json(i, "user{}".format(i)) for i in range(10)]
+
+    def test_resources_created_on_access(self):
+
+        users = ResourceList(CountingUser, self.json)
+        self.assertEqual(len(users), 10)
+        self.assertIs(users.json, self.json)
+        self.assertEqual(CountingUser.created, 0)
+
+        self.assertEqual(users[-1].name, "user9")
+        self.assertEqual([u.name for u in users[2:4]], ["user2", "user3"])
+        self.assertEqual(CountingUser.created, 3)
+
+        # resources are only created once
+        self.assertIs(users[2], users[2])
+        self.assertEqual(len(list(users)), 10)
+        self.assertEqual(CountingUser.created, 10)
+
+    def test_index_out_of_range(self):
+
+        with self.assertRaises(IndexError):
+            ResourceList(CountingUser, self.json)[10]
+
+    def test_compact_releases_json(self):
+
+        users = ResourceList(
+            CountingUser, self.json, compact=True, keep_json=False
+        )
+        self.assertIsNone(users.json)
+        self.assertEqual(users.resources[0].name, "user0")
+        self.assertIsNone(users._json_items)
+
+
+class UserListController(AbstractResourceController):
+    base_resource_path = "/api/v1/user/"
+    resource_class = User
+    resource_list_path = "users"
+
+
+class TestListFilters(unittest.TestCase):
+    def setUp(self):
+        self.json = [user_json(i, "user{}".format(i)) for i in range(5)]
+        self.client = MagicMock()
+        self.client._request.return_value.json.return_value = {
+            "_embedded": {"users": self.json}
+        }
+
+    def request_url(self):
+        return self.client._request.call_args[1]["url"]
+
+    def test_client_side_filters(self):
+
+        controller = UserListController(self.client)
+
+        users = controller.list(filters={"name": "user3"})
+        self.assertEqual([u.id for u in users], ["/api/v1/user/3"])
+        self.assertEqual(self.request_url(), "/api/v1/user/")
+
+        users = controller.list(filters={"name": ["user1", "user4"]})
+        self.assertEqual([u.name for u in users], ["user1", "user4"])
+
+        users = controller.list(
+            filters={"id": lambda id: id.endswith(("0", "2"))}
+        )
+        self.assertEqual([u.name for u in users], ["user0", "user2"])
+
+    def test_server_side_filters(self):
+
+        controller = UserListController(self.client)
+        controller.list_filter_params = {"name": "label.name"}
+
+        controller.list(filters={"name": "user3", "is_siteadmin": True})
+        self.assertEqual(self.request_url(), "/api/v1/user/?label.name=user3")
+
+    def test_fields(self):
+
+        controller = UserListController(self.client)
+
+        users = controller.list(filters={"name": "user2"}, fields=["name"])
+        self.assertIsNone(users.json)
+        self.assertEqual(users[0].name, "user2")
+        self.assertEqual(users[0].id, "/api/v1/user/2")
+        self.assertFalse(hasattr(users[0], "is_external"))
+        self.assertEqual(
+            users.tabulate(),
+            controller.list(filters={"name": "user2"}).tabulate(
+                columns=["name"]
+            ),
+        )
+
+    def test_unknown_field(self):
+
+        controller = UserListController(self.client)
+
+        with self.assertRaises(AssertionError):
+            controller.list(filters={"unknown": 1})
+        with self.assertRaises(AssertionError):
+            controller.list(fields=["unknown"])
+
+    def test_filters_do_not_create_resources(self):
+
+        controller = UserListController(self.client)
+
+        created = []
+        original_init = User.__init__
+
+        def counting_init(user, json):
+            created.append(json)
+            original_init(user, json)
+
+        User.__init__ = counting_init
+        try:
+            users = controller.list(filters={"name": "user3"}, fields=["id"])
+        finally:
+            User.__init__ = original_init
+
+        self.assertEqual([u.id for u in users], ["/api/v1/user/3"])
+        self.assertEqual(created, [])
+
+    def test_iter_list_filters(self):
+
+        self.client._request.return_value.iter_content.return_value = [
+            json.dumps({"_embedded": {"users": self.json}}).encode()
+        ]
+        controller = UserListController(self.client)
+        controller.list_filter_params = {"is_siteadmin": "is_siteadmin"}
+
+        users = controller.iter_list(
+            filters={"name": ["user1", "user4"], "is_siteadmin": True}
+        )
+        self.assertEqual([u.name for u in users], ["user1", "user4"])
+        self.assertEqual(self.request_url(), "/api/v1/user/?is_siteadmin=True")
+
+        with self.assertRaises(AssertionError):
+            list(controller.iter_list(filters={"unknown": 1}))
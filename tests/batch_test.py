@@ -0,0 +1,136 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import tempfile
+from unittest import TestCase
+
+import six
+from mock import patch
+
+from hpecp.cli.batch import parse_line, system_exit_code
+
+from .base import BaseTestCase
+from .k8s_worker_mock_api_responses import mockApiSetup
+
+# setup the mock data
+mockApiSetup()
+
+
+class TestParseLine(TestCase):
+    def test_command_lines(self):
+
+        self.assertEqual(
+            parse_line("hpecp k8sworker get '/api/v2/worker/k8shost/5'\n"),
+            ["k8sworker", "get", "/api/v2/worker/k8shost/5"],
+        )
+        self.assertEqual(
+            parse_line('["k8sworker", "list", "--columns", "id"]'),
+            ["k8sworker", "list", "--columns", "id"],
+        )
+        self.assertEqual(
+            parse_line('{"args": ["lock", "list"]}'), ["lock", "list"]
+        )
+        self.assertIsNone(parse_line("  "))
+        self.assertIsNone(parse_line("# a comment"))
+
+    def test_invalid_lines(self):
+
+        for line in ['{"cmd": "lock"}', "hpecp", "batch", '["shell"]']:
+            with self.assertRaises(ValueError):
+                parse_line(line)
+
+
+class TestSystemExitCode(TestCase):
+    def test_exit_codes(self):
+
+        self.assertEqual(system_exit_code(SystemExit()), 0)
+        self.assertEqual(system_exit_code(SystemExit(None)), 0)
+        self.assertEqual(system_exit_code(SystemExit(0)), 0)
+        self.assertEqual(system_exit_code(SystemExit(2)), 2)
+        with patch("sys.stderr", new_callable=six.StringIO) as stderr:
+            self.assertEqual(system_exit_code(SystemExit("failed")), 1)
+        self.assertEqual(stderr.getvalue(), "failed\n")
+
+
+class TestBatch(BaseTestCase):
+    def run_batch(self, lines, parallel=1):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt") as f:
+            f.write("\n".join(lines))
+            f.flush()
+            try:
+                self.cli.CLI().batch(file=f.name, parallel=parallel)
+                exit_code = 0
+            except SystemExit as se:
+                exit_code = se.code
+
+        results = [
+            json.loads(line) for line in self.out.getvalue().splitlines()
+        ]
+        return exit_code, sorted(results, key=lambda r: r["line"])
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_batch(self, mock_post, mock_get):
+
+        exit_code, results = self.run_batch(
+            [
+                "# get the worker twice",
+                "k8sworker get /api/v2/worker/k8shost/5 --output json",
+                '["k8sworker", "get", "/api/v2/worker/k8shost/5", '
+                '"--output", "json"]',
+                "",
+                "k8sworker get /api/v2/worker/k8shost/999",
+                "batch",
+            ]
+        )
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual([r["line"] for r in results], [2, 3, 5, 6])
+        self.assertEqual([r["exit_code"] for r in results], [0, 0, 1, 2])
+
+        for result in results[:2]:
+            worker = json.loads(result["stdout"])
+            self.assertEqual(worker["ipaddr"], "10.1.0.186")
+            self.assertEqual(result["stderr"], "")
+        self.assertNotEqual(results[2]["stderr"], "")
+
+        # one login for all of the commands
+        logins = [
+            c for c in mock_post.call_args_list if c[0][0].endswith("/login")
+        ]
+        self.assertEqual(len(logins), 1)
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_batch_parallel(self, mock_post, mock_get):
+
+        exit_code, results = self.run_batch(
+            ["k8sworker get /api/v2/worker/k8shost/5 --output json"] * 20,
+            parallel=4,
+        )
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([r["line"] for r in results], list(range(1, 21)))
+        for result in results:
+            self.assertEqual(
+                json.loads(result["stdout"])["_links"]["self"]["href"],
+                "/api/v2/worker/k8shost/5",
+            )
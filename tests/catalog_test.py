@@ -37,8 +37,8 @@ mockApiSetup()
 
 
 class TestCatalogGet(BaseTestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_catalog_id_type(self, mock_get, mock_post):
 
         with self.assertRaisesRegexp(
@@ -53,8 +53,8 @@ class TestCatalogGet(BaseTestCase):
         ):
             get_client().catalog.get(False)
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_catalog_id_format(self, mock_get, mock_post):
 
         with self.assertRaisesRegexp(
@@ -62,8 +62,8 @@ class TestCatalogGet(BaseTestCase):
         ):
             get_client().catalog.get("garbage")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_catalog(self, mock_get, mock_post):
 
         get_client().catalog.get("/api/v1/catalog/99")
@@ -74,8 +74,8 @@ class TestCatalogGet(BaseTestCase):
         ):
             get_client().catalog.get("/api/v1/catalog/101")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_catalog_attributes(self, mock_get, mock_post):
 
         catalog = get_client().catalog.get("/api/v1/catalog/99")
@@ -120,8 +120,8 @@ class TestCatalogGet(BaseTestCase):
 
 
 class TestCatalogList(unittest.TestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_list(self, mock_get, mock_post):
 
         catalog_list = get_client().catalog.list()
@@ -129,8 +129,8 @@ class TestCatalogList(unittest.TestCase):
 
 
 class TestCatalogInstall(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_install(self, mock_get, mock_post):
 
         client = get_client()
@@ -155,8 +155,8 @@ class TestCatalogInstall(BaseTestCase):
 
         client.catalog.install("/api/v1/catalog/99")
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_install_cli_with_parameter_assertion_error(
         self, mock_get, mock_post
     ):
@@ -178,8 +178,8 @@ class TestCatalogInstall(BaseTestCase):
         # coverage seems to populate standard error (issues 93)
         self.assertTrue(stderr.endswith(expected_stderr))
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_install_cli_with_catalog_id_not_found(
         self, mock_get, mock_post
     ):
@@ -207,8 +207,8 @@ class TestCatalogInstall(BaseTestCase):
             ),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_install_cli_success(self, mock_get, mock_post):
 
         try:
@@ -226,8 +226,8 @@ class TestCatalogInstall(BaseTestCase):
 
 
 class TestCatalogRefresh(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_refresh(self, mock_get, mock_post):
 
         client = get_client()
@@ -252,8 +252,8 @@ class TestCatalogRefresh(BaseTestCase):
 
         client.catalog.refresh("/api/v1/catalog/99")
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_refresh_cli_with_parameter_assertion_error(
         self, mock_get, mock_post
     ):
@@ -275,8 +275,8 @@ class TestCatalogRefresh(BaseTestCase):
         # coverage seems to populate standard error (issues 93)
         self.assertTrue(stderr.endswith(expected_stderr))
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_refresh_cli_with_catalog_id_not_found(
         self, mock_get, mock_post
     ):
@@ -304,8 +304,8 @@ class TestCatalogRefresh(BaseTestCase):
             ),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_catalog_refresh_cli_success(self, mock_get, mock_post):
 
         try:
@@ -323,8 +323,8 @@ class TestCatalogRefresh(BaseTestCase):
 
 
 class TestCLIList(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_with_columns_and_table_output(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -345,8 +345,8 @@ class TestCLIList(BaseTestCase):
             ),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_with_columns_and_text_output(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -360,8 +360,8 @@ class TestCLIList(BaseTestCase):
         output = self.out.getvalue().strip()
         self.assertEqual(output, "Spark240  bluedata/spark240juphub7xssl")
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_with_query_and_json_ouput(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -381,8 +381,8 @@ class TestCLIList(BaseTestCase):
 
         self.assertEqual(output, '["/api/v1/catalog/29"]')
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_with_query_and_text_output(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -400,8 +400,8 @@ class TestCLIList(BaseTestCase):
 
 
 class TestCLIGet(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_get_output_is_valid_yaml(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -415,8 +415,8 @@ class TestCLIGet(BaseTestCase):
         except Exception:
             self.fail("Output should be valid yaml")
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_get_yaml_output_is_valid(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -465,8 +465,8 @@ version: '2.8'"""
             yaml.dump(yaml.load(expected_yaml, Loader=yaml.FullLoader)),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_get_json_output(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -516,8 +516,8 @@ version: '2.8'"""
             },
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_get_output_with_invalid_catalog_id(self, mock_post, mock_get):
 
         with self.assertRaises(SystemExit) as cm:
@@ -549,8 +549,8 @@ version: '2.8'"""
             )
         raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_get_output_with_unknown_exception(self, mock_post, mock_get):
 
         with self.assertRaises(SystemExit) as cm:
@@ -574,7 +574,7 @@ version: '2.8'"""
 
 
 class TestCLIDelete(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_delete(self, mock_post):
 
         with self.assertRaisesRegexp(
@@ -0,0 +1,87 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest import TestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules that must not be imported until a command needs them
+LAZY_MODULES = [
+    "pkg_resources",
+    "distutils",
+    "hpecp.async_client",
+    "hpecp.cli.base",
+    "hpecp.cli.k8scluster",
+    "hpecp.cli.k8sworker",
+]
+
+CHECK_MODULES = """
+import json, sys
+from bin import cli
+hpecp_cli = cli.CLI()
+hpecp_cli.version
+loaded = [m for m in {lazy} if m in sys.modules]
+hpecp_cli.k8sworker
+loaded_k8sworker = [m for m in {lazy} if m in sys.modules]
+print(json.dumps([loaded, loaded_k8sworker]))
+"""
+
+# generous, this catches regressions such as importing every proxy
+STARTUP_BUDGET_SECS = float(os.environ.get("HPECP_STARTUP_BUDGET_SECS", 2))
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.check_output(
+        [sys.executable, "-c", code], cwd=ROOT, env=env
+    ).decode("utf-8")
+
+
+class TestCliStartup(TestCase):
+    def test_commands_are_imported_lazily(self):
+
+        loaded, loaded_k8sworker = json.loads(
+            run_python(CHECK_MODULES.format(lazy=LAZY_MODULES))
+        )
+
+        self.assertEqual(loaded, [])
+        self.assertEqual(
+            loaded_k8sworker, ["hpecp.cli.base", "hpecp.cli.k8sworker"]
+        )
+
+    def test_startup_time(self):
+
+        timings = []
+        for _ in range(3):
+            start = time.time()
+            run_python("from bin import cli; cli.CLI()")
+            timings.append(time.time() - start)
+
+        median = sorted(timings)[1]
+        self.assertLess(
+            median,
+            STARTUP_BUDGET_SECS,
+            "CLI startup took {:.2f}s".format(median),
+        )
@@ -208,7 +208,7 @@ class TestCLIConfig(TestCase):
 
 
 class TestBaseProxy(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_list_with_invalid_column(self, mock_post):
 
         with self.assertRaises(SystemExit) as cm:
@@ -227,7 +227,7 @@ class TestBaseProxy(BaseTestCase):
 
         self.assertEqual(cm.exception.code, 1)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_list_with_invalid_columns_list(self, mock_post):
 
         with self.assertRaises(SystemExit) as cm:
@@ -246,7 +246,7 @@ class TestBaseProxy(BaseTestCase):
 
         self.assertEqual(cm.exception.code, 1)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_list_with_invalid_output_param(self, mock_post):
 
         with self.assertRaises(SystemExit) as cm:
@@ -304,8 +304,8 @@ class TestCLIHttpClient(BaseTestCase):
             )
         raise RuntimeError("Unhandle POST request: " + args[0])
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=mocked_requests_failed_login)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=mocked_requests_failed_login)
     def test_get_failed_login(self, mock_get, mock_post):
 
         # TODO move this to TestCLI class
@@ -327,8 +327,8 @@ class TestCLIHttpClient(BaseTestCase):
             "Expected: `{}` Actual: `{}`".format(expected_err, actual_err),
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get(self, mock_get, mock_post):
 
         hpecp = self.cli.CLI()
@@ -346,8 +346,8 @@ class TestCLIHttpClient(BaseTestCase):
             )
         raise RuntimeError("Unhandle DELETE request: " + args[0])
 
-    @patch("requests.delete", side_effect=mocked_requests_delete)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.delete", side_effect=mocked_requests_delete)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_delete(self, mock_delete, mock_post):
 
         hpecp = self.cli.CLI()
@@ -359,7 +359,7 @@ class TestCLIHttpClient(BaseTestCase):
 
     def test_post(self):
 
-        with patch("requests.post") as mock_requests:
+        with patch("requests.Session.post") as mock_requests:
             mock_requests.side_effect = BaseTestCase.httpPostHandlers
 
             with tempfile.NamedTemporaryFile() as json_file:
@@ -395,10 +395,10 @@ class TestCLIHttpClient(BaseTestCase):
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_put(self, mock_post):
 
-        with patch("requests.put") as mock_requests:
+        with patch("requests.Session.put") as mock_requests:
             mock_requests.side_effect = BaseTestCase.httpPutHandlers
 
             with tempfile.NamedTemporaryFile() as json_file:
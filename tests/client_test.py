@@ -18,8 +18,10 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
+import logging
 import os
 import tempfile
+from multiprocessing.pool import ThreadPool
 from textwrap import dedent
 from unittest import TestCase
 
@@ -27,6 +29,8 @@ import requests
 from mock import patch
 
 from hpecp import ContainerPlatformClient, ContainerPlatformClientException
+from hpecp.exceptions import APIUnauthorizedException
+from hpecp.logger import Logger
 
 from .base import BaseTestCase, MockResponse
 from .client_mock_api_responses import mockApiSetup
@@ -151,7 +155,7 @@ class TestCreateFromEnvVar(TestCase):
 
 
 class TestAuth(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create_session(self, mock_post):
 
         client = ContainerPlatformClient(
@@ -164,7 +168,7 @@ class TestAuth(BaseTestCase):
 
         self.assertIsInstance(client.create_session(), ContainerPlatformClient)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create_session_chained(self, mock_post):
 
         client = ContainerPlatformClient(
@@ -177,7 +181,7 @@ class TestAuth(BaseTestCase):
 
         self.assertIsInstance(client, ContainerPlatformClient)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_auth_ssl(self, mock_post):
 
         client = ContainerPlatformClient(
@@ -199,7 +203,9 @@ class TestAuth(BaseTestCase):
             )
         raise RuntimeError("Unhandle POST request: " + args[0])
 
-    @patch("requests.post", side_effect=mocked_requests_post_return_500)
+    @patch(
+        "requests.Session.post", side_effect=mocked_requests_post_return_500
+    )
     def test_auth_ssl_with_error(self, mock_post):
 
         client = ContainerPlatformClient(
@@ -212,3 +218,190 @@ class TestAuth(BaseTestCase):
 
         with self.assertRaises(requests.exceptions.HTTPError):
             client.create_session()
+
+
+class TestHttpSession(TestCase):
+    def get_client(self, **kwargs):
+        return ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            api_port=8080,
+            use_ssl=True,
+            **kwargs
+        )
+
+    def test_http_session_is_shared_and_pooled(self):
+
+        client = self.get_client(pool_connections=2, pool_maxsize=25)
+
+        session = client.http_session
+        self.assertIs(session, client.http_session)
+
+        adapter = session.get_adapter("https://127.0.0.1:8080/api/v1/login")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+    def test_http_session_is_created_once(self):
+
+        client = self.get_client()
+        pool = ThreadPool(8)
+        try:
+            sessions = pool.map(lambda _: client.http_session, range(64))
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(len(set(id(session) for session in sessions)), 1)
+
+    def test_http_session_without_keep_alive(self):
+
+        client = self.get_client(keep_alive=False)
+        self.assertEqual(client.http_session.headers["Connection"], "close")
+
+    def test_invalid_pool_maxsize(self):
+
+        with self.assertRaises(AssertionError):
+            self.get_client(pool_maxsize=0)
+
+    def test_close_and_context_manager(self):
+
+        with self.get_client() as client:
+            session = client.http_session
+
+        self.assertIsNone(client._http_session)
+        # a new pool is created if the client is used after close()
+        self.assertIsNot(client.http_session, session)
+
+
+class CountingMockResponse(MockResponse):
+    def __init__(self, *args, **kwargs):
+        super(CountingMockResponse, self).__init__(*args, **kwargs)
+        self.json_calls = 0
+
+    def json(self):
+        self.json_calls += 1
+        return self.json_data
+
+
+class TestRequestLogging(BaseTestCase):
+    def setUp(self):
+        super(TestRequestLogging, self).setUp()
+        self.log = Logger.get_logger()
+        self.saved_log_level = self.log.level
+
+    def tearDown(self):
+        self.log.setLevel(self.saved_log_level)
+        super(TestRequestLogging, self).tearDown()
+
+    def get_client(self, **kwargs):
+        client = ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            api_port=8080,
+            use_ssl=True,
+            **kwargs
+        )
+        return client.create_session()
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_body_is_parsed_once(self, mock_post):
+
+        client = self.get_client()
+
+        for level in [logging.INFO, logging.DEBUG]:
+            response = CountingMockResponse(
+                json_data={"k8smanifest": "large"}, status_code=200, headers={}
+            )
+            self.log.setLevel(level)
+            with patch("requests.Session.get", return_value=response):
+                res = client._request("/api/v2/k8smanifest")
+                self.assertEqual(res.json(), {"k8smanifest": "large"})
+                res.json()
+            self.assertEqual(response.json_calls, 1)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_response_body_not_logged_at_info(self, mock_post):
+
+        response = CountingMockResponse(
+            json_data={"a": 1}, status_code=200, headers={}
+        )
+        client = self.get_client()
+
+        self.log.setLevel(logging.INFO)
+        with patch("requests.Session.get", return_value=response):
+            client._request("/api/v1/config")
+
+        self.assertEqual(response.json_calls, 0)
+
+    def test_truncate_log_body(self):
+
+        client = ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            log_max_body_bytes=4,
+        )
+
+        self.assertEqual(
+            client._truncate_log_body("0123456789"),
+            "0123... [truncated 6 of 10 bytes]",
+        )
+        self.assertEqual(client._truncate_log_body("0123"), "0123")
+
+        client.log_max_body_bytes = None
+        self.assertEqual(client._truncate_log_body("0123456789"), "0123456789")
+
+
+class TestUnauthorized(BaseTestCase):
+    def get_client(self):
+        return ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            api_port=8080,
+            use_ssl=True,
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_expired_session_is_recreated(self, mock_post):
+
+        responses = [
+            MockResponse(
+                json_data={},
+                status_code=401,
+                headers={},
+                raise_for_status_flag=True,
+            ),
+            MockResponse(json_data={"ok": True}, status_code=200, headers={}),
+        ]
+        sessions = []
+
+        client = self.get_client().resume_session("/api/v1/session/expired")
+        client.on_session_created = lambda c: sessions.append(c.session_id)
+
+        with patch("requests.Session.get", side_effect=responses):
+            response = client._request("/api/v1/config")
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(
+            sessions,
+            ["/api/v1/session/df1bfacb-xxxx-xxxx-xxxx-c8f57d8f3c71"],
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_unauthorized_after_login(self, mock_post):
+
+        response = MockResponse(
+            json_data={},
+            status_code=401,
+            headers={},
+            raise_for_status_flag=True,
+        )
+
+        client = self.get_client().create_session()
+
+        with patch("requests.Session.get", return_value=response):
+            with self.assertRaises(APIUnauthorizedException):
+                client._request("/api/v1/config")
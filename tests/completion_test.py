@@ -0,0 +1,205 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from unittest import TestCase
+
+from mock import MagicMock, patch
+
+from hpecp.cli.completion import (
+    bash_script,
+    build_metadata,
+    fish_script,
+    load_metadata,
+    metadata_path,
+    zsh_script,
+)
+
+MODULES = {
+    "k8sworker": {
+        "list": ["--output", "--columns", "--query"],
+        "get": ["--id", "--output"],
+        "create_with_ssh_key": ["--ip", "--ssh_key_file"],
+    }
+}
+COLUMNS = {"k8sworker": ["id", "ipaddr", "hostname"]}
+
+BASH_COMPLETE = """
+source "$1"
+shift
+COMP_WORDS=("$@")
+COMP_CWORD=$((${#COMP_WORDS[@]} - 1))
+_hpecp_complete 2>/dev/null
+echo "${COMPREPLY[*]}"
+"""
+
+
+class TestCompletionMetadata(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        patcher = patch.dict(
+            os.environ, {"HPECP_COMPLETION_CACHE_DIR": self.cache_dir}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_build_metadata_uses_command_line_names(self):
+        metadata = build_metadata(MODULES, COLUMNS)
+
+        self.assertIn("k8sworker", metadata["commands"])
+        self.assertIn("version", metadata["commands"])
+        self.assertEqual(
+            metadata["functions"]["k8sworker"]["create-with-ssh-key"],
+            ["--ip", "--ssh-key-file"],
+        )
+        self.assertEqual(metadata["columns"], COLUMNS)
+
+    def test_metadata_is_cached_per_version(self):
+        compute = MagicMock(return_value=build_metadata(MODULES, COLUMNS))
+
+        metadata = load_metadata("1.0", compute)
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(
+            metadata_path("1.0"),
+            os.path.join(self.cache_dir, "completion-1.0.json"),
+        )
+        with open(metadata_path("1.0")) as f:
+            self.assertEqual(json.load(f), json.loads(json.dumps(metadata)))
+
+        self.assertEqual(load_metadata("1.0", compute), metadata)
+        self.assertEqual(compute.call_count, 1)
+
+        # a new version, or a refresh, recomputes the metadata
+        load_metadata("1.1", compute)
+        load_metadata("1.1", compute, refresh=True)
+        self.assertEqual(compute.call_count, 3)
+
+    def test_metadata_is_computed_if_cache_is_unreadable(self):
+        with open(metadata_path("1.0"), "w") as f:
+            f.write("{not json")
+        compute = MagicMock(return_value=build_metadata(MODULES, COLUMNS))
+
+        load_metadata("1.0", compute)
+        self.assertEqual(compute.call_count, 1)
+
+    def test_temporary_file_is_removed_if_write_fails(self):
+        compute = MagicMock(return_value=build_metadata(MODULES, COLUMNS))
+
+        with patch("hpecp.json_file.os.rename", side_effect=OSError):
+            metadata = load_metadata("1.0", compute)
+
+        self.assertEqual(metadata, compute.return_value)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+class TestCompletionScripts(TestCase):
+    def setUp(self):
+        self.metadata = json.loads(
+            json.dumps(build_metadata(MODULES, COLUMNS))
+        )
+
+    def complete(self, *words):
+        with tempfile.NamedTemporaryFile("w", suffix=".sh") as f:
+            f.write(bash_script(self.metadata))
+            f.flush()
+            command = ["bash", "-c", BASH_COMPLETE, "bash", f.name, "hpecp"]
+            output = subprocess.check_output(command + list(words))
+        return output.decode("utf-8").split()
+
+    def test_bash_script_does_not_start_processes(self):
+        script = bash_script(self.metadata)
+        self.assertNotIn("grep", script)
+        self.assertNotIn("$(", script)
+        self.assertNotIn("`", script)
+        self.assertIn("complete -F _hpecp_complete hpecp", script)
+
+    def test_bash3_fallback(self):
+        script = bash_script(self.metadata)
+        self.assertLess(
+            script.index("BASH_VERSINFO"), script.index("declare -A")
+        )
+        # eval the script as bash 3 would, without associative arrays;
+        # it must not leave the shell that evaluates it
+        with tempfile.NamedTemporaryFile("w", suffix=".sh") as f:
+            f.write(script.replace("BASH_VERSINFO[0] < 4", "1"))
+            f.flush()
+            output = subprocess.check_output(
+                [
+                    "bash",
+                    "-c",
+                    'eval "$(<"$1")"; complete -p hpecp; declare -p; echo done',
+                    "bash",
+                    f.name,
+                ]
+            )
+        self.assertIn(b"complete -W", output)
+        self.assertNotIn(b"_HPECP_FUNCTIONS", output)
+        self.assertTrue(output.endswith(b"done\n"))
+
+    def test_bash_completion(self):
+        self.assertEqual(self.complete("k8s"), ["k8sworker"])
+        self.assertEqual(
+            self.complete("k8sworker", "c"), ["create-with-ssh-key"]
+        )
+        self.assertEqual(
+            self.complete("k8sworker", "list", "--output", "j"),
+            ["json", "json-pp"],
+        )
+        self.assertEqual(
+            self.complete("k8sworker", "get", "--output", ""),
+            ["yaml", "json", "json-pp"],
+        )
+        # columns already entered are not offered again
+        self.assertEqual(
+            self.complete("k8sworker", "list", "--columns", "id,"),
+            ["id,ipaddr", "id,hostname"],
+        )
+        # parameters already entered are not offered again
+        self.assertEqual(
+            self.complete("k8sworker", "list", "--output", "json", "--"),
+            ["--columns", "--query"],
+        )
+        self.assertEqual(
+            self.complete("autocomplete", ""), ["bash", "zsh", "fish"]
+        )
+
+    def test_zsh_script(self):
+        script = zsh_script(self.metadata)
+        self.assertIn("'k8sworker.list' '--output --columns --query'", script)
+        self.assertIn("'k8sworker' 'id ipaddr hostname'", script)
+        self.assertIn("compdef _hpecp hpecp", script)
+
+    def test_fish_script(self):
+        script = fish_script(self.metadata)
+        self.assertIn(
+            "complete -c hpecp -n '__hpecp_in k8sworker list' -l output -x "
+            "-a 'table text ndjson csv json json-pp'",
+            script,
+        )
+        self.assertIn(
+            "complete -c hpecp -n '__hpecp_in k8sworker create-with-ssh-key' "
+            "-l ssh-key-file -r -F",
+            script,
+        )
@@ -30,7 +30,7 @@ mockApiSetup()
 
 
 class TestTentants(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_epic_tenant_list(self, mock_post):
 
         client = ContainerPlatformClient(
@@ -46,8 +46,8 @@ class TestGatewayList(BaseTestCase):
         # mockApiPostSetup()
         super(TestGatewayList, self).setUp()
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_list(self, mock_get, mock_post):
 
         # calls POST https://127.0.0.1:8080/api/v1/login
@@ -60,14 +60,103 @@ class TestGatewayList(BaseTestCase):
             self.fail(e)
 
 
+class TestWorkerInventory(BaseTestCase):
+    def setUp(self):
+        mockApiGetSetup()
+        mockApiPostSetup()
+        super(TestWorkerInventory, self).setUp()
+
+    def workers_requests(self, mock_get):
+        return [
+            c
+            for c in mock_get.call_args_list
+            if c[0][0] == "https://127.0.0.1:8080/api/v1/workers"
+        ]
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_workers_are_retrieved_once(self, mock_post, mock_get):
+
+        client = get_client()
+
+        gateways = client.gateway.list()
+        client.epic_worker.list()
+        self.assertEqual(len(self.workers_requests(mock_get)), 1)
+        self.assertEqual(
+            [g.id for g in gateways.resources], ["/api/v1/workers/2"]
+        )
+
+        # get() is served from the inventory, including the purpose check
+        mock_get.reset_mock()
+        self.assertEqual(
+            client.gateway.get("/api/v1/workers/2").id, "/api/v1/workers/2"
+        )
+        with self.assertRaises(APIItemNotFoundException):
+            client.gateway.get("/api/v1/workers/1")
+        self.assertEqual(mock_get.call_count, 0)
+
+        client.worker_inventory.invalidate()
+        client.gateway.list()
+        self.assertEqual(len(self.workers_requests(mock_get)), 1)
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_changing_a_worker_does_not_change_the_snapshot(
+        self, mock_post, mock_get
+    ):
+
+        client = get_client()
+
+        gateway = client.gateway.list().resources[0]
+        gateway.json["purpose"] = "worker"
+        gateway.json["_links"]["self"]["href"] = "/api/v1/workers/9"
+
+        gateway = client.gateway.get("/api/v1/workers/2")
+        self.assertEqual(gateway.purpose, "proxy")
+        gateway.json["_links"]["self"]["href"] = "/api/v1/workers/9"
+
+        self.assertEqual(
+            [g.id for g in client.gateway.list().resources],
+            ["/api/v1/workers/2"],
+        )
+        self.assertEqual(len(self.workers_requests(mock_get)), 1)
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_refresh_window(self, mock_post, mock_get):
+
+        client = get_client()
+        client.worker_inventory.refresh_secs = 0
+
+        client.gateway.list()
+        client.epic_worker.list()
+        self.assertEqual(len(self.workers_requests(mock_get)), 2)
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_create_invalidates_inventory(self, mock_post, mock_get):
+
+        client = get_client()
+
+        client.gateway.list()
+        self.assertTrue(client.worker_inventory.is_fresh())
+
+        client.gateway.create_with_ssh_key(
+            ip="127.0.0.1",
+            proxy_node_hostname="somehost",
+            ssh_key_data="test_ssh_key",
+        )
+        self.assertFalse(client.worker_inventory.is_fresh())
+
+
 class TestGatewayGet(BaseTestCase):
     def setUp(self):
         mockApiGetSetup()
         mockApiPostSetup()
         super(TestGatewayGet, self).setUp()
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_gateway_assertions(self, mock_get, mock_post):
 
         with self.assertRaisesRegexp(
@@ -81,8 +170,8 @@ class TestGatewayGet(BaseTestCase):
         ):
             get_client().gateway.get("garbage")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_gateway(self, mock_get, mock_post):
 
         gateway = get_client().gateway.get("/api/v1/workers/99")
@@ -118,8 +207,8 @@ class TestGatewayGet(BaseTestCase):
         ):
             get_client().gateway.get("/api/v1/workers/97")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_gateway_sysinfo(self, mock_get, mock_post):
 
         gateway = get_client().gateway.get("/api/v1/workers/98")
@@ -137,7 +226,7 @@ class TestCreateGateway(BaseTestCase):
         mockApiPostSetup()
         super(TestCreateGateway, self).setUp()
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create_with_ssh_key_assertions(self, mock_post):
 
         with self.assertRaisesRegexp(
@@ -169,7 +258,7 @@ class TestCreateGateway(BaseTestCase):
                 ssh_key_data=1234,
             )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create_with_ssh_key_returns_id(self, mock_post):
 
         get_client().gateway.create_with_ssh_key(
@@ -185,8 +274,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
         mockApiPostSetup()
         super(TestWaitForGatewayStatus, self).setUp()
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_assertions(self, mock_get, mock_post):
 
         # FIXME speed these tests up
@@ -234,8 +323,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
                 gateway_id="/api/v1/workers/123", timeout_secs=1, state=["abc"]
             )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway(self, mock_get, mock_post):
 
         self.assertTrue(
@@ -286,8 +375,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
             )
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_cli(self, mock_get, mock_post):
 
         hpecp = self.cli.CLI()
@@ -297,8 +386,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
             states=[GatewayStatus.installed.name],
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_cli_fail_to_reach_state(
         self, mock_get, mock_post
     ):
@@ -323,8 +412,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
         # coverage seems to populate standard error (issues 93)
         self.assertTrue(stderr.endswith(expected_stderr))
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_cli_multiple_states(
         self, mock_get, mock_post
     ):
@@ -339,8 +428,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
             ],
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_cli_fail_to_reach_state_with_multiple_states(
         self, mock_get, mock_post
     ):
@@ -367,8 +456,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
         # coverage seems to populate standard error (issues 93)
         self.assertTrue(stderr.endswith(expected_stderr))
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_cli_gateway_id_does_not_exist(
         self, mock_get, mock_post
     ):
@@ -383,8 +472,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
             )
         self.assertEqual(cm.exception.code, 1)
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_gateway_cli_gateway_id_does_not_exist_and_no_status(
         self, mock_get, mock_post
     ):
@@ -399,8 +488,8 @@ class TestWaitForGatewayStatus(BaseTestCase):
         except SystemExit:
             self.fail("Should not raise a SystemExit")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_delete_gateway_cli_gateway_id_does_not_exist_and_no_status(
         self, mock_get, mock_post
     ):
@@ -413,7 +502,7 @@ class TestWaitForGatewayStatus(BaseTestCase):
         except SystemExit:
             self.fail("Should not raise a SystemExit")
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_states(self, mock_post):
 
         # TODO move me - I don't really belong in the
@@ -490,9 +579,9 @@ class TestDeleteGateway(BaseTestCase):
         raise RuntimeError("Unhandle POST request: " + args[0])
 
     # delete() does a get() request to check the worker has 'purpose':'proxy'
-    @patch("requests.get", side_effect=mocked_requests_get)
-    @patch("requests.delete", side_effect=mocked_requests_delete)
-    @patch("requests.post", side_effect=mocked_requests_post)
+    @patch("requests.Session.get", side_effect=mocked_requests_get)
+    @patch("requests.Session.delete", side_effect=mocked_requests_delete)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
     def test_delete_gateway(self, mock_get, mock_post, mock_delete):
 
         with self.assertRaisesRegexp(
@@ -563,7 +652,7 @@ class TestCliCreate(BaseTestCase):
             return session_mock_response()
         raise RuntimeError("Unhandle POST request: " + args[0])
 
-    @patch("requests.post", side_effect=mocked_requests_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
     @patch("hpecp.gateway")
     def test_with_only_ssh_key_content_provided(self, mock_post, mock_gateway):
 
@@ -597,7 +686,7 @@ class TestCliCreate(BaseTestCase):
 
         self.assertEqual(stdout, "/api/v1/workers/1")
 
-    @patch("requests.post", side_effect=mocked_requests_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
     @patch("hpecp.gateway")
     def test_with_only_ssh_key_content_provided_raises_assertion_error(
         self, mock_post, mock_gateway
@@ -629,7 +718,7 @@ class TestCliCreate(BaseTestCase):
             "Expected: `{}`, Actual: `{}`".format(expected_err, stderr),
         )
 
-    @patch("requests.post", side_effect=mocked_requests_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
     @patch("hpecp.gateway")
     def test_with_only_ssh_key_content_provided_raises_conflict_exception(
         self, mock_post, mock_gateway
@@ -665,7 +754,7 @@ class TestCliCreate(BaseTestCase):
             "Expected: `{}`, Actual: `{}`".format(expected_err, stderr),
         )
 
-    @patch("requests.post", side_effect=mocked_requests_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
     @patch("hpecp.gateway")
     def test_with_only_ssh_key_content_provided_raises_general_exception(
         self, mock_post, mock_gateway
@@ -699,7 +788,7 @@ class TestCliCreate(BaseTestCase):
             "Expected: `{}`, Actual: `{}`".format(expected_err, stderr),
         )
 
-    @patch("requests.post", side_effect=mocked_requests_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
     @patch("hpecp.gateway")
     def test_with_only_ssh_key_file_provided(self, mock_post, mock_gateway):
 
@@ -750,8 +839,8 @@ class TestCliDelete(BaseTestCase):
             )
         raise RuntimeError("Unhandle POST request: " + args[0])
 
-    @patch("requests.post", side_effect=mocked_requests_post)
-    # @patch("requests.del", side_effect=mocked_requests_delete)
+    @patch("requests.Session.post", side_effect=mocked_requests_post)
+    # @patch("requests.Session.del", side_effect=mocked_requests_delete)
     def test_delete_with_unknown_exception(self, mock_post):
         @patch("hpecp.base_resource.AbstractController")
         def delete(self, id):
@@ -0,0 +1,126 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import copy
+import unittest
+
+from mock import MagicMock, patch
+
+from hpecp.inventory_sync import (
+    InventorySync,
+    ResourceChange,
+    content_hash,
+)
+from hpecp.user import User
+
+from .base import BaseTestCase, get_client
+from .base_resource_test import user_json
+from .k8s_worker_mock_api_responses import mockApiSetup
+
+# setup the mock data
+mockApiSetup()
+
+
+class TestContentHash(unittest.TestCase):
+    def test_content_hash(self):
+        # the digest of the canonical json, the same in every process
+        self.assertEqual(
+            content_hash({"b": [2], "a": 1}),
+            "cb122dc9a6111e16c6c6408a4a5e33b81289eec0",
+        )
+        self.assertEqual(
+            content_hash({"a": 1, "b": [2]}), content_hash({"b": [2], "a": 1})
+        )
+        self.assertNotEqual(
+            content_hash({"a": 1, "b": [2]}), content_hash({"a": 1, "b": [3]})
+        )
+
+
+class TestInventorySyncDiff(unittest.TestCase):
+    def setUp(self):
+        controller = MagicMock()
+        controller.resource_class = User
+        self.sync = InventorySync(controller)
+
+    def test_added_changed_removed(self):
+
+        first = [user_json(i, "user{}".format(i)) for i in range(3)]
+        changes = self.sync.diff(first)
+        self.assertEqual(
+            [(c.kind, c.id) for c in changes],
+            [
+                (ResourceChange.added, u["_links"]["self"]["href"])
+                for u in first
+            ],
+        )
+
+        second = copy.deepcopy(first[1:])
+        second[0]["label"]["description"] = "changed"
+        second.append(user_json(3, "user3"))
+
+        changes = self.sync.diff(second)
+        self.assertEqual(
+            [(c.kind, c.id) for c in changes],
+            [
+                (ResourceChange.changed, "/api/v1/user/1"),
+                (ResourceChange.added, "/api/v1/user/3"),
+                (ResourceChange.removed, "/api/v1/user/0"),
+            ],
+        )
+        self.assertEqual(changes[0].resource.description, "changed")
+        self.assertEqual(changes[0].previous.description, "a user")
+        self.assertIsNone(changes[2].resource)
+        self.assertEqual(changes[2].previous.name, "user0")
+
+        # no changes, and key order does not matter
+        reordered = [dict(reversed(list(u.items()))) for u in second]
+        self.assertEqual(self.sync.diff(reordered), [])
+
+    def test_reset(self):
+
+        self.sync.diff([user_json(1)])
+        self.sync.reset()
+        self.assertEqual(self.sync.snapshot, {})
+        self.assertEqual(len(self.sync.diff([user_json(1)])), 1)
+
+
+class TestInventorySync(BaseTestCase):
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_listeners(self, mock_post, mock_get):
+
+        sync = InventorySync(get_client().k8s_worker)
+        seen = []
+        sync.add_listener(seen.append)
+
+        changes = sync.sync()
+        self.assertEqual(seen, changes)
+        self.assertEqual(
+            [c.resource.worker_id for c in changes],
+            [4, 5],
+        )
+
+        self.assertEqual(sync.sync(), [])
+        self.assertEqual(len(seen), 2)
+
+        sync.remove_listener(seen.append)
+        sync.reset()
+        sync.sync()
+        self.assertEqual(len(seen), 2)
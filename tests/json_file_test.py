@@ -0,0 +1,63 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+from unittest import TestCase
+
+from mock import patch
+
+from hpecp.json_file import write_json_file
+
+
+class TestWriteJsonFile(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "cache.json")
+
+    def test_write(self):
+        write_json_file(self.path, {"a": [1, 2]})
+        write_json_file(self.path, {"b": None})
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"b": None})
+        self.assertEqual(os.listdir(self.directory), ["cache.json"])
+        if os.name == "posix":
+            self.assertEqual(
+                stat.S_IMODE(os.stat(self.path).st_mode),
+                stat.S_IRUSR | stat.S_IWUSR,
+            )
+
+    def test_failed_write_is_cleaned_up(self):
+        write_json_file(self.path, {"a": 1})
+
+        with patch("hpecp.json_file.os.rename", side_effect=OSError):
+            with self.assertRaises(OSError):
+                write_json_file(self.path, {"a": 2})
+        with self.assertRaises(TypeError):
+            write_json_file(self.path, {"a": set()})
+
+        self.assertEqual(os.listdir(self.directory), ["cache.json"])
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"a": 1})
@@ -0,0 +1,213 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+from unittest import TestCase
+
+from mock import patch
+
+from hpecp.json_stream import iter_json_array
+
+from .base import BaseTestCase, MockResponse, get_client
+
+
+def chunked(data, size):
+    starts = range(0, len(data), size)
+    return [data[start:][:size] for start in starts]
+
+
+DOCUMENT = {
+    "_links": {"self": {"href": "/api/v1/user"}},
+    "decoy": [{"_embedded": {"users": ["not", "these"]}}, ']}{\\"'],
+    "_embedded": {
+        "other": [1, 2],
+        "users": [
+            {"id": i, "name": '\u00e9 ]}},[ \\"{}"'.format(i), "n": 1.5}
+            for i in range(20)
+        ],
+    },
+    "trailing": True,
+}
+
+
+class TestIterJsonArray(TestCase):
+    def test_any_chunk_size(self):
+
+        data = json.dumps(DOCUMENT).encode("utf-8")
+        expected = DOCUMENT["_embedded"]["users"]
+
+        for size in [1, 2, 7, 64, len(data)]:
+            self.assertEqual(
+                list(
+                    iter_json_array(
+                        chunked(data, size), ["_embedded", "users"]
+                    )
+                ),
+                expected,
+            )
+
+    def test_numbers_split_between_chunks(self):
+
+        self.assertEqual(
+            list(iter_json_array(['{"a": [12', "34, 5]}"], ["a"])), [1234, 5]
+        )
+
+    def test_floats_split_between_chunks(self):
+
+        data = '{"_embedded":{"users":[95881.30805844357,1,-2.5e-10,1E+3]}}'
+        expected = [95881.30805844357, 1, -2.5e-10, 1e3]
+
+        # 1 byte chunks split after each '.', 'e', '-' and '+'
+        self.assertEqual(
+            list(
+                iter_json_array(
+                    chunked(data.encode("utf-8"), 1), ["_embedded", "users"]
+                )
+            ),
+            expected,
+        )
+        self.assertEqual(
+            list(iter_json_array(['{"a": [1.', "5e", "-", "3]}"], ["a"])),
+            [1.5e-3],
+        )
+
+    def test_missing_path(self):
+
+        self.assertEqual(
+            list(iter_json_array(['{"a": {"b": []}}'], ["_embedded", "b"])), []
+        )
+
+    def test_stops_reading_after_array(self):
+        def chunks():
+            yield '{"a": [1, 2], '
+            raise AssertionError("read past the end of the array")
+
+        self.assertEqual(list(iter_json_array(chunks(), ["a"])), [1, 2])
+
+    def test_invalid_json(self):
+
+        with self.assertRaises(ValueError):
+            list(iter_json_array(['{"a": [1, {"b": '], ["a"]))
+
+
+class StreamingMockResponse(MockResponse):
+    def __init__(self, json_data):
+        super(StreamingMockResponse, self).__init__(
+            json_data=None, status_code=200, headers={}
+        )
+        self.data = json.dumps(json_data).encode("utf-8")
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        return iter(chunked(self.data, chunk_size))
+
+    def close(self):
+        self.closed = True
+
+
+class TestIterList(BaseTestCase):
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_iter_list(self, mock_post):
+
+        users = [
+            {
+                "_links": {"self": {"href": "/api/v1/user/{}".format(i)}},
+                "label": {"name": "user{}".format(i), "description": ""},
+            }
+            for i in range(5)
+        ]
+        response = StreamingMockResponse({"_embedded": {"users": users}})
+
+        with patch("requests.Session.get", return_value=response) as get:
+            names = [
+                u.name for u in get_client().user.iter_list(chunk_size=16)
+            ]
+
+        self.assertEqual(names, ["user{}".format(i) for i in range(5)])
+        self.assertTrue(get.call_args[1]["stream"])
+        self.assertTrue(response.closed)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_iter_list_filters_worker_purpose(self, mock_post):
+
+        workers = [
+            {
+                "_links": {"self": {"href": "/api/v1/workers/{}".format(i)}},
+                "purpose": purpose,
+            }
+            for i, purpose in enumerate(["proxy", "worker", "proxy"])
+        ]
+        response = StreamingMockResponse({"_embedded": {"workers": workers}})
+
+        with patch("requests.Session.get", return_value=response):
+            ids = [g.id for g in get_client().gateway.iter_list(compact=True)]
+
+        self.assertEqual(ids, ["/api/v1/workers/0", "/api/v1/workers/2"])
+
+
+class TestCliStreamingOutput(BaseTestCase):
+    def users_response(self):
+        users = [
+            {
+                "_links": {"self": {"href": "/api/v1/user/{}".format(i)}},
+                "label": {"name": "user{}".format(i), "description": ""},
+                "is_external": i == 1,
+            }
+            for i in range(3)
+        ]
+        return StreamingMockResponse({"_embedded": {"users": users}})
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_ndjson(self, mock_post):
+
+        with patch("requests.Session.get", return_value=self.users_response()):
+            hpecp_cli = self.cli.CLI()
+            hpecp_cli.user.list(output="ndjson", columns="id,name")
+
+        lines = self.out.getvalue().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                {"id": "/api/v1/user/{}".format(i), "name": "user{}".format(i)}
+                for i in range(3)
+            ],
+        )
+        self.assertEqual(lines[0], '{"id": "/api/v1/user/0", "name": "user0"}')
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_csv(self, mock_post):
+
+        with patch("requests.Session.get", return_value=self.users_response()):
+            hpecp_cli = self.cli.CLI()
+            hpecp_cli.user.list(output="csv", columns="id,is_external")
+
+        self.assertEqual(
+            self.out.getvalue(),
+            "id,is_external\n"
+            "/api/v1/user/0,False\n"
+            "/api/v1/user/1,True\n"
+            "/api/v1/user/2,False\n",
+        )
+
+    def test_csv_with_query_is_rejected(self):
+
+        hpecp_cli = self.cli.CLI()
+        with self.assertRaises(SystemExit):
+            hpecp_cli.user.list(output="csv", query="[*]")
@@ -21,6 +21,7 @@
 import json
 from unittest import TestCase
 
+import yaml
 from mock import patch
 
 from hpecp import APIException, APIItemNotFoundException
@@ -38,8 +39,8 @@ mockApiSetup()
 
 
 class TestClusterList(BaseTestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_k8sclusters(self, mock_get, mock_post):
 
         # Makes GET Request: https://127.0.0.1:8080/api/v2/k8sclusters/
@@ -135,9 +136,10 @@ class TestClusterList(BaseTestCase):
         raise RuntimeError("Unhandle GET request: " + args[0])
 
     @patch(
-        "requests.get", side_effect=mocked_requests_get_missing_cluster_props
+        "requests.Session.get",
+        side_effect=mocked_requests_get_missing_cluster_props,
     )
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_k8sclusters_missing_props(self, mock_get, mock_post):
 
         # Makes GET Request: https://127.0.0.1:8080/api/v2/k8sclusters/
@@ -155,8 +157,8 @@ class TestClusterList(BaseTestCase):
         self.assertEqual(clusters[0].dashboard_endpoint_access, "")
         self.assertEqual(clusters[0].status_message, "")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_k8sclusters_tabulate_all_columns(self, mock_get, mock_post):
 
         expected_tabulate_output = (
@@ -181,8 +183,8 @@ class TestClusterList(BaseTestCase):
             expected_tabulate_output,
         )  # noqa: E501
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_k8sclusters_tabulate_with_column_list(self, mock_get, mock_post):
 
         k8scluster_list = get_client().k8s_cluster.list()
@@ -197,7 +199,7 @@ class TestClusterList(BaseTestCase):
 
 
 class TestCreateCluster(TestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create(self, mock_post):
 
         with self.assertRaisesRegexp(
@@ -344,7 +346,9 @@ class TestCreateCluster(TestCase):
             )
         raise RuntimeError("Unhandle POST request: " + args[0])
 
-    @patch("requests.post", side_effect=mocked_requests_create_error_post)
+    @patch(
+        "requests.Session.post", side_effect=mocked_requests_create_error_post
+    )
     def test_create_with_APIException(self, mock_post):
 
         with self.assertRaises(APIException):
@@ -357,8 +361,8 @@ class TestCreateCluster(TestCase):
 
 
 class TestGetCluster(TestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_k8scluster(self, mock_get, mock_post):
 
         with self.assertRaises(APIItemNotFoundException):
@@ -455,8 +459,8 @@ class TestWaitForClusterStatus(BaseTestCase):
     #         )
     #     raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_k8scluster_assertions(self, mock_get, mock_post):
 
         # FIXME speed these tests up
@@ -509,8 +513,8 @@ class TestWaitForClusterStatus(BaseTestCase):
                 status=["abc"],
             )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_wait_for_status_k8scluster_body(self, mock_get, mock_post):
 
         self.assertTrue(
@@ -572,8 +576,10 @@ class TestDeleteCluster(BaseTestCase):
 
     # pylint: disable=no-method-argument
 
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_delete_k8scluster(self, mock_get, mock_post):
 
         # pylint: disable=anomalous-backslash-in-string
@@ -592,8 +598,10 @@ class TestDeleteCluster(BaseTestCase):
             id=TestDeleteCluster.existing_cluster_url
         )
 
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_delete_k8scluster_cli(self, mock_delete, mock_get):
 
         try:
@@ -614,8 +622,10 @@ class TestDeleteCluster(BaseTestCase):
         except Exception:
             self.fail("Unexpected exception.")
 
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_delete_k8scluster_cli_with_exception(self, mock_delete, mock_get):
 
         with self.assertRaises(SystemExit) as cm:
@@ -703,8 +713,8 @@ class TestK8sSupportVersions(BaseTestCase):
     #         )
     #     raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_k8s_supported_versions(self, mock_get, mock_post):
 
         self.assertEquals(
@@ -836,8 +846,8 @@ class TestCLI(BaseTestCase):
     #     )
     # raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8scluster_list(self, mock_post, mock_get):
 
         hpecp = self.cli.CLI()
@@ -855,8 +865,8 @@ class TestCLI(BaseTestCase):
             ),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_no_filter(self, mock_post, mock_get):
 
         hpecp = self.cli.CLI()
@@ -868,8 +878,8 @@ class TestCLI(BaseTestCase):
             "['1.14.10', '1.15.7', '1.16.4', '1.17.0', '1.17.1', '1.18.0']",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_no_filter_output_json(
         self, mock_post, mock_get
     ):
@@ -883,8 +893,8 @@ class TestCLI(BaseTestCase):
             "['1.14.10', '1.15.7', '1.16.4', '1.17.0', '1.17.1', '1.18.0']",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_no_filter_output_text(
         self, mock_post, mock_get
     ):
@@ -898,8 +908,8 @@ class TestCLI(BaseTestCase):
             "1.14.10 1.15.7 1.16.4 1.17.0 1.17.1 1.18.0",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_no_filter_output_invalid(
         self, mock_post, mock_get
     ):
@@ -923,8 +933,8 @@ class TestCLI(BaseTestCase):
             "'output' parameter ust be 'json' or 'text'",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_major_filter_match(
         self, mock_post, mock_get
     ):
@@ -938,8 +948,8 @@ class TestCLI(BaseTestCase):
             "['1.14.10', '1.15.7', '1.16.4', '1.17.0', '1.17.1', '1.18.0']",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_major_filter_no_match(
         self, mock_post, mock_get
     ):
@@ -953,8 +963,8 @@ class TestCLI(BaseTestCase):
             "[]",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_minor_filter_match(
         self, mock_post, mock_get
     ):
@@ -968,8 +978,8 @@ class TestCLI(BaseTestCase):
             "['1.17.0', '1.17.1']",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_minor_filter_no_match(
         self, mock_post, mock_get
     ):
@@ -983,8 +993,8 @@ class TestCLI(BaseTestCase):
             "[]",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_patch_filter_match(
         self, mock_post, mock_get
     ):
@@ -998,8 +1008,8 @@ class TestCLI(BaseTestCase):
             "['1.17.0', '1.18.0']",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_patch_filter_no_match(
         self, mock_post, mock_get
     ):
@@ -1013,8 +1023,8 @@ class TestCLI(BaseTestCase):
             "[]",
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_major_filter_invalid(
         self, mock_post, mock_get
     ):
@@ -1031,8 +1041,8 @@ class TestCLI(BaseTestCase):
 
         self.assertEqual(cm.exception.code, 1)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_minor_filter_invalid(
         self, mock_post, mock_get
     ):
@@ -1049,8 +1059,8 @@ class TestCLI(BaseTestCase):
 
         self.assertEqual(cm.exception.code, 1)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_k8s_supported_verions_patch_filter_invalid(
         self, mock_post, mock_get
     ):
@@ -1086,7 +1096,7 @@ class TestCLI(BaseTestCase):
             )
         raise RuntimeError("Unhandle POST request: " + args[0])
 
-    @patch("requests.post", side_effect=mocked_requests_create_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_create_post)
     def test_k8scluster_create(self, mock_post):
 
         hpecp = self.cli.CLI()
@@ -1098,7 +1108,7 @@ class TestCLI(BaseTestCase):
         output = self.out.getvalue().strip()
         self.assertEqual(output, "/api/v2/k8sclusters/99")
 
-    @patch("requests.post", side_effect=mocked_requests_create_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_create_post)
     def test_k8scluster_create_valid_external_identity_server_json(
         self, mock_post
     ):
@@ -1117,7 +1127,7 @@ class TestCLI(BaseTestCase):
         error = self.err.getvalue().strip()
         self.assertEqual(error, "")
 
-    @patch("requests.post", side_effect=mocked_requests_create_post)
+    @patch("requests.Session.post", side_effect=mocked_requests_create_post)
     def test_k8scluster_create_invalid_external_identity_server_json(
         self, mock_post
     ):
@@ -1144,8 +1154,8 @@ class TestCLI(BaseTestCase):
 
         self.assertEqual(cm.exception.code, 1)
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_k8scluster_admin_kube_config(self, mock_get, mock_post):
 
         hpecp = self.cli.CLI()
@@ -1154,8 +1164,8 @@ class TestCLI(BaseTestCase):
         output = self.out.getvalue().strip()
         self.assertEqual(output, "test_admin_kube_config")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_k8scluster_dashboard_url(self, mock_get, mock_post):
 
         hpecp = self.cli.CLI()
@@ -1164,8 +1174,8 @@ class TestCLI(BaseTestCase):
         output = self.out.getvalue().strip()
         self.assertEqual(output, "test_dashboard_url")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_k8scluster_dashboard_token(self, mock_get, mock_post):
 
         hpecp = self.cli.CLI()
@@ -1176,7 +1186,7 @@ class TestCLI(BaseTestCase):
 
 
 class TestCliStates(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_states(self, mock_post):
 
         self.maxDiff = None
@@ -1216,3 +1226,48 @@ class TestK8sClusterHostConfig(TestCase):
             noderole=["/api/v2/worker/k8shost/1", "master"]
         )
         self.assertIsInstance(conf, K8sClusterHostConfig)
+
+
+class TestCLIK8sManifest(BaseTestCase):
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_k8smanifest_yaml(self, mock_post, mock_get):
+
+        hpecp = self.cli.CLI()
+        hpecp.k8scluster.k8smanifest()
+
+        manifest = get_client().k8s_cluster.k8smanifest()
+        expected = yaml.dump(
+            yaml.load(json.dumps(manifest), Loader=yaml.FullLoader)
+        )
+        self.assertEqual(self.out.getvalue(), expected + "\n")
+
+    def test_long_multiline_string_yaml(self):
+        from hpecp.cli.base import print_yaml
+
+        # e.g. an admin kube config with base64 encoded certificates
+        kube_config = "\n".join(
+            [
+                "apiVersion: v1",
+                "clusters:",
+                "- cluster:",
+                "    certificate-authority-data: " + "LS0tLS1CRUdJTi" * 20,
+                "    server: https://10.1.0.10:9500",
+                "  name: c1",
+                "users:",
+                "- name: admin",
+                "  user:",
+                "    client-key-data: " + "QkVHSU4gUlNBIFBSSVZB" * 20,
+                "",
+            ]
+        )
+        data = {"admin_kube_config": kube_config, "version": "1.18.6"}
+
+        print_yaml(data)
+        print_yaml(kube_config)
+
+        expected = "".join(
+            yaml.dump(yaml.load(json.dumps(d), Loader=yaml.FullLoader)) + "\n"
+            for d in [data, kube_config]
+        )
+        self.assertEqual(self.out.getvalue(), expected)
@@ -15,8 +15,8 @@ mockApiSetup()
 
 
 class TestWorkers(BaseTestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create_with_ssh_key_data(self, mock_get, mock_post):
 
         client = get_client()
@@ -28,8 +28,8 @@ class TestWorkers(BaseTestCase):
 
         self.assertEqual(worker_id, "/new/cluster/id")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_k8shosts(self, mock_get, mock_post):
 
         client = get_client()
@@ -55,8 +55,8 @@ class TestWorkers(BaseTestCase):
             5,
         ]
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_k8shosts_with_setup_log(self, mock_get, mock_post):
 
         client = get_client()
@@ -69,8 +69,32 @@ class TestWorkers(BaseTestCase):
             "10.1.0.186",
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_get_many_k8shosts(self, mock_get, mock_post):
+
+        client = get_client()
+
+        workers = client.k8s_worker.get_many(
+            [
+                "/api/v2/worker/k8shost/5",
+                "/api/v2/worker/k8shost/8",
+                "/api/v2/worker/k8shost/5",
+            ],
+            max_workers=2,
+        )
+
+        self.assertEqual([w.worker_id for w in workers.resources], [5, 5])
+        self.assertEqual(list(workers.errors), ["/api/v2/worker/k8shost/8"])
+        self.assertIsInstance(
+            workers.errors["/api/v2/worker/k8shost/8"],
+            APIItemNotFoundException,
+        )
+
+        self.assertEqual(client.k8s_worker.get_many([]).resources, [])
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_set_storage_invalid_worker_id(self, mock_get, mock_post):
         client = get_client()
         with self.assertRaisesRegexp(
@@ -85,8 +109,8 @@ class TestWorkers(BaseTestCase):
         with self.assertRaises(APIItemNotFoundException):
             client.k8s_worker.set_storage(worker_id="/api/v2/worker/k8shost/8")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_set_storage_no_disks(self, mock_get, mock_post):
         client = get_client()
 
@@ -97,8 +121,8 @@ class TestWorkers(BaseTestCase):
             "'ephemeral_disks' must contain at least one disk",
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_set_storage_invalid_ephemeral_disks(self, mock_get, mock_post):
         client = get_client()
 
@@ -121,8 +145,8 @@ class TestWorkers(BaseTestCase):
             "'ephemeral_disks' must contain at least one disk",
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_set_storage_invalid_persistent_disks(self, mock_get, mock_post):
         client = get_client()
         _sample_ep_disks = ["/dev/nvme2n1", "/dev/nvme2n2"]
@@ -135,8 +159,8 @@ class TestWorkers(BaseTestCase):
             )
         self.assertEqual(str(c.exception), "'persistent_disks' must be a list")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_set_storage_only_ephemeral_disks(self, mock_get, mock_post):
         client = get_client()
 
@@ -146,8 +170,8 @@ class TestWorkers(BaseTestCase):
             ephemeral_disks=_sample_ep_disks,
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_cli(self, mock_get, mock_post):
 
         try:
@@ -212,7 +236,7 @@ class TestCliCreate(BaseTestCase):
             ),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     @patch("hpecp.k8s_worker")
     def test_with_only_ssh_key_content_provided(
         self, mock_post, mock_k8sworker
@@ -275,7 +299,7 @@ class TestCliCreate(BaseTestCase):
 
         self.assertEqual(stdout, "/api/v2/worker/k8shost/5")
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     @patch("hpecp.k8s_worker")
     def test_with_only_ssh_key_content_provided_raises_assertion_error(
         self, mock_post, mock_k8sworker
@@ -306,7 +330,7 @@ class TestCliCreate(BaseTestCase):
             "Expected: `{}`, Actual: `{}`".format(expected_err, stderr),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     @patch("hpecp.k8s_worker")
     def test_with_only_ssh_key_content_provided_raises_conflict_exception(
         self, mock_post, mock_k8sworker
@@ -341,7 +365,7 @@ class TestCliCreate(BaseTestCase):
             "Expected: `{}`, Actual: `{}`".format(expected_err, stderr),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     @patch("hpecp.k8s_worker")
     def test_with_only_ssh_key_content_provided_raises_general_exception(
         self, mock_post, mock_k8sworker
@@ -375,7 +399,7 @@ class TestCliCreate(BaseTestCase):
         )
 
     @patch(
-        "requests.post", side_effect=BaseTestCase.httpPostHandlers
+        "requests.Session.post", side_effect=BaseTestCase.httpPostHandlers
     )  # Login response
     def test_with_only_ssh_key_file_provided(self, mock_login_response):
 
@@ -437,7 +461,7 @@ class TestCliCreate(BaseTestCase):
 
         ssh_key_file.close()
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_ip_not_provided(self, mocked_requests_post):
 
         hpecp = self.cli.CLI()
@@ -458,7 +482,7 @@ class TestCliCreate(BaseTestCase):
             ),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_ssh_key_not_a_string(self, mocked_requests_post):
 
         hpecp = self.cli.CLI()
@@ -481,7 +505,7 @@ class TestCliCreate(BaseTestCase):
 
 
 class TestCliStates(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_states(self, mock_post):
 
         self.maxDiff = None
@@ -536,7 +560,7 @@ class TestCliSetStorage(BaseTestCase):
             "Expected: `{}` Actual: `{}`".format(exptected_stderr, stderr),
         )
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     @patch("hpecp.k8s_worker")
     def test_with_exception(self, mock_post, mock_k8sworker):
 
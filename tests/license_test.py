@@ -32,8 +32,8 @@ mockApiSetup()
 
 
 class TestCLI(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list(self, mock_post, mock_get):
 
         try:
@@ -101,8 +101,8 @@ _links:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_license_key_only(self, mock_post, mock_get):
 
         try:
@@ -124,8 +124,8 @@ _links:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_output_json(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -205,8 +205,8 @@ _links:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_platform_id(self, mock_post, mock_get):
 
         try:
@@ -228,8 +228,8 @@ _links:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_register(self, mock_post, mock_get):
 
         try:
@@ -251,8 +251,10 @@ _links:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
     def test_delete(self, mock_post, mock_delete):
 
         with patch.dict("os.environ", {"LOG_LEVEL": "DEBUG"}):
@@ -271,9 +273,11 @@ _links:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_delete_all(self, mock_post, mock_delete, mock_get):
 
         with patch.dict("os.environ", {"LOG_LEVEL": "DEBUG"}):
@@ -21,10 +21,13 @@
 
 import json
 
+import requests
 import six
 from mock import patch
 
-from .base import BaseTestCase, MockResponse
+from hpecp import ContainerPlatformClientException
+
+from .base import BaseTestCase, MockResponse, get_client
 from .lock_mock_api_responses import mockApiSetup
 
 # setup the mock data
@@ -32,8 +35,8 @@ mockApiSetup()
 
 
 class TestCLIList(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_yaml(self, mock_post, mock_get):
 
         try:
@@ -63,8 +66,8 @@ locked: false"""
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_json(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -93,8 +96,8 @@ locked: false"""
             expected_stderr = ""
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
     def test_list_output_parameter_invalid(self, mock_post, mock_get):
 
         self.maxDiff = None
@@ -116,8 +119,10 @@ locked: false"""
 
 
 class TestCLIDelete(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
     def test_delete(self, mock_post, mock_delete):
 
         try:
@@ -139,9 +144,11 @@ class TestCLIDelete(BaseTestCase):
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
     def test_delete_all(self, mock_get, mock_post, mock_delete):
 
         try:
@@ -179,9 +186,11 @@ class TestCLIDelete(BaseTestCase):
             )
         raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.get", side_effect=mocked_requests_get_locked)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
+    @patch("requests.Session.get", side_effect=mocked_requests_get_locked)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
     def test_delete_all_timeout(self, mock_get, mock_post, mock_delete):
 
         with self.assertRaises(SystemExit) as cm:
@@ -221,8 +230,8 @@ class TestCLICreate(BaseTestCase):
             )
         raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
-    @patch("requests.get", side_effect=mocked_requests_get_locked)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=mocked_requests_get_locked)
     def test_create(self, mock_post, mock_get):
 
         try:
@@ -268,7 +277,10 @@ class TestCLICreate(BaseTestCase):
             )
         raise RuntimeError("Unhandle GET request: " + args[0])
 
-    @patch("requests.post", side_effect=mocked_requests_post_with_exception)
+    @patch(
+        "requests.Session.post",
+        side_effect=mocked_requests_post_with_exception,
+    )
     def test_create_with_exception(self, mock_post):
 
         with self.assertRaises(SystemExit) as cm:
@@ -292,3 +304,140 @@ class TestCLICreate(BaseTestCase):
             stderr.endswith(expected_stderr),
             "expected: `{}` actual: `{}`".format(expected_stderr, stderr),
         )
+
+
+def lock_state_response(locked, quiesced, internal_locks=[]):
+    return MockResponse(
+        json_data={
+            "_links": {"self": {"href": "/api/v1/lock"}},
+            "locked": locked,
+            "quiesced": quiesced,
+            "_embedded": {
+                "internal_locks": internal_locks,
+                "external_locks": [
+                    {"_links": {"self": {"href": "/api/v1/lock/1"}}}
+                ],
+            },
+        },
+        status_code=200,
+        headers=dict(),
+    )
+
+
+def lock_created_response(*args, **kwargs):
+    if args[0] == "https://127.0.0.1:8080/api/v1/lock":
+        return MockResponse(
+            json_data={},
+            status_code=201,
+            headers={"Location": "/api/v1/lock/1"},
+        )
+    return BaseTestCase.httpPostHandlers(*args, **kwargs)
+
+
+class TestLockController(BaseTestCase):
+    @patch("hpecp.lock.time.sleep")
+    @patch("requests.Session.post", side_effect=lock_created_response)
+    def test_create_polls_once_per_tick(self, mock_post, mock_sleep):
+
+        responses = [
+            lock_state_response(False, False),
+            lock_state_response(True, False),
+            lock_state_response(True, True),
+        ]
+        with patch("requests.Session.get", side_effect=responses) as mock_get:
+            lock_id = get_client().lock.create(reason="upgrade")
+
+        self.assertEqual(lock_id, "/api/v1/lock/1")
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("hpecp.lock.time.sleep")
+    @patch("requests.Session.post", side_effect=lock_created_response)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    def test_create_timeout_releases_lock(
+        self, mock_delete, mock_post, mock_sleep
+    ):
+
+        with patch(
+            "requests.Session.get",
+            return_value=lock_state_response(True, False),
+        ):
+            self.assertFalse(
+                get_client().lock.create(reason="upgrade", timeout_secs=0.01)
+            )
+
+        self.assertEqual(mock_delete.call_count, 1)
+
+    @patch("requests.Session.post", side_effect=lock_created_response)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    def test_hold_always_releases(self, mock_delete, mock_post):
+
+        client = get_client()
+        with patch(
+            "requests.Session.get",
+            return_value=lock_state_response(True, True),
+        ):
+            with self.assertRaises(RuntimeError):
+                with client.lock.hold("upgrade") as lock_id:
+                    self.assertEqual(lock_id, "/api/v1/lock/1")
+                    mock_delete.assert_not_called()
+                    raise RuntimeError()
+
+        self.assertEqual(mock_delete.call_count, 1)
+        self.assertEqual(
+            mock_delete.call_args[0][0], "https://127.0.0.1:8080/api/v1/lock/1"
+        )
+
+    @patch("requests.Session.post", side_effect=lock_created_response)
+    @patch(
+        "requests.Session.delete",
+        side_effect=requests.exceptions.ConnectionError(),
+    )
+    def test_hold_delete_failure_keeps_block_exception(
+        self, mock_delete, mock_post
+    ):
+
+        with patch(
+            "requests.Session.get",
+            return_value=lock_state_response(True, True),
+        ), patch("hpecp.lock._log") as mock_log:
+            with self.assertRaises(RuntimeError):
+                with get_client().lock.hold("upgrade"):
+                    raise RuntimeError()
+
+        self.assertTrue(mock_delete.called)
+        self.assertIn("/api/v1/lock/1", mock_log.error.call_args[0][0])
+
+    @patch("hpecp.lock.time.sleep")
+    @patch("requests.Session.post", side_effect=lock_created_response)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    def test_hold_timeout(self, mock_delete, mock_post, mock_sleep):
+
+        with patch(
+            "requests.Session.get",
+            return_value=lock_state_response(False, False),
+        ):
+            with self.assertRaises(ContainerPlatformClientException):
+                with get_client().lock.hold("upgrade", timeout_secs=0.01):
+                    self.fail("the lock was not acquired")
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    def test_delete_all_uses_one_snapshot(self, mock_delete, mock_post):
+
+        with patch(
+            "requests.Session.get",
+            return_value=lock_state_response(True, True),
+        ) as mock_get:
+            self.assertTrue(get_client().lock.delete_all())
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_delete.call_count, 1)
@@ -0,0 +1,120 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+from mock import patch
+
+from .base import BaseTestCase, MockResponse, get_client
+from .k8s_cluster_mock_api_responses import mockApiSetup
+
+# setup the mock data
+mockApiSetup()
+
+
+class TestMetadataCache(BaseTestCase):
+    def config_response(self):
+        return MockResponse(
+            json_data={"objects": {"bds_global_version": "5.1"}},
+            status_code=200,
+            headers={},
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_config_is_fetched_once(self, mock_post):
+
+        client = get_client()
+
+        with patch(
+            "requests.Session.get", return_value=self.config_response()
+        ) as mock_get:
+            for _ in range(50):
+                self.assertEqual(
+                    client.config.get()["objects"]["bds_global_version"],
+                    "5.1",
+                )
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(
+            client.metadata_cache.stats(),
+            {"/api/v1/config": {"hits": 49, "misses": 1}},
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_callers_get_a_copy(self, mock_post):
+
+        client = get_client()
+
+        with patch(
+            "requests.Session.get", return_value=self.config_response()
+        ) as mock_get:
+            client.config.get()["objects"]["bds_global_version"] = "x"
+            client.config.get()["objects"].clear()
+            self.assertEqual(
+                client.config.get()["objects"]["bds_global_version"], "5.1"
+            )
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_config_auth_invalidates(self, mock_post):
+
+        client = get_client()
+        mock_post.side_effect = None
+        mock_post.return_value = MockResponse(
+            json_data={}, status_code=200, headers={}
+        )
+
+        with patch(
+            "requests.Session.get", return_value=self.config_response()
+        ) as mock_get:
+            client.config.get()
+            client.config.auth({"external_identity_server": {}})
+            client.config.get()
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_zero_ttl_disables_caching(self, mock_post):
+
+        client = get_client()
+        client.metadata_cache.ttls["/api/v1/config"] = 0
+
+        with patch(
+            "requests.Session.get", return_value=self.config_response()
+        ) as mock_get:
+            client.config.get()
+            client.config.get()
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_k8smanifest_is_fetched_once(self, mock_post, mock_get):
+
+        client = get_client()
+
+        client.k8s_cluster.k8s_supported_versions()
+        client.k8s_cluster.k8smanifest()
+        client.metadata_cache.invalidate()
+        client.k8s_cluster.k8s_supported_versions()
+
+        self.assertEqual(
+            client.metadata_cache.stats(),
+            {"/api/v2/k8smanifest": {"hits": 1, "misses": 2}},
+        )
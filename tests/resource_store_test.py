@@ -0,0 +1,123 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+from multiprocessing.pool import ThreadPool
+
+from mock import patch
+
+from hpecp.resource_store import DEFAULT_REFRESH_SECS, ResourceStore
+
+from .base import BaseTestCase, MockResponse, get_client
+from .k8s_worker_mock_api_responses import mockApiSetup
+
+# setup the mock data
+mockApiSetup()
+
+
+class TestResourceStore(BaseTestCase):
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_find_by(self, mock_post, mock_get):
+
+        client = get_client()
+        mock_get.reset_mock()
+
+        workers = client.k8s_worker.find_by(ipaddr="10.1.0.186")
+        self.assertEqual([w.worker_id for w in workers], [5])
+
+        workers = client.k8s_worker.find_by(
+            status="bundle", hostname=workers[0].hostname
+        )
+        self.assertEqual([w.worker_id for w in workers], [5])
+
+        self.assertEqual(client.k8s_worker.find_by(ipaddr="10.9.9.9"), [])
+        self.assertEqual(
+            client.k8s_worker.store.find_one_by(ipaddr="10.1.0.238").id,
+            "/api/v2/worker/k8shost/4",
+        )
+        self.assertEqual(
+            client.k8s_worker.store.get("/api/v2/worker/k8shost/4").ipaddr,
+            "10.1.0.238",
+        )
+
+        # the list was only retrieved once
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_unindexed_fields_are_scanned(self, mock_post, mock_get):
+
+        client = get_client()
+        store = ResourceStore(client.k8s_worker, index_fields=[])
+
+        workers = store.find_by(ipaddr="10.1.0.238")
+        self.assertEqual([w.worker_id for w in workers], [4])
+
+        with self.assertRaises(AssertionError):
+            store.find_by(unknown="value")
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_delete_invalidates(self, mock_post, mock_get):
+
+        client = get_client()
+        client.k8s_worker.find_by(ipaddr="10.1.0.186")
+        self.assertTrue(client.k8s_worker.store.is_loaded())
+
+        with patch(
+            "requests.Session.delete",
+            return_value=MockResponse(
+                json_data={}, status_code=204, headers={}
+            ),
+        ):
+            client.k8s_worker.delete("/api/v2/worker/k8shost/5")
+
+        self.assertFalse(client.k8s_worker.store.is_loaded())
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_snapshot_expires_by_default(self, mock_post, mock_get):
+
+        client = get_client()
+        store = client.k8s_worker.store
+        self.assertEqual(store.refresh_secs, DEFAULT_REFRESH_SECS)
+
+        with patch("hpecp.resource_store.time.time", return_value=1000.0):
+            client.k8s_worker.find_by(status="bundle")
+            self.assertTrue(store.is_loaded())
+
+        with patch(
+            "hpecp.resource_store.time.time",
+            return_value=1000.0 + DEFAULT_REFRESH_SECS,
+        ):
+            self.assertFalse(store.is_loaded())
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_store_is_created_once(self, mock_post, mock_get):
+
+        client = get_client()
+        pool = ThreadPool(8)
+        try:
+            stores = pool.map(lambda _: client.k8s_worker.store, range(64))
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(len(set(id(store) for store in stores)), 1)
@@ -0,0 +1,142 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import os
+import tempfile
+from unittest import TestCase
+
+from mock import patch
+
+from hpecp import ContainerPlatformClient
+from hpecp.response_cache import ResponseCache
+
+from .base import BaseTestCase, MockResponse
+
+BODY = '{"_embedded": {"k8shosts": []}}'
+
+
+def ok_response():
+    return MockResponse(
+        json_data={"_embedded": {"k8shosts": []}},
+        status_code=200,
+        headers={"ETag": '"v1"', "Content-Type": "application/json"},
+        text_data=BODY,
+    )
+
+
+def not_modified_response():
+    return MockResponse(json_data=None, status_code=304, headers={})
+
+
+class TestConditionalGet(BaseTestCase):
+    def get_client(self, response_cache):
+        client = ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            api_port=8080,
+            use_ssl=True,
+            response_cache=response_cache,
+        )
+        return client.create_session()
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_not_modified_is_served_from_cache(self, mock_post):
+
+        client = self.get_client(ResponseCache())
+
+        with patch(
+            "requests.Session.get",
+            side_effect=[ok_response(), not_modified_response()],
+        ) as mock_get:
+            first = client._request("/api/v2/worker/k8shost")
+            second = client._request("/api/v2/worker/k8shost")
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+
+        first_headers = mock_get.call_args_list[0][1]["headers"]
+        second_headers = mock_get.call_args_list[1][1]["headers"]
+        self.assertNotIn("cache-control", first_headers)
+        self.assertNotIn("If-None-Match", first_headers)
+        self.assertEqual(second_headers["If-None-Match"], '"v1"')
+
+        self.assertEqual(
+            client.response_cache.stats(),
+            {
+                "requests": 1,
+                "hits": 1,
+                "misses": 0,
+                "evictions": 0,
+                "bytes_saved": len(BODY),
+            },
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_no_cache_header_without_response_cache(self, mock_post):
+
+        client = self.get_client(None)
+
+        with patch(
+            "requests.Session.get", return_value=ok_response()
+        ) as mock_get:
+            client._request("/api/v2/worker/k8shost")
+
+        headers = mock_get.call_args[1]["headers"]
+        self.assertEqual(headers["cache-control"], "no-cache")
+
+
+class TestResponseCache(TestCase):
+    def test_lru_eviction(self):
+
+        cache = ResponseCache(max_entries=2)
+        for key in ["a", "b", "c"]:
+            cache.store(key, ok_response())
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.lookup("a"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_response_without_validators_is_not_cached(self):
+
+        cache = ResponseCache()
+        cache.store(
+            "a",
+            MockResponse(json_data={}, status_code=200, headers={}),
+        )
+        self.assertEqual(len(cache), 0)
+
+    def test_save_and_load(self):
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "responses")
+
+        cache = ResponseCache(path=path)
+        cache.store("a", ok_response())
+        cache.save()
+
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+        entry = ResponseCache(path=path).lookup("a")
+        self.assertEqual(entry["etag"], '"v1"')
+        self.assertEqual(
+            ResponseCache.conditional_headers(entry),
+            {"If-None-Match": '"v1"'},
+        )
@@ -0,0 +1,158 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+
+import requests
+from mock import patch
+
+from hpecp import ContainerPlatformClient, RetryPolicy
+from hpecp.exceptions import APIUnknownException
+
+from .base import BaseTestCase, MockResponse
+
+
+def error_response(status_code):
+    return MockResponse(
+        json_data={},
+        status_code=status_code,
+        headers={},
+        raise_for_status_flag=True,
+    )
+
+
+OK_RESPONSE = MockResponse(json_data={"ok": True}, status_code=200, headers={})
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable("get", 503))
+        self.assertTrue(policy.is_retryable("DELETE", 502))
+        self.assertTrue(policy.is_retryable("put", None))
+        self.assertFalse(policy.is_retryable("get", 500))
+        self.assertFalse(policy.is_retryable("post", 503))
+
+        policy = RetryPolicy(retry_methods=["get", "post"])
+        self.assertTrue(policy.is_retryable("post", 503))
+
+    def test_backoff_secs(self):
+        policy = RetryPolicy(
+            backoff_factor=1, max_backoff_secs=5, jitter=False
+        )
+        self.assertEqual(
+            [policy.backoff_secs(n) for n in range(5)], [1, 2, 4, 5, 5]
+        )
+
+        policy = RetryPolicy(backoff_factor=1, jitter=True)
+        for _ in range(20):
+            self.assertTrue(0 <= policy.backoff_secs(2) <= 4)
+
+    def test_budget(self):
+        policy = RetryPolicy(budget=2, budget_ratio=0.5)
+
+        self.assertTrue(policy.withdraw())
+        self.assertTrue(policy.withdraw())
+        self.assertFalse(policy.withdraw())
+
+        policy.deposit()
+        policy.deposit()
+        self.assertTrue(policy.withdraw())
+        self.assertFalse(policy.withdraw())
+
+
+class TestClientRetries(BaseTestCase):
+    def get_client(self, **kwargs):
+        return ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            api_port=8080,
+            use_ssl=True,
+            retry_policy=RetryPolicy(backoff_factor=0, **kwargs),
+        ).create_session()
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_transient_errors_are_retried(self, mock_post):
+        client = self.get_client()
+
+        responses = [error_response(503), error_response(502), OK_RESPONSE]
+        with patch("requests.Session.get", side_effect=responses) as get:
+            response = client._request("/api/v1/config")
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual(client.retry_stats.requests, 1)
+        self.assertEqual(client.retry_stats.retries, 2)
+        self.assertEqual(
+            client.retry_stats.retries_by_reason, {502: 1, 503: 1}
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_max_retries(self, mock_post):
+        client = self.get_client(max_retries=2)
+
+        with patch(
+            "requests.Session.get", return_value=error_response(503)
+        ) as get:
+            with self.assertRaises(APIUnknownException) as cm:
+                client._request("/api/v1/config")
+
+        self.assertEqual(cm.exception.status_code, 503)
+        self.assertEqual(get.call_count, 3)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_post_is_not_retried_by_default(self, mock_post):
+        client = self.get_client()
+
+        mock_post.side_effect = None
+        mock_post.return_value = error_response(503)
+        with self.assertRaises(APIUnknownException):
+            client._request("/api/v1/lock", http_method="post")
+
+        self.assertEqual(mock_post.call_count, 2)  # login + 1 attempt
+        self.assertEqual(client.retry_stats.retries, 0)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_connection_errors_are_retried(self, mock_post):
+        client = self.get_client()
+
+        responses = [
+            requests.exceptions.ConnectionError("connection refused"),
+            OK_RESPONSE,
+        ]
+        with patch("requests.Session.get", side_effect=responses):
+            client._request("/api/v1/config")
+
+        self.assertEqual(
+            client.retry_stats.retries_by_reason, {"connection": 1}
+        )
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_retry_budget(self, mock_post):
+        client = self.get_client(budget=1, budget_ratio=0)
+
+        with patch("requests.Session.get", return_value=error_response(503)):
+            with self.assertRaises(APIUnknownException):
+                client._request("/api/v1/config")
+
+        self.assertEqual(client.retry_stats.retries, 1)
+        self.assertEqual(client.retry_stats.budget_exhausted, 1)
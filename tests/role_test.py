@@ -32,8 +32,8 @@ mockApiSetup()
 
 
 class TestRoleGet(TestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_role_assertions(self, mock_get, mock_post):
 
         with self.assertRaisesRegexp(
@@ -49,8 +49,8 @@ class TestRoleGet(TestCase):
         ):
             get_client().role.get("garbage")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_role(self, mock_get, mock_post):
 
         role = get_client().role.get("/api/v1/role/1")
@@ -61,8 +61,8 @@ class TestRoleGet(TestCase):
 
 
 class TestCLI(BaseTestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get(self, mock_post, mock_delete):
 
         try:
@@ -93,8 +93,8 @@ label:
         if six.PY2:
             self.assertEqual(stderr, expected_stderr)
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_json(self, mock_post, mock_delete):
 
         try:
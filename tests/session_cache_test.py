@@ -0,0 +1,125 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+
+from mock import patch
+
+from hpecp import ContainerPlatformClient
+from hpecp.cli import base
+from hpecp.cli.session_cache import SessionCache, session_cache_key
+
+from .base import BaseTestCase
+
+
+class TestSessionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "sessions.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_put_and_get(self):
+        cache = SessionCache(self.path)
+        self.assertIsNone(cache.get("key"))
+
+        cache.put("key", "/api/v1/session/abc")
+        self.assertEqual(cache.get("key"), "/api/v1/session/abc")
+        self.assertEqual(
+            stat.S_IMODE(os.stat(self.path).st_mode),
+            stat.S_IRUSR | stat.S_IWUSR,
+        )
+
+        cache.remove("key")
+        self.assertIsNone(cache.get("key"))
+
+    def test_expired_entries_are_ignored(self):
+        cache = SessionCache(self.path, ttl_secs=60)
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "old": {
+                        "session_id": "/api/v1/session/old",
+                        "last_used": time.time() - 61,
+                    }
+                },
+                f,
+            )
+        os.chmod(self.path, stat.S_IRUSR | stat.S_IWUSR)
+
+        self.assertIsNone(cache.get("old"))
+
+    def test_world_readable_cache_is_ignored(self):
+        cache = SessionCache(self.path)
+        cache.put("key", "/api/v1/session/abc")
+        os.chmod(self.path, 0o644)
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_session_cache_key(self):
+        client = ContainerPlatformClient(
+            username="admin",
+            password="admin123",
+            api_host="127.0.0.1",
+            tenant="/api/v1/tenant/2",
+        )
+        self.assertEqual(
+            session_cache_key("default", client),
+            "default|https://127.0.0.1:8080|admin|/api/v1/tenant/2",
+        )
+
+
+class TestCliSessionReuse(BaseTestCase):
+    def setUp(self):
+        super(TestCliSessionReuse, self).setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        super(TestCliSessionReuse, self).tearDown()
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_get_client_logs_in_once_per_process(self, mock_post):
+        client = base.get_client()
+        self.assertIs(base.get_client(), client)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_get_client_reuses_cached_session(self, mock_post):
+        path = os.path.join(self.tmp_dir, "sessions.json")
+
+        with patch.dict(os.environ, {"HPECP_SESSION_CACHE_FILE": path}):
+            client = base.get_client()
+            self.assertEqual(mock_post.call_count, 1)
+
+            # simulate a new CLI invocation
+            base.reset_clients()
+            cached_client = base.get_client()
+
+        self.assertIsNot(cached_client, client)
+        self.assertEqual(cached_client.session_id, client.session_id)
+        self.assertEqual(mock_post.call_count, 1)
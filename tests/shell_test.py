@@ -0,0 +1,110 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+
+from mock import patch
+from six import StringIO
+
+from hpecp.cli.shell import Shell
+
+from .base import BaseTestCase
+from .k8s_worker_mock_api_responses import mockApiSetup
+
+# setup the mock data
+mockApiSetup()
+
+
+class TestShell(BaseTestCase):
+    def shell(self, commands=""):
+        shell = Shell(self.cli.CLI(), stdin=StringIO(commands))
+        shell.use_rawinput = False
+        return shell
+
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_commands(self, mock_post, mock_get):
+
+        self.shell(
+            "k8sworker get /api/v2/worker/k8shost/5 --output json\n"
+            "\n"
+            "k8sworker get /api/v2/worker/k8shost/999\n"
+            "shell\n"
+            "hpecp k8sworker get /api/v2/worker/k8shost/5 --output json\n"
+            "exit\n"
+            "version\n"
+        ).cmdloop()
+
+        # the prompt is printed before the output of each command
+        workers = [
+            json.loads(line.rpartition("hpecp> ")[2])
+            for line in self.out.getvalue().splitlines()
+            if "{" in line
+        ]
+        self.assertEqual([w["ipaddr"] for w in workers], ["10.1.0.186"] * 2)
+        self.assertIn(
+            "'shell' can not be run from batch or shell", self.err.getvalue()
+        )
+
+        # one login for all of the commands
+        logins = [
+            c for c in mock_post.call_args_list if c[0][0].endswith("/login")
+        ]
+        self.assertEqual(len(logins), 1)
+
+    def test_eof_exits(self):
+
+        self.assertTrue(self.shell().onecmd("EOF"))
+
+    def test_completion(self):
+
+        shell = self.shell()
+
+        self.assertEqual(
+            shell.completenames("k8s"), ["k8sworker", "k8scluster"]
+        )
+
+        line = "k8sworker li"
+        self.assertEqual(
+            shell.completedefault("li", line, 10, len(line)), ["list"]
+        )
+
+        line = "k8sworker list --output table --"
+        self.assertEqual(
+            shell.completedefault("--", line, 30, len(line)),
+            ["--columns", "--query"],
+        )
+
+        line = "k8sworker list --output n"
+        self.assertEqual(
+            shell.completedefault("n", line, 24, len(line)), ["ndjson"]
+        )
+
+        line = "k8sworker get /api/v2/worker/k8shost/5 --output "
+        self.assertEqual(
+            shell.completedefault("", line, len(line), len(line)),
+            ["yaml", "json", "json-pp"],
+        )
+
+        line = "k8sworker list --columns id,st"
+        self.assertEqual(
+            shell.completedefault("id,st", line, 25, len(line)),
+            ["id,status"],
+        )
@@ -0,0 +1,94 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+
+from mock import patch
+from six import StringIO
+from tabulate import tabulate
+
+from hpecp.base_resource import ResourceList
+from hpecp.table import render_lines
+from hpecp.user import User
+
+from .base_resource_test import user_json
+
+
+class TestRenderLines(unittest.TestCase):
+    rows = [
+        ["/api/v1/user/1", 5, None, True],
+        ["admin", 12345, "10.1.0.186", False],
+        ["a b", None, "x", True],
+    ]
+    headers = ["id", "number", "ip", "flag"]
+
+    def assert_same_as_tabulate(self, rows, headers=None, style="pretty"):
+        lines = render_lines(rows, headers, style)
+        self.assertIsNotNone(lines)
+        if headers:
+            expected = tabulate(rows, headers=headers, tablefmt=style)
+        else:
+            expected = tabulate(rows, tablefmt=style)
+        self.assertEqual("\n".join(lines), expected)
+
+    def test_same_as_tabulate(self):
+
+        for style in ["plain", "pretty"]:
+            self.assert_same_as_tabulate(self.rows, self.headers, style)
+            self.assert_same_as_tabulate(self.rows, None, style)
+            self.assert_same_as_tabulate([], self.headers, style)
+            self.assert_same_as_tabulate([], None, style)
+
+    def test_unsupported_cells(self):
+
+        for value in [1.5, "10", "1,000", " padded", "a\nb", "ü", []]:
+            self.assertIsNone(render_lines([[value]], ["h"], "plain"))
+
+        # int and text in the same column
+        self.assertIsNone(render_lines([[1], ["a"]], ["h"], "plain"))
+
+
+class TestPrintTable(unittest.TestCase):
+    def setUp(self):
+        self.users = ResourceList(
+            User, [user_json(i, "user{}".format(i)) for i in range(3)]
+        )
+
+    def test_print_table(self):
+
+        for style in ["pretty", "plain", "grid"]:
+            out = StringIO()
+            self.users.print_table(["id", "name"], style=style, file=out)
+            self.assertEqual(
+                out.getvalue(),
+                self.users.tabulate(["id", "name"], style=style) + "\n",
+            )
+
+    def test_missing_field_warned_once(self):
+        class NicknameUser(User):
+            all_fields = User.all_fields + ["nickname"]
+
+        users = ResourceList(NicknameUser, [user_json(i) for i in range(3)])
+        with patch("hpecp.base_resource._log") as log:
+            users.tabulate(["id", "nickname"])
+
+        log.warn.assert_called_once_with(
+            "Field nickname not found in 3 of 3 NicknameUser resources"
+        )
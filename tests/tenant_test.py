@@ -30,8 +30,8 @@ mockApiSetup()
 
 
 class TestTentants(BaseTestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_tenant_list(self, mock_get, mock_post):
 
         client = get_client()
@@ -57,8 +57,8 @@ class TestTentants(BaseTestCase):
             ["/api/v1/tenant/1", "/api/v1/tenant/2"],
         )
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_tenant_id_format(self, mock_get, mock_post):
         client = get_client()
 
@@ -68,8 +68,8 @@ class TestTentants(BaseTestCase):
         ):
             client.tenant.get("garbage")
 
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_tenant(self, mock_get, mock_post):
         tenant = get_client().tenant.get("/api/v1/tenant/1")
         self.assertEqual(tenant.id, "/api/v1/tenant/1")
@@ -34,8 +34,8 @@ mockApiSetup()
 
 
 class TestUsers(TestCase):
-    @patch("requests.get", side_effect=BaseTestCase.httpGetHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.get", side_effect=BaseTestCase.httpGetHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_get_users(self, mock_get, mock_post):
         client = ContainerPlatformClient(
             username="admin",
@@ -67,8 +67,10 @@ class TestUsers(TestCase):
 
 
 class TestDeleteUser(TestCase):
-    @patch("requests.delete", side_effect=BaseTestCase.httpDeleteHandlers)
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch(
+        "requests.Session.delete", side_effect=BaseTestCase.httpDeleteHandlers
+    )
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_delete_user(self, mock_post, mock_delete):
         with self.assertRaisesRegexp(
             AssertionError,
@@ -89,7 +91,7 @@ class TestDeleteUser(TestCase):
 
 
 class TestCLI(BaseTestCase):
-    @patch("requests.post", side_effect=BaseTestCase.httpPostHandlers)
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
     def test_create(self, mock_post):
 
         hpecp = self.cli.CLI()
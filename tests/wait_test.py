@@ -0,0 +1,320 @@
+# (C) Copyright [2020] Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+from unittest import TestCase
+
+from mock import patch
+
+from hpecp.k8s_worker import WorkerK8sStatus
+from hpecp.wait import StatusWaiter, WaitPolicy
+
+from .base import BaseTestCase, MockResponse, get_client
+
+
+def k8shost_json(status, id=5):
+    return {
+        "_links": {"self": {"href": "/api/v2/worker/k8shost/{}".format(id)}},
+        "status": status,
+        "hostname": "ip-10-1-0-238.eu-west-2.compute.internal",
+        "ipaddr": "10.1.0.238",
+        "setup_log": "/var/log/bluedata/install/k8shost_setup_10.log",
+        "approved_worker_pubkey": [],
+        "tags": [],
+        "propinfo": {},
+    }
+
+
+def k8shost_response(status):
+    return MockResponse(
+        json_data=k8shost_json(status), status_code=200, headers={}
+    )
+
+
+def k8shost_list_response(statuses):
+    return MockResponse(
+        json_data={
+            "_embedded": {
+                "k8shosts": [
+                    k8shost_json(status, id)
+                    for id, status in sorted(statuses.items())
+                ]
+            }
+        },
+        status_code=200,
+        headers={},
+    )
+
+
+class FakeResource:
+    def __init__(self, status):
+        self.status = status
+
+
+class TestWaitPolicy(TestCase):
+    def test_interval_grows_to_max(self):
+
+        policy = WaitPolicy(
+            initial_interval_secs=1,
+            max_interval_secs=10,
+            backoff_factor=2,
+            jitter=False,
+        )
+        self.assertEqual(
+            [policy.interval_secs(n) for n in range(6)], [1, 2, 4, 8, 10, 10]
+        )
+
+    def test_jitter_stays_close_to_interval(self):
+
+        policy = WaitPolicy(initial_interval_secs=10, max_interval_secs=10)
+        for _ in range(100):
+            self.assertTrue(9 <= policy.interval_secs(0) <= 11)
+
+    def test_fixed_interval(self):
+
+        policy = WaitPolicy.fixed(5)
+        self.assertEqual([policy.interval_secs(n) for n in range(3)], [5] * 3)
+
+    def test_invalid_max_interval(self):
+
+        with self.assertRaises(AssertionError):
+            WaitPolicy(initial_interval_secs=5, max_interval_secs=1)
+
+
+class TestStatusWaiter(TestCase):
+    def get_waiter(self, status, error_status=["error"], timeout_secs=60):
+        return StatusWaiter(
+            status_fieldname="status",
+            status=status,
+            error_status=error_status,
+            timeout_secs=timeout_secs,
+            policy=WaitPolicy(jitter=False),
+        )
+
+    def test_history_records_transitions(self):
+
+        waiter = self.get_waiter(["ready"])
+        for status in ["installing", "installing", "configuring"]:
+            self.assertIsNone(waiter.observe(FakeResource(status)))
+
+        result = waiter.observe(FakeResource("ready"))
+
+        self.assertTrue(result)
+        self.assertEqual(result.reason, "status_reached")
+        self.assertEqual(result.polls, 4)
+        self.assertEqual(
+            [s for _, s in result.history],
+            ["installing", "configuring", "ready"],
+        )
+
+    def test_error_status_ends_wait(self):
+
+        waiter = self.get_waiter(["ready"])
+        result = waiter.observe(FakeResource("error"))
+
+        self.assertFalse(result)
+        self.assertEqual(result.reason, "error_status")
+        self.assertEqual(result.resource.status, "error")
+
+    def test_error_status_can_be_waited_for(self):
+
+        waiter = self.get_waiter(["error"])
+        self.assertTrue(waiter.observe(FakeResource("error")))
+
+    def test_deleted(self):
+
+        waiter = self.get_waiter([])
+        self.assertIsNone(waiter.observe(FakeResource("deleting")))
+        result = waiter.observe(None)
+
+        self.assertTrue(result)
+        self.assertEqual(result.reason, "deleted")
+        self.assertEqual([s for _, s in result.history], ["deleting", None])
+
+    def test_timeout(self):
+
+        waiter = self.get_waiter(["ready"], timeout_secs=0)
+        result = waiter.observe(FakeResource("installing"))
+
+        self.assertFalse(result)
+        self.assertEqual(result.reason, "timeout")
+        self.assertEqual(waiter.next_interval_secs(), 0)
+
+
+class TestWaitForStatus(BaseTestCase):
+    @patch("hpecp.base_resource.time.sleep")
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_adaptive_polling(self, mock_post, mock_sleep):
+
+        client = get_client()
+        client.wait_policy = WaitPolicy(
+            initial_interval_secs=1, backoff_factor=2, jitter=False
+        )
+
+        responses = [
+            k8shost_response(s)
+            for s in ["installing", "installing", "configured", "ready"]
+        ]
+        with patch("requests.Session.get", side_effect=responses):
+            result = client.k8s_worker.wait_for_status(
+                "/api/v2/worker/k8shost/5",
+                status=[WorkerK8sStatus.ready],
+                timeout_secs=60,
+            )
+
+        self.assertTrue(result)
+        self.assertEqual(result.resource.status, "ready")
+        self.assertEqual(
+            [s for _, s in result.history],
+            ["installing", "configured", "ready"],
+        )
+        self.assertEqual(
+            [c[0][0] for c in mock_sleep.call_args_list], [1, 2, 4]
+        )
+
+    @patch("hpecp.base_resource.time.sleep")
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_poll_interval(self, mock_post, mock_sleep):
+
+        responses = [
+            k8shost_response(s) for s in ["installing", "configured", "ready"]
+        ]
+        with patch("requests.Session.get", side_effect=responses):
+            result = get_client().k8s_worker.wait_for_state(
+                "/api/v2/worker/k8shost/5",
+                states=[WorkerK8sStatus.ready],
+                timeout_secs=60,
+                poll_interval_secs=5,
+            )
+
+        self.assertTrue(result)
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [5, 5])
+
+    @patch("hpecp.base_resource.time.sleep")
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_storage_error_ends_wait(self, mock_post, mock_sleep):
+
+        with patch(
+            "requests.Session.get",
+            return_value=k8shost_response("storage_error"),
+        ):
+            result = get_client().k8s_worker.wait_for_status(
+                "/api/v2/worker/k8shost/5",
+                status=[WorkerK8sStatus.storage_pending],
+                timeout_secs=1200,
+            )
+
+        self.assertFalse(result)
+        self.assertEqual(result.reason, "error_status")
+        mock_sleep.assert_not_called()
+
+
+class TestWaitForStatusMany(BaseTestCase):
+    @patch("hpecp.base_resource.time.sleep")
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_one_list_per_tick(self, mock_post, mock_sleep):
+
+        ticks = [
+            {1: "installing", 2: "installing", 3: "installing"},
+            {1: "storage_pending", 2: "installing", 3: "installing"},
+            {2: "storage_pending", 3: "installing"},
+            {3: "storage_pending"},
+        ]
+        done = []
+
+        with patch(
+            "requests.Session.get",
+            side_effect=[k8shost_list_response(t) for t in ticks],
+        ) as mock_get:
+            results = get_client().k8s_worker.wait_for_status_many(
+                {
+                    "/api/v2/worker/k8shost/3": [
+                        WorkerK8sStatus.storage_pending
+                    ],
+                    "/api/v2/worker/k8shost/2": [
+                        WorkerK8sStatus.storage_pending
+                    ],
+                    "/api/v2/worker/k8shost/1": [],
+                },
+                timeout_secs=60,
+                on_done=lambda id, result: done.append(id),
+            )
+
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertTrue(all(results.values()))
+        self.assertEqual(
+            list(results.keys()),
+            [
+                "/api/v2/worker/k8shost/3",
+                "/api/v2/worker/k8shost/2",
+                "/api/v2/worker/k8shost/1",
+            ],
+        )
+        self.assertEqual(results["/api/v2/worker/k8shost/1"].reason, "deleted")
+        self.assertEqual(
+            done,
+            [
+                "/api/v2/worker/k8shost/2",
+                "/api/v2/worker/k8shost/1",
+                "/api/v2/worker/k8shost/3",
+            ],
+        )
+
+    @patch("hpecp.base_resource.time.sleep")
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_fail_fast(self, mock_post, mock_sleep):
+
+        ids = ["/api/v2/worker/k8shost/1", "/api/v2/worker/k8shost/2"]
+
+        with patch(
+            "requests.Session.get",
+            return_value=k8shost_list_response(
+                {1: "storage_error", 2: "installing"}
+            ),
+        ):
+            results = get_client().k8s_worker.wait_for_status_many(
+                ids,
+                status=[WorkerK8sStatus.storage_pending],
+                timeout_secs=60,
+                fail_fast=True,
+            )
+
+        self.assertEqual(
+            [r.reason for r in results.values()], ["error_status", "cancelled"]
+        )
+        mock_sleep.assert_not_called()
+
+    @patch("hpecp.base_resource.time.sleep")
+    @patch("requests.Session.post", side_effect=BaseTestCase.httpPostHandlers)
+    def test_not_found_and_timeout(self, mock_post, mock_sleep):
+
+        with patch(
+            "requests.Session.get",
+            return_value=k8shost_list_response({1: "installing"}),
+        ):
+            results = get_client().k8s_worker.wait_for_status_many(
+                ["/api/v2/worker/k8shost/1", "/api/v2/worker/k8shost/9"],
+                status=[WorkerK8sStatus.ready],
+                timeout_secs=0,
+            )
+
+        self.assertEqual(
+            [r.reason for r in results.values()], ["timeout", "not_found"]
+        )